@@ -1,3 +1,5 @@
 from .cost_matrix import CostMatrix
 from .window import Window, NoWindow, Itakura, SakoeChiba, CRWindow
 from .dtw import dtw, DTWAlignment
+from .distance_matrix import dtw_distance_matrix
+from .search import dtw_search
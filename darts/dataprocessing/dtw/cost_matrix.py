@@ -45,6 +45,17 @@ class CostMatrix(ABC):
         """
         pass
 
+    @abstractmethod
+    def _cell_storage(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            A flat, writable view of the stored cells, and for each column i in 0 to n, the offset such that cell
+            (i,j) is stored at `offset + j`, if it is in the window.
+        """
+        pass
+
     @staticmethod
     def _from_window(window: Window):
         """
@@ -81,6 +92,9 @@ class DenseCostMatrix(np.ndarray, CostMatrix):
     def to_dense(self) -> np.ndarray:
         return self[1:, 1:]
 
+    def _cell_storage(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.view(np.ndarray).reshape(-1), np.arange(self.n + 1) * (self.m + 1)
+
     def __iter__(self):
         for n in range(1, self.n):
             for m in range(1, self.m):
@@ -136,6 +150,11 @@ class SparseCostMatrix(CostMatrix):
 
         return matrix
 
+    def _cell_storage(self) -> Tuple[np.ndarray, np.ndarray]:
+        offsets = np.frombuffer(self.offsets, dtype=np.int32)[: self.n + 1]
+        starts = np.frombuffer(self.column_ranges, dtype=np.int32)[0::2]
+        return np.frombuffer(self.dense, dtype=np.float32), offsets - starts.astype(int)
+
     # PERFORMANCE: hot functions, avoid calling functions/excessive checking
     def __getitem__(self, elem: Elem):
         i, j = elem
@@ -0,0 +1,305 @@
+import copy
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.ndimage import maximum_filter1d, minimum_filter1d
+
+from .window import Window, NoWindow, SakoeChiba
+from .dtw import _anti_diagonal_columns, _column_ranges
+from darts import TimeSeries
+from darts.logging import get_logger, raise_if_not, raise_if
+from darts.utils.utils import _parallel_apply
+
+logger = get_logger(__name__)
+
+# maximum number of values of the series gathered at once for a batch of pairs
+_MAX_BATCH_VALUES = 2 ** 16
+
+
+def dtw_distance_matrix(
+    series: Sequence[TimeSeries],
+    window: Window = NoWindow(),
+    max_distance: Optional[float] = None,
+    n_jobs: int = 1,
+    pairs_per_job: int = 50000,
+) -> np.ndarray:
+    """
+    Computes the Dynamic Time Warping distances between all the pairs of a collection of series, as returned by
+    `dtw(series[i], series[j], window).distance()` with the default distance (the absolute difference for
+    univariate series, and the sum of the absolute differences of the components for multivariate series).
+
+    Only the distances are computed, without building the cost matrices: the pairs of series of the same lengths are
+    processed together, one anti-diagonal of their cost matrices at a time, so that the memory used by a pair only
+    grows with the length of its series.
+
+    If `max_distance` is set, the distances greater than `max_distance` are not computed, and set to `np.inf`. This
+    allows to skip most of the computations when only the close pairs are of interest (to deduplicate series, or
+    to build a neighbourhood graph):
+
+    * the pairs whose LB_Kim lower bound (the distance between their first elements plus the distance between their
+      last elements) exceeds `max_distance` are pruned,
+    * then, without window or with a `SakoeChiba` window and series of the same lengths, the pairs whose LB_Keogh
+      lower bound (the distance between the first series and the envelope of the second series) exceeds
+      `max_distance` are pruned,
+    * and the computation of the remaining pairs is abandoned as soon as all the warping paths cost more than
+      `max_distance`.
+
+    Parameters
+    ----------
+    series
+        The `TimeSeries` to compare, all with the same number of components, and without nan values.
+    window
+        Used to constrain the search for the optimal alignments: see SakoeChiba and Itakura.
+        Default considers all possible alignments.
+    max_distance
+        Optionally, the distance above which the distances are not computed and set to `np.inf`.
+    n_jobs
+        The number of jobs to run in parallel, in separate processes. Defaults to `1` (sequential). Setting the
+        parameter to `-1` means using all the available processors.
+    pairs_per_job
+        The number of pairs of series compared by each parallel job.
+
+    Returns
+    -------
+    np.ndarray
+        The condensed distance matrix, of shape `(n * (n - 1) / 2,)` where `n = len(series)`, as returned by
+        `scipy.spatial.distance.pdist()`: the distance between `series[i]` and `series[j]` for `i < j` is at index
+        `n * i - i * (i + 1) / 2 + j - i - 1`. It can be expanded into a square matrix with
+        `scipy.spatial.distance.squareform()`.
+    """
+    raise_if_not(
+        len({ts.n_components for ts in series}) <= 1,
+        "Expected all the series to have the same number of components.",
+        logger,
+    )
+    raise_if_not(pairs_per_job > 0, "`pairs_per_job` must be positive.", logger)
+    n_series = len(series)
+    if n_series < 2:
+        return np.empty(0)
+
+    values = np.concatenate(
+        [ts.values(copy=False).astype(np.float64, copy=False) for ts in series]
+    )
+    raise_if(
+        np.isnan(values).any(),
+        "Dynamic Time Warping does not support nan values. "
+        "You can use the module darts.utils.missing_values to fill them, "
+        "before computing the distances.",
+        logger,
+    )
+    lengths = np.array([len(ts) for ts in series], dtype=int)
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+
+    envelopes = None
+    if max_distance is not None:
+        envelopes = _envelopes(values, offsets, window)
+
+    # split the rows of the condensed matrix (the series i < n - 1) into jobs of about `pairs_per_job` pairs
+    row_ends = np.cumsum(np.arange(n_series - 1, 0, -1))
+    splits = np.searchsorted(
+        row_ends, np.arange(pairs_per_job, row_ends[-1], pairs_per_job)
+    )
+    rows = np.unique(np.concatenate([[0], splits + 1, [n_series - 1]])).tolist()
+    jobs = list(zip(rows[:-1], rows[1:]))
+
+    distances = _parallel_apply(
+        jobs,
+        _rows_distances,
+        n_jobs,
+        (values, offsets, window, max_distance, envelopes),
+        {},
+    )
+    return np.concatenate(distances)
+
+
+def _envelopes(
+    values: np.ndarray, offsets: np.ndarray, window: Window
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Returns the lower and upper envelopes of the series for LB_Keogh, as arrays of the same shape as `values`, or
+    None if LB_Keogh does not apply to the window.
+    Without window, the envelope of a series is its minimum and maximum. With a Sakoe-Chiba window, it is the
+    minimum and maximum within `window_size` time steps.
+    """
+    if isinstance(window, NoWindow):
+        lengths = np.diff(offsets)
+        lower = np.repeat(np.minimum.reduceat(values, offsets[:-1]), lengths, 0)
+        upper = np.repeat(np.maximum.reduceat(values, offsets[:-1]), lengths, 0)
+        return lower, upper
+    if isinstance(window, SakoeChiba):
+        size = 2 * window.window_size + 1
+        lower, upper = np.empty_like(values), np.empty_like(values)
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            minimum_filter1d(values[start:end], size, 0, lower[start:end], "nearest")
+            maximum_filter1d(values[start:end], size, 0, upper[start:end], "nearest")
+        return lower, upper
+    return None
+
+
+def _rows_distances(
+    first_row: int,
+    end_row: int,
+    values: np.ndarray,
+    offsets: np.ndarray,
+    window: Window,
+    max_distance: Optional[float],
+    envelopes: Optional[Tuple[np.ndarray, np.ndarray]],
+) -> np.ndarray:
+    """
+    Returns the distances of the rows `first_row` to `end_row` (exclusive) of the condensed distance matrix; between
+    the series i of these rows and all the series j > i.
+    """
+    n_series = len(offsets) - 1
+    lengths = np.diff(offsets)
+    row_lengths = n_series - 1 - np.arange(first_row, end_row)
+    first = np.repeat(np.arange(first_row, end_row), row_lengths)
+    second = (
+        np.arange(len(first))
+        - np.repeat(np.cumsum(row_lengths) - row_lengths, row_lengths)
+        + first
+        + 1
+    )
+    distances = np.full(len(first), np.inf)
+
+    remaining = np.arange(len(first))
+    if max_distance is not None:
+        # LB_Kim: the first and last elements of the series are always matched together
+        first_values, last_values = values[offsets[:-1]], values[offsets[1:] - 1]
+        bound = np.abs(first_values[first] - first_values[second]).sum(axis=1)
+        both_ends = (lengths[first] > 1) | (lengths[second] > 1)
+        bound[both_ends] += np.abs(
+            last_values[first[both_ends]] - last_values[second[both_ends]]
+        ).sum(axis=1)
+        remaining = remaining[bound <= max_distance]
+
+    # the pairs of series of the same lengths are compared together
+    pair_lengths = np.stack([lengths[first[remaining]], lengths[second[remaining]]])
+    keys, groups = np.unique(pair_lengths, axis=1, return_inverse=True)
+    for group, (n, m) in enumerate(keys.T.tolist()):
+        pairs = remaining[groups == group]
+
+        if envelopes is not None and (n == m or isinstance(window, NoWindow)):
+            # LB_Keogh: each element of the first series is matched to an element within the envelope of the second
+            x = _gather(values, offsets, first[pairs], n)
+            lower = _gather(envelopes[0], offsets, second[pairs], m)
+            upper = _gather(envelopes[1], offsets, second[pairs], m)
+            if m != n:
+                lower, upper = lower[:, :1], upper[:, :1]
+            bound = (np.maximum(x - upper, 0.0) + np.maximum(lower - x, 0.0)).sum(
+                axis=(1, 2)
+            )
+            pairs = pairs[bound <= max_distance]
+
+        sized_window = copy.deepcopy(window)
+        sized_window.init_size(n, m)
+        starts, ends = _column_ranges(sized_window)
+        anti_diagonals = _anti_diagonal_columns(starts, ends, m)
+
+        batch_size = max(1, _MAX_BATCH_VALUES // ((n + m) * values.shape[1]))
+        for batch in range(0, len(pairs), batch_size):
+            batch_pairs = pairs[batch : batch + batch_size]
+            distances[batch_pairs] = _batch_distances(
+                _gather(values, offsets, first[batch_pairs], n),
+                _gather(values, offsets, second[batch_pairs], m),
+                starts,
+                ends,
+                anti_diagonals,
+                all_active=isinstance(window, NoWindow),
+                max_distance=max_distance,
+            )
+    return distances
+
+
+def _gather(
+    values: np.ndarray, offsets: np.ndarray, indices: np.ndarray, length: int
+) -> np.ndarray:
+    """Returns the values of the series `indices`, all of length `length`, as an array (series, time, component)."""
+    return values[offsets[indices][:, np.newaxis] + np.arange(length)]
+
+
+def _batch_distances(
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    anti_diagonals: Tuple[List[int], List[int], List[int]],
+    all_active: bool,
+    max_distance: Optional[float],
+    remaining_bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> np.ndarray:
+    """
+    Returns the DTW distances between the pairs of series `x[p]` and `y[p]`, of shapes (batch, n, component) and
+    (batch, m, component).
+    The cost matrices of the pairs are computed together, one anti-diagonal at a time, keeping only their last three
+    anti-diagonals. Every warping path goes through one of any two consecutive anti-diagonals, so the pairs whose two
+    last anti-diagonals only hold costs greater than `max_distance` are abandoned.
+    `remaining_bounds` optionally holds lower bounds of the cost of the end of the warping paths, after each column
+    and after each row, of shapes (batch, n + 1) and (batch, m + 1), which are added to the costs to abandon the
+    pairs earlier.
+    """
+    batch, n = x.shape[:2]
+    m = y.shape[1]
+    univariate = x.shape[2] == 1
+    if univariate:
+        x, y = x[:, :, 0], y[:, :, 0]
+    columns = np.arange(n + 1)
+    distances = np.full(batch, np.inf)
+    pairs = np.arange(batch)
+
+    buffers = [np.full((batch, n + 1), np.inf) for _ in range(3)]
+    buffers[0][:, 0] = 0
+    filled = [(0, 1), (0, 0), (0, 0)]
+    previous_min = np.zeros(batch)
+
+    for k, first, last in zip(*anti_diagonals):
+        current = buffers[k % 3]
+        previous = buffers[(k - 1) % 3]
+        before_previous = buffers[(k - 2) % 3]
+        current[:, slice(*filled[k % 3])] = np.inf
+        if first > last:
+            # no warping path goes through this anti-diagonal
+            return distances
+        end = last + 1
+
+        min_cost_prev = np.minimum(
+            np.minimum(previous[:, first - 1 : last], previous[:, first:end]),
+            before_previous[:, first - 1 : last],
+        )
+        cost = np.abs(x[:, first - 1 : last] - y[:, k - end : k - first][:, ::-1])
+        costs = (cost if univariate else cost.sum(axis=2)) + min_cost_prev
+        if not all_active:
+            rows = k - columns[first:end]
+            active = (rows >= starts[first:end]) & (rows < ends[first:end])
+            costs[:, ~active] = np.inf
+        current[:, first:end] = costs
+        filled[k % 3] = (first, end)
+
+        if max_distance is not None:
+            bounds = costs
+            if remaining_bounds is not None:
+                column_bounds, row_bounds = remaining_bounds
+                bounds = costs + np.maximum(
+                    column_bounds[:, first:end],
+                    row_bounds[:, k - last : k - first + 1][:, ::-1],
+                )
+            diagonal_min = bounds.min(axis=1)
+            alive = np.minimum(diagonal_min, previous_min) <= max_distance
+            previous_min = diagonal_min
+            n_alive = alive.sum()
+            if n_alive == 0:
+                return distances
+            if n_alive < 0.75 * len(pairs):
+                pairs, x, y, previous_min = (
+                    pairs[alive],
+                    x[alive],
+                    y[alive],
+                    previous_min[alive],
+                )
+                buffers = [buffer[alive] for buffer in buffers]
+                if remaining_bounds is not None:
+                    remaining_bounds = tuple(bound[alive] for bound in remaining_bounds)
+
+    distances[pairs] = buffers[(n + m) % 3][:, n]
+    if max_distance is not None:
+        distances[distances > max_distance] = np.inf
+    return distances
@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Callable, Union
+from typing import Callable, List, Optional, Tuple, Union
 import copy
 
 from .window import Window, CRWindow, NoWindow
@@ -23,6 +23,11 @@ def _dtw_cost_matrix(
     dtw.fill(np.inf)
     dtw[0, 0] = 0
 
+    pairwise_dist = _pairwise_distance(dist, x, y)
+    if pairwise_dist is not None and isinstance(window, (NoWindow, CRWindow)):
+        _fill_anti_diagonals(dtw, x, y, pairwise_dist, window)
+        return dtw
+
     for i, j in window:
         cost = dist(x[i - 1], y[j - 1])
         min_cost_prev = min(dtw[i - 1, j], dtw[i, j - 1], dtw[i - 1, j - 1])
@@ -31,6 +36,116 @@ def _dtw_cost_matrix(
     return dtw
 
 
+def _pairwise_distance(
+    dist: DistanceFunc, x: np.ndarray, y: np.ndarray
+) -> Optional[Callable[[np.ndarray, np.ndarray], np.ndarray]]:
+    """
+    Returns the vectorized counterpart of the built-in distance `dist`, computing the distances between the
+    elements of two arrays of values, or None for custom distances.
+    """
+    if x.ndim != y.ndim:
+        return None
+    if dist is default_distance_uni and x.ndim == 1:
+        return lambda x_values, y_values: np.abs(x_values - y_values)
+    if dist is default_distance_multi:
+        if x.ndim == 1:
+            return lambda x_values, y_values: np.abs(x_values - y_values)
+        return lambda x_values, y_values: np.sum(np.abs(x_values - y_values), axis=1)
+    return None
+
+
+def _column_ranges(window: Union[Window, CRWindow]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the start and end (exclusive) row of the active cells in each column 0 to n of the window.
+    """
+    if isinstance(window, CRWindow):
+        ranges = np.frombuffer(window.column_ranges, dtype=np.int32).astype(int)
+        return ranges[0::2], ranges[1::2]
+    starts = np.ones(window.n + 1, dtype=int)
+    ends = np.full(window.n + 1, window.m + 1)
+    starts[0], ends[0] = 0, 1
+    return starts, ends
+
+
+def _anti_diagonal_columns(
+    starts: np.ndarray, ends: np.ndarray, m: int
+) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Returns the anti-diagonals k >= 2 of a window with `m` rows, whose columns 0 to n have the active cells `starts`
+    to `ends` (exclusive), and the first and last columns with an active cell on each of them; the first columns
+    whose window ends after row k - i, and the last columns whose window starts before row k - i.
+    """
+    n = len(starts) - 1
+    diagonals = np.arange(2, n + m + 1)
+    columns = np.arange(n + 1)
+    first_columns = np.maximum(
+        np.searchsorted(np.maximum.accumulate(ends + columns), diagonals, "right"),
+        np.maximum(diagonals - m, 1),
+    )
+    last_columns = np.minimum(
+        np.searchsorted(
+            np.minimum.accumulate((starts + columns)[::-1])[::-1], diagonals, "right"
+        )
+        - 1,
+        np.minimum(diagonals - 1, n),
+    )
+    return diagonals.tolist(), first_columns.tolist(), last_columns.tolist()
+
+
+def _fill_anti_diagonals(
+    dtw: CostMatrix,
+    x: np.ndarray,
+    y: np.ndarray,
+    pairwise_dist: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    window: Union[Window, CRWindow],
+):
+    """
+    Fills the cost matrix one anti-diagonal (i + j = k) at a time. The cells of an anti-diagonal only depend on the
+    two previous anti-diagonals, so they are all computed by a few array operations, which compute the same
+    floating point operations as the cell by cell recursion, and fill the matrix with bit-identical costs.
+    """
+    n, m = window.n, window.m
+    cells, column_offsets = dtw._cell_storage()
+    starts, ends = _column_ranges(window)
+    all_active = isinstance(window, NoWindow)
+    diagonals, first_columns, last_columns = _anti_diagonal_columns(starts, ends, m)
+    columns = np.arange(n + 1)
+
+    # the costs of the three last anti-diagonals, indexed by column, and their filled column ranges
+    buffers = [np.full(n + 1, np.inf, dtype=cells.dtype) for _ in range(3)]
+    buffers[0][0] = 0
+    filled = [(0, 1), (0, 0), (0, 0)]
+
+    for k, first, last in zip(diagonals, first_columns, last_columns):
+        current = buffers[k % 3]
+        previous = buffers[(k - 1) % 3]
+        before_previous = buffers[(k - 2) % 3]
+        current[slice(*filled[k % 3])] = np.inf
+        if first > last:
+            filled[k % 3] = (0, 0)
+            continue
+        end = last + 1
+
+        min_cost_prev = np.minimum(
+            np.minimum(previous[first - 1 : last], previous[first:end]),
+            before_previous[first - 1 : last],
+        )
+        # columns i of the anti-diagonal match x[i - 1] with y[k - i - 1]
+        cost = pairwise_dist(x[first - 1 : last], y[k - end : k - first][::-1])
+        costs = np.add(cost, min_cost_prev, dtype=np.float64)
+
+        rows = k - columns[first:end]
+        cell_indices = column_offsets[first:end] + rows
+        if all_active:
+            current[first:end] = costs
+            cells[cell_indices] = costs
+        else:
+            active = (rows >= starts[first:end]) & (rows < ends[first:end])
+            current[first:end] = np.where(active, costs, np.inf)
+            cells[cell_indices[active]] = costs[active]
+        filled[k % 3] = (first, end)
+
+
 def _dtw_path(dtw: CostMatrix) -> np.ndarray:
     i = dtw.n
     j = dtw.m
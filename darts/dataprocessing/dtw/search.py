@@ -0,0 +1,287 @@
+import copy
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.ndimage import maximum_filter1d, minimum_filter1d
+
+from .window import Window, NoWindow, SakoeChiba
+from .dtw import _anti_diagonal_columns, _column_ranges
+from .distance_matrix import _batch_distances, _MAX_BATCH_VALUES
+from darts import TimeSeries
+from darts.logging import get_logger, raise_if_not, raise_if
+
+logger = get_logger(__name__)
+
+# number of candidates whose DTW distances are computed together, between two updates of the best-so-far; the
+# batches grow from the minimum size (while the best-so-far improves quickly) to the maximum size
+_MIN_DTW_BATCH_SIZE = 16
+_MAX_DTW_BATCH_SIZE = 1024
+
+
+def dtw_search(
+    series: TimeSeries,
+    query: TimeSeries,
+    k: int = 1,
+    window: Window = NoWindow(),
+    normalize: bool = True,
+    exclusion_zone: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the `k` subsequences of `series` which are the closest to `query` according to Dynamic Time Warping, with
+    the techniques of the UCR suite (Rakthanmanon et al., 2012) [1]_.
+
+    All the subsequences of the length of the query are candidates. Their DTW distances to the query are only
+    computed if they cannot be ruled out by cheaper lower bounds, compared to the `k`-th best distance found so far:
+
+    * the LB_Kim bound (the distances between the first elements, and between the last elements),
+    * the LB_Keogh bound of the candidate against the envelope of the query, summed starting from the elements of
+      the query which are the farthest from its mean, which are the most likely to rule out the candidate early,
+    * the LB_Keogh bound of the query against the envelope of the candidate,
+    * and the DTW distances of the remaining candidates are abandoned as soon as their partial costs, plus the
+      cumulative LB_Keogh bound of their remaining elements, exceed the best-so-far.
+
+    The distances are the DTW distances computed by `dtw()` with the same window, between the query and the
+    candidates, after z-normalizing both of them if `normalize=True`. The means and standard deviations of all the
+    candidates are computed in one pass from cumulative sums.
+
+    Parameters
+    ----------
+    series
+        The univariate `TimeSeries` to search, without nan values.
+    query
+        The univariate `TimeSeries` pattern to look for, no longer than `series`.
+    k
+        The number of subsequences to return.
+    window
+        Either `NoWindow()`, or a `SakoeChiba` window constraining the alignments of the query with the
+        subsequences. Narrow windows tighten the LB_Keogh bounds, and make the search much faster.
+    normalize
+        Whether to compare the z-normalized query and subsequences (with a mean of 0 and a standard deviation of 1),
+        rather than their values.
+    exclusion_zone
+        The subsequences returned start more than `exclusion_zone` time steps apart, so that the overlapping
+        subsequences of a single match are not all returned. By default, half of the length of the query.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The start positions (integer offsets in `series`) of the best subsequences, and their DTW distances to the
+        query, sorted by increasing distance. The best subsequence is `series[start : start + len(query)]`.
+        Fewer than `k` subsequences are returned if the series is too short to hold `k` subsequences
+        `exclusion_zone` time steps apart.
+
+    References
+    ----------
+    .. [1] T. Rakthanmanon et al., "Searching and Mining Trillions of Time Series Subsequences under Dynamic Time
+           Warping", KDD 2012
+    """
+    raise_if_not(
+        series.is_univariate and query.is_univariate,
+        "DTW subsequence search expects univariate series and queries.",
+        logger,
+    )
+    values = series.univariate_values(copy=False).astype(np.float64, copy=False)
+    query_values = query.univariate_values(copy=False).astype(np.float64)
+    raise_if(
+        np.isnan(values).any() or np.isnan(query_values).any(),
+        "Dynamic Time Warping does not support nan values. "
+        "You can use the module darts.utils.missing_values to fill them, "
+        "before searching the series.",
+        logger,
+    )
+    length = len(query_values)
+    n_candidates = len(values) - length + 1
+    raise_if(n_candidates < 1, "The query must not be longer than the series.", logger)
+    raise_if_not(k >= 1, "`k` must be positive.", logger)
+    raise_if_not(
+        isinstance(window, (NoWindow, SakoeChiba)),
+        "DTW subsequence search only supports `NoWindow` and `SakoeChiba` windows.",
+        logger,
+    )
+    exclusion_zone = length // 2 if exclusion_zone is None else exclusion_zone
+    raise_if(exclusion_zone < 0, "`exclusion_zone` must not be negative.", logger)
+
+    sized_window = copy.deepcopy(window)
+    sized_window.init_size(length, length)
+    starts, ends = _column_ranges(sized_window)
+    anti_diagonals = _anti_diagonal_columns(starts, ends, length)
+    radius = window.window_size if isinstance(window, SakoeChiba) else length
+
+    if normalize:
+        query_values = _z_normalize(query_values)
+        means, stds = _moving_means_and_stds(values, length)
+    else:
+        means, stds = np.zeros(n_candidates), np.ones(n_candidates)
+
+    # the envelopes of the query, and of the whole series (which contain the envelopes of the candidates)
+    size = 2 * radius + 1
+    query_lower = minimum_filter1d(query_values, size, mode="nearest")
+    query_upper = maximum_filter1d(query_values, size, mode="nearest")
+    windows = sliding_window_view(values, length)
+    lower_windows = sliding_window_view(
+        minimum_filter1d(values, size, mode="nearest"), length
+    )
+    upper_windows = sliding_window_view(
+        maximum_filter1d(values, size, mode="nearest"), length
+    )
+
+    # LB_Keogh is summed over blocks of elements of the query, from the farthest from its mean
+    order = np.argsort(-np.abs(query_values - query_values.mean()), kind="stable")
+    blocks = [
+        order[start:end]
+        for start, end in zip(
+            [0, length // 8, length // 4, length // 2],
+            [length // 8, length // 4, length // 2, length],
+        )
+        if end > start
+    ]
+
+    match_starts, match_distances = np.empty(0, dtype=int), np.empty(0)
+    best_so_far = np.inf
+    chunk_size = max(1, _MAX_BATCH_VALUES // length)
+    for chunk_start in range(0, n_candidates, chunk_size):
+        candidates = np.arange(chunk_start, min(chunk_start + chunk_size, n_candidates))
+
+        # LB_Kim
+        bound = np.abs(
+            (values[candidates] - means[candidates]) / stds[candidates]
+            - query_values[0]
+        )
+        if length > 1:
+            bound += np.abs(
+                (values[candidates + length - 1] - means[candidates]) / stds[candidates]
+                - query_values[-1]
+            )
+        candidates = candidates[bound <= best_so_far]
+
+        # LB_Keogh of the candidates against the envelope of the query, abandoned block by block
+        column_bounds = np.zeros((len(candidates), length + 1))
+        bound = np.zeros(len(candidates))
+        for block in blocks:
+            normalized = (
+                windows[candidates[:, np.newaxis], block]
+                - means[candidates, np.newaxis]
+            ) / stds[candidates, np.newaxis]
+            contributions = np.maximum(normalized - query_upper[block], 0.0)
+            contributions += np.maximum(query_lower[block] - normalized, 0.0)
+            column_bounds[:, block] = contributions
+            bound += contributions.sum(axis=1)
+            remaining = bound <= best_so_far
+            candidates, column_bounds, bound = (
+                candidates[remaining],
+                column_bounds[remaining],
+                bound[remaining],
+            )
+
+        # LB_Keogh of the query against the envelope of the candidates
+        candidate_means = means[candidates, np.newaxis]
+        candidate_stds = stds[candidates, np.newaxis]
+        row_bounds = np.zeros((len(candidates), length + 1))
+        row_bounds[:, :-1] = np.maximum(
+            query_values
+            - (upper_windows[candidates] - candidate_means) / candidate_stds,
+            0.0,
+        )
+        row_bounds[:, :-1] += np.maximum(
+            (lower_windows[candidates] - candidate_means) / candidate_stds
+            - query_values,
+            0.0,
+        )
+        bound = np.maximum(bound, row_bounds.sum(axis=1))
+
+        # the cost of the end of the warping paths is bounded by the contributions of their remaining elements
+        by_bound = np.argsort(bound, kind="stable")
+        candidates, bound = candidates[by_bound], bound[by_bound]
+        remaining_bounds = (
+            np.cumsum(column_bounds[by_bound][:, ::-1], axis=1)[:, ::-1],
+            np.cumsum(row_bounds[by_bound][:, ::-1], axis=1)[:, ::-1],
+        )
+
+        # DTW distances, from the candidates with the smallest lower bounds
+        batch, batch_size = 0, _MIN_DTW_BATCH_SIZE
+        while batch < len(candidates):
+            batch_slice = slice(batch, batch + batch_size)
+            batch += batch_size
+            batch_size = min(2 * batch_size, _MAX_DTW_BATCH_SIZE)
+            remaining = bound[batch_slice] <= best_so_far
+            if not remaining.any():
+                break
+            batch_candidates = candidates[batch_slice][remaining]
+            normalized = (
+                windows[batch_candidates] - means[batch_candidates, np.newaxis]
+            ) / stds[batch_candidates, np.newaxis]
+            distances = _batch_distances(
+                normalized[:, :, np.newaxis],
+                np.broadcast_to(
+                    query_values[:, np.newaxis], (len(batch_candidates), length, 1)
+                ),
+                starts,
+                ends,
+                anti_diagonals,
+                all_active=isinstance(window, NoWindow),
+                max_distance=best_so_far,
+                remaining_bounds=tuple(
+                    bounds[batch_slice][remaining] for bounds in remaining_bounds
+                ),
+            )
+
+            found = np.isfinite(distances)
+            match_starts = np.concatenate([match_starts, batch_candidates[found]])
+            match_distances = np.concatenate([match_distances, distances[found]])
+            # with k matches more than 2 * exclusion_zone apart, the k best matches more than exclusion_zone
+            # apart are at least as close to the query (each of them excludes at most one of the k matches)
+            best = _best_matches(match_starts, match_distances, k, 2 * exclusion_zone)
+            if len(best) == k:
+                best_so_far = match_distances[best[-1]]
+                close = match_distances <= best_so_far
+                match_starts, match_distances = (
+                    match_starts[close],
+                    match_distances[close],
+                )
+
+    best = _best_matches(match_starts, match_distances, k, exclusion_zone)
+    return match_starts[best], match_distances[best]
+
+
+def _z_normalize(values: np.ndarray) -> np.ndarray:
+    """Returns the values with a mean of 0 and a standard deviation of 1, or only centered if they are constant."""
+    std = values.std()
+    return (values - values.mean()) / (std if std > 0 else 1.0)
+
+
+def _moving_means_and_stds(
+    values: np.ndarray, length: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the means and standard deviations of all the subsequences of `values` of length `length`, computed from
+    the cumulative sums of the values and of their squares. The standard deviations of the constant subsequences
+    are set to 1.
+    """
+    # centering the values limits the cancellation errors of the differences of cumulative sums
+    offset = values.mean()
+    centered = values - offset
+    sums = np.concatenate([[0.0], np.cumsum(centered)])
+    squares = np.concatenate([[0.0], np.cumsum(centered ** 2)])
+    means = (sums[length:] - sums[:-length]) / length
+    variances = (squares[length:] - squares[:-length]) / length - means ** 2
+    stds = np.sqrt(np.maximum(variances, 0.0))
+    scale = np.abs(centered).max()
+    stds[stds <= 1e-8 * scale] = 1.0
+    return means + offset, stds
+
+
+def _best_matches(
+    starts: np.ndarray, distances: np.ndarray, k: int, exclusion_zone: int
+) -> np.ndarray:
+    """
+    Returns the indices of up to `k` matches, picked greedily by increasing distance (then start), skipping the
+    matches which start `exclusion_zone` time steps or less from a picked match.
+    """
+    picked = []
+    for index in np.lexsort((starts, distances)).tolist():
+        if all(abs(starts[index] - starts[other]) > exclusion_zone for other in picked):
+            picked.append(index)
+            if len(picked) == k:
+                break
+    return np.array(picked, dtype=int)
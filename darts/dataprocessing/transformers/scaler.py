@@ -3,18 +3,22 @@ Scaler
 ------
 """
 
-from typing import Sequence, Iterator, Any, Tuple
+from typing import Sequence, Iterator, Any, Tuple, Union, List, Optional
+
+import numpy as np
 from darts.dataprocessing.transformers import (
     InvertibleDataTransformer,
     FittableDataTransformer,
 )
 from darts.timeseries import TimeSeries
-from darts.logging import get_logger, raise_log
+from darts.logging import get_logger, raise_log, raise_if_not
 from sklearn.preprocessing import MinMaxScaler
 from copy import deepcopy
 
 logger = get_logger(__name__)
 
+VECTORIZED_SCALERS = ["minmax", "standard", "robust"]
+
 
 class Scaler(InvertibleDataTransformer, FittableDataTransformer):
     def __init__(
@@ -23,7 +27,8 @@ class Scaler(InvertibleDataTransformer, FittableDataTransformer):
         """Generic wrapper class for using scalers on time series.
 
         The underlying `scaler` has to implement the ``fit()``, ``transform()`` and
-        ``inverse_transform()`` methods (typically from scikit-learn).
+        ``inverse_transform()`` methods (typically from scikit-learn), or be the name of one of the scalings
+        vectorized by darts.
 
         When the scaler is applied on multivariate series, the scaling is done per-component.
         When the series are stochastic, the scaling is done across all samples (for each given component).
@@ -37,6 +42,14 @@ class Scaler(InvertibleDataTransformer, FittableDataTransformer):
             ``transform()`` and ``inverse_transform()`` methods.
             Default: :class:`sklearn.preprocessing.MinMaxScaler(feature_range=(0, 1))`; this will scale all
             the values of a time series between 0 and 1.
+
+            Alternatively, one of the strings ``"minmax"``, ``"standard"`` or ``"robust"``, for the scalings of
+            ``MinMaxScaler()``, ``StandardScaler()`` and ``RobustScaler()`` with their default parameters,
+            computed by darts for all the series at once: the values of all the series are fitted, transformed and
+            inverse-transformed in bulk, and the fitted parameters of all the series are kept in two arrays
+            (``(centers, scales)``, of shape (n_series, n_components), the values being scaled as
+            ``(values - center) / scale``). This is much faster for large numbers of series, which must then all
+            have the same number of components. The nan values are ignored when fitting, as by scikit-learn.
         name
             A specific name for the scaler
         n_jobs
@@ -44,14 +57,15 @@ class Scaler(InvertibleDataTransformer, FittableDataTransformer):
             passed as input to a method, parallelising operations regarding different ``TimeSeries``. Defaults to `1`
             (sequential). Setting the parameter to `-1` means using all the available processors.
             Note: for a small amount of data, the parallelisation overhead could end up increasing the total
-            required amount of time.
+            required amount of time. Not used by the vectorized scalings.
         verbose
             Optionally, whether to print operations progress
 
         Notes
         -----
         In case the :class:`Scaler` is applied to multiple ``TimeSeries`` objects, a deep-copy of the
-        chosen scaler will be instantiated, fitted, and stored, for each ``TimeSeries``.
+        chosen scaler will be instantiated, fitted, and stored, for each ``TimeSeries`` (except for the vectorized
+        scalings).
 
         Examples
         --------
@@ -73,7 +87,13 @@ class Scaler(InvertibleDataTransformer, FittableDataTransformer):
         if scaler is None:
             scaler = MinMaxScaler(feature_range=(0, 1))
 
-        if (
+        if isinstance(scaler, str):
+            raise_if_not(
+                scaler in VECTORIZED_SCALERS,
+                f"Unknown scaling `{scaler}`; the vectorized scalings are {VECTORIZED_SCALERS}.",
+                logger,
+            )
+        elif (
             not callable(getattr(scaler, "fit", None))
             or not callable(getattr(scaler, "transform", None))
             or not callable(getattr(scaler, "inverse_transform", None))
@@ -156,3 +176,195 @@ class Scaler(InvertibleDataTransformer, FittableDataTransformer):
     ) -> Iterator[Tuple[TimeSeries, Any]]:
         # the same self._fitted_params will be used also for the 'ts_inverse_transform()'
         return zip(series, self._fitted_params)
+
+    def fit(
+        self, series: Union[TimeSeries, Sequence[TimeSeries]], *args, **kwargs
+    ) -> "Scaler":
+        if not isinstance(self.transformer, str):
+            return super().fit(series, *args, **kwargs)
+
+        self._fit_called = True
+        data = [series] if isinstance(series, TimeSeries) else series
+        self._fitted_params = _fit_scaling(
+            self.transformer, data, kwargs.get("component_mask", None)
+        )
+        return self
+
+    def transform(
+        self, series: Union[TimeSeries, Sequence[TimeSeries]], *args, **kwargs
+    ) -> Union[TimeSeries, List[TimeSeries]]:
+        if not isinstance(self.transformer, str):
+            return super().transform(series, *args, **kwargs)
+        return self._apply_scaling(series, kwargs.get("component_mask", None), False)
+
+    def inverse_transform(
+        self, series: Union[TimeSeries, Sequence[TimeSeries]], *args, **kwargs
+    ) -> Union[TimeSeries, List[TimeSeries]]:
+        if not isinstance(self.transformer, str):
+            return super().inverse_transform(series, *args, **kwargs)
+        return self._apply_scaling(series, kwargs.get("component_mask", None), True)
+
+    def _apply_scaling(
+        self,
+        series: Union[TimeSeries, Sequence[TimeSeries]],
+        component_mask: Optional[np.ndarray],
+        inverse: bool,
+    ) -> Union[TimeSeries, List[TimeSeries]]:
+        """Scales, or unscales, all the series at once with the vectorized fitted parameters."""
+        raise_if_not(
+            self._fit_called,
+            "fit() must have been called before transform() and inverse_transform()",
+            logger,
+        )
+        data = [series] if isinstance(series, TimeSeries) else series
+        centers, scales = self._fitted_params
+        raise_if_not(
+            len(data) <= len(centers),
+            f"The scaler was fitted on {len(centers)} series, and cannot transform {len(data)} series.",
+            logger,
+        )
+
+        transformed = [None] * len(data)
+        for indices, values, offsets in _panel_groups(data):
+            masked = _masked_values(values, component_mask, centers.shape[1])
+            # the parameters of the series, repeated over their time steps
+            repeats = np.diff(offsets)
+            center = np.repeat(centers[indices], repeats, axis=0)[:, :, np.newaxis]
+            scale = np.repeat(scales[indices], repeats, axis=0)[:, :, np.newaxis]
+            scaled = masked * scale + center if inverse else (masked - center) / scale
+            if component_mask is not None:
+                values = values.copy()
+                values[:, component_mask] = scaled
+                scaled = values
+
+            for index, start, end in zip(indices, offsets[:-1], offsets[1:]):
+                ts = data[index]
+                transformed[index] = ts.with_values(
+                    scaled[start:end].astype(ts.dtype, copy=False)
+                )
+        return transformed[0] if isinstance(series, TimeSeries) else transformed
+
+
+def _panel_groups(
+    series: Sequence[TimeSeries],
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Yields the indices of the series with the same number of samples, the concatenation of their values along the
+    time axis, and the offsets of each series in this array.
+    """
+    n_samples = np.array([ts.n_samples for ts in series])
+    for samples in np.unique(n_samples):
+        indices = np.flatnonzero(n_samples == samples)
+        values = [series[index].all_values(copy=False) for index in indices]
+        raise_if_not(
+            len({len(value[0]) for value in values}) == 1,
+            "The vectorized scalings expect all the series to have the same number of components.",
+            logger,
+        )
+        offsets = np.concatenate([[0], np.cumsum([len(value) for value in values])])
+        yield indices, np.concatenate(values).astype(np.float64, copy=False), offsets
+
+
+def _masked_values(
+    values: np.ndarray, component_mask: Optional[np.ndarray], n_components: int
+) -> np.ndarray:
+    """Returns the components of `values` selected by `component_mask`, expecting `n_components` of them."""
+    if component_mask is not None:
+        raise_if_not(
+            isinstance(component_mask, np.ndarray) and component_mask.dtype == bool,
+            "`component_mask` must be a boolean np.ndarray`",
+            logger,
+        )
+        raise_if_not(
+            values.shape[1] == len(component_mask),
+            "mismatch between number of components in `series` and length of `component_mask`",
+            logger,
+        )
+        values = values[:, component_mask]
+    raise_if_not(
+        values.shape[1] == n_components,
+        f"The scaler was fitted on {n_components} components, but received {values.shape[1]} components.",
+        logger,
+    )
+    return values
+
+
+def _fit_scaling(
+    method: str, series: Sequence[TimeSeries], component_mask: Optional[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the centers and scales of all the series and components, of shape (n_series, n_components), with which
+    their values are scaled as `(values - center) / scale`. Each component of each series is fitted on all its
+    values (time steps and samples), ignoring the nan values.
+    """
+    n_components = (
+        series[0].n_components if component_mask is None else component_mask.sum()
+    )
+    centers = np.empty((len(series), n_components))
+    scales = np.empty((len(series), n_components))
+
+    for indices, values, offsets in _panel_groups(series):
+        values = _masked_values(values, component_mask, n_components)
+        starts, counts = offsets[:-1], np.diff(offsets)
+
+        if method == "minmax":
+            minimums = np.fmin.reduceat(np.fmin.reduce(values, axis=2), starts)
+            maximums = np.fmax.reduceat(np.fmax.reduce(values, axis=2), starts)
+            center, scale = minimums, maximums - minimums
+        elif method == "standard":
+            valid = ~np.isnan(values)
+            totals = np.add.reduceat(valid.sum(axis=2), starts)
+            center = (
+                np.add.reduceat(np.where(valid, values, 0.0).sum(axis=2), starts)
+                / totals
+            )
+            deviations = values - np.repeat(center, counts, axis=0)[:, :, np.newaxis]
+            scale = np.sqrt(
+                np.add.reduceat(
+                    np.where(valid, deviations ** 2, 0.0).sum(axis=2), starts
+                )
+                / totals
+            )
+        else:
+            median, lower, upper = _segment_percentiles(
+                values, offsets, [50.0, 25.0, 75.0]
+            )
+            center, scale = median, upper - lower
+
+        # as scikit-learn, constant components are only centered
+        scale[scale == 0.0] = 1.0
+        centers[indices], scales[indices] = center, scale
+
+    return centers, scales
+
+
+def _segment_percentiles(
+    values: np.ndarray, offsets: np.ndarray, percentiles: List[float]
+) -> np.ndarray:
+    """
+    Returns the percentiles (with linear interpolation) of each component of each series, whose values (time,
+    component, sample) are concatenated along the time axis, as an array (percentile, series, component).
+    The values of all the series are sorted at once, by series then value, with the nan values last.
+    """
+    n_samples = values.shape[2]
+    n_series, n_components = len(offsets) - 1, values.shape[1]
+    flat = values.transpose(0, 2, 1).reshape(-1, n_components)
+    series_ids = np.repeat(np.arange(n_series), np.diff(offsets) * n_samples)
+    starts = offsets[:-1] * n_samples
+
+    result = np.empty((len(percentiles), n_series, n_components))
+    for component in range(n_components):
+        column = flat[:, component]
+        ordered = column[np.lexsort((column, series_ids))]
+        counts = np.add.reduceat(~np.isnan(column), starts)
+        for index, percentile in enumerate(percentiles):
+            position = percentile / 100 * np.maximum(counts - 1, 0)
+            lower = np.floor(position).astype(int)
+            upper = np.minimum(lower + 1, np.maximum(counts - 1, 0))
+            weight = position - lower
+            result[index, :, component] = (
+                ordered[starts + lower] * (1 - weight)
+                + ordered[starts + upper] * weight
+            )
+            result[index, counts == 0, component] = np.nan
+    return result
@@ -18,3 +18,4 @@ from .metrics import (
     dtw_metric,
     rho_risk,
 )
+from .batched import batch_metrics
@@ -0,0 +1,442 @@
+"""
+Batched Metrics
+---------------
+
+A vectorized engine evaluating several metrics on many pairs of series at once.
+
+The metrics of :mod:`darts.metrics.metrics` process each pair of series, and each component, separately, and slice
+new ``TimeSeries`` for each of them. Instead, :func:`batch_metrics()` aligns all the (actual, predicted) pairs once,
+into padded NumPy arrays of shape (series, time, component) with a mask of the valid values, and then computes each
+metric for all series and components with a few array operations.
+"""
+
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from pandas.tseries.offsets import Tick
+
+from darts import TimeSeries
+from darts.logging import get_logger, raise_if, raise_if_not, raise_log
+
+logger = get_logger(__name__)
+
+
+class AlignedSeries:
+    def __init__(
+        self,
+        y_true: np.ndarray,
+        y_pred: np.ndarray,
+        mask: np.ndarray,
+        true_means: Optional[np.ndarray] = None,
+        insample: Optional[np.ndarray] = None,
+        insample_mask: Optional[np.ndarray] = None,
+    ):
+        """The values of pairs of series aligned on their common time index, padded to a common shape.
+
+        Parameters
+        ----------
+        y_true
+            The actual values, of shape (series, time, component).
+        y_pred
+            The predicted values, of the same shape as `y_true`.
+        mask
+            A boolean array of the same shape as `y_true`, which is True where both values are defined (i.e. not
+            padding nor NaN).
+        true_means
+            Optionally, the mean of each component of the whole actual series, of shape (series, component).
+        insample
+            Optionally, the values of the in-sample series, of shape (series, insample time, component).
+        insample_mask
+            The mask of the valid in-sample values, if `insample` is provided.
+        """
+        self.y_true = y_true
+        self.y_pred = y_pred
+        self.mask = mask
+        self.true_means = true_means
+        self.insample = insample
+        self.insample_mask = insample_mask
+
+    @property
+    def counts(self) -> np.ndarray:
+        """The number of valid values of each series and component."""
+        return self.mask.sum(axis=1)
+
+    def masked(self, values: np.ndarray, fill_value: float = 0.0) -> np.ndarray:
+        """Returns `values` (of the same shape as `y_true`) with `fill_value` where they are not valid."""
+        return np.where(self.mask, values, fill_value)
+
+
+def _as_sequence(series) -> Sequence[TimeSeries]:
+    return [series] if isinstance(series, TimeSeries) else series
+
+
+def _deterministic_values(series: TimeSeries, start: int, stop: int) -> np.ndarray:
+    """The (time, component) values of `series` between the positions `start` and `stop`, or their median for
+    stochastic series"""
+    values = series._values[start:stop]
+    if values.shape[2] == 1:
+        return values[:, :, 0]
+    return np.quantile(values, 0.5, axis=2)
+
+
+def _position(series: TimeSeries, time) -> Optional[int]:
+    """The position of `time` in the time index of `series`, or None if `time` is not on the time grid of `series`"""
+    if series._time_index_cache is None:
+        # regular series built from a start and a frequency; avoid building their time index if possible
+        if not series._has_datetime_index:
+            return time - series._index_start
+        if isinstance(series.freq, Tick):
+            steps, remainder = divmod(
+                (time - series._index_start).value, series.freq.nanos
+            )
+            return None if remainder else steps
+    try:
+        return series._time_index.get_loc(time)
+    except KeyError:
+        return None
+
+
+def _common_slices(
+    actual: TimeSeries, pred: TimeSeries, intersect: bool
+) -> Tuple[int, int, int]:
+    """Returns the positions in `actual` and `pred` of their common time index, and its length"""
+    raise_if_not(
+        actual.width == pred.width,
+        "The two TimeSeries instances must have the same width.",
+        logger,
+    )
+    same_index_type = actual._has_datetime_index == pred._has_datetime_index
+    if intersect and same_index_type and actual.freq == pred.freq:
+        start = max(actual.start_time(), pred.start_time())
+        end = min(actual.end_time(), pred.end_time())
+        if start <= end:
+            actual_start, pred_start = _position(actual, start), _position(pred, start)
+            actual_end = _position(actual, end)
+            if None not in (actual_start, pred_start, actual_end):
+                length = actual_end - actual_start + 1
+                if pred_start + length <= len(pred):
+                    return actual_start, pred_start, length
+    elif not intersect and actual.has_same_time_as(pred):
+        return 0, 0, len(actual)
+
+    raise_log(
+        ValueError(
+            "The two time series (or their intersection) must have the same time index."
+            "\nFirst series: {}\nSecond series: {}".format(
+                actual.time_index, pred.time_index
+            )
+        ),
+        logger,
+    )
+
+
+def align_series(
+    actual_series: Union[TimeSeries, Sequence[TimeSeries]],
+    pred_series: Union[TimeSeries, Sequence[TimeSeries]],
+    intersect: bool = True,
+    insample: Optional[Union[TimeSeries, Sequence[TimeSeries]]] = None,
+    with_true_means: bool = False,
+) -> AlignedSeries:
+    """
+    Aligns the pairs of actual and predicted series on their common time index, into padded arrays.
+
+    For stochastic series, the median of the samples is considered. The series of a pair must have the same width,
+    but the pairs can have different lengths and widths: the arrays are padded in time and components, and the
+    padding is excluded from the mask. NaN values of either series are excluded from the mask too.
+
+    Parameters
+    ----------
+    actual_series
+        The (sequence of) actual series.
+    pred_series
+        The (sequence of) predicted series.
+    intersect
+        For time series that are overlapping in time without having the same time index, setting `True`
+        will consider the values only over their common time interval (intersection in time).
+    insample
+        Optionally, the (sequence of) in-sample series of each pair, which are padded as well.
+    with_true_means
+        Whether to also compute the mean of each component of the whole actual series.
+
+    Returns
+    -------
+    AlignedSeries
+        The aligned values.
+    """
+    actual_series = _as_sequence(actual_series)
+    pred_series = _as_sequence(pred_series)
+    raise_if_not(
+        len(actual_series) == len(pred_series),
+        "The two TimeSeries sequences must have the same length.",
+        logger,
+    )
+    n_series = len(actual_series)
+    slices = [
+        _common_slices(actual, pred, intersect)
+        for actual, pred in zip(actual_series, pred_series)
+    ]
+    max_length = max((length for _, _, length in slices), default=0)
+    max_width = max((series.width for series in actual_series), default=0)
+
+    y_true = np.full((n_series, max_length, max_width), np.nan)
+    y_pred = np.full((n_series, max_length, max_width), np.nan)
+    true_means = np.full((n_series, max_width), np.nan) if with_true_means else None
+    for i, (actual, pred, (actual_start, pred_start, length)) in enumerate(
+        zip(actual_series, pred_series, slices)
+    ):
+        y_true[i, :length, : actual.width] = _deterministic_values(
+            actual, actual_start, actual_start + length
+        )
+        y_pred[i, :length, : actual.width] = _deterministic_values(
+            pred, pred_start, pred_start + length
+        )
+        if with_true_means:
+            true_means[i, : actual.width] = _deterministic_values(
+                actual, 0, len(actual)
+            ).mean(axis=0)
+    mask = ~(np.isnan(y_true) | np.isnan(y_pred))
+
+    insample_values, insample_mask = None, None
+    if insample is not None:
+        insample = _as_sequence(insample)
+        raise_if_not(
+            len(insample) == n_series,
+            "The TimeSeries sequences must have the same length.",
+            logger,
+        )
+        max_insample_length = max(len(series) for series in insample)
+        insample_values = np.full((n_series, max_insample_length, max_width), np.nan)
+        for i, (series, actual) in enumerate(zip(insample, actual_series)):
+            raise_if_not(
+                series.width == actual.width,
+                "The insample TimeSeries must have the same width as the other series.",
+                logger,
+            )
+            insample_values[i, : len(series), : series.width] = _deterministic_values(
+                series, 0, len(series)
+            )
+        insample_mask = ~np.isnan(insample_values)
+
+    return AlignedSeries(
+        y_true, y_pred, mask, true_means, insample_values, insample_mask
+    )
+
+
+def _masked_mean(aligned: AlignedSeries, values: np.ndarray) -> np.ndarray:
+    return aligned.masked(values).sum(axis=1) / aligned.counts
+
+
+def _mae(aligned: AlignedSeries, **kwargs) -> np.ndarray:
+    return _masked_mean(aligned, np.abs(aligned.y_true - aligned.y_pred))
+
+
+def _mse(aligned: AlignedSeries, **kwargs) -> np.ndarray:
+    return _masked_mean(aligned, (aligned.y_true - aligned.y_pred) ** 2)
+
+
+def _rmse(aligned: AlignedSeries, **kwargs) -> np.ndarray:
+    return np.sqrt(_mse(aligned))
+
+
+def _rmsle(aligned: AlignedSeries, **kwargs) -> np.ndarray:
+    errors = np.log(aligned.y_true + 1) - np.log(aligned.y_pred + 1)
+    return np.sqrt(_masked_mean(aligned, errors ** 2))
+
+
+def _coefficient_of_variation(aligned: AlignedSeries, **kwargs) -> np.ndarray:
+    return 100 * _rmse(aligned) / aligned.true_means
+
+
+def _mape(aligned: AlignedSeries, **kwargs) -> np.ndarray:
+    raise_if(
+        (aligned.mask & (aligned.y_true == 0)).any(),
+        "The actual series must be strictly positive to compute the MAPE.",
+        logger,
+    )
+    return 100.0 * _masked_mean(
+        aligned, np.abs((aligned.y_true - aligned.y_pred) / aligned.y_true)
+    )
+
+
+def _smape(aligned: AlignedSeries, **kwargs) -> np.ndarray:
+    y_true, y_pred = aligned.y_true, aligned.y_pred
+    raise_if(
+        (aligned.mask & (y_true == 0) & (y_pred == 0)).any(),
+        "The actual series must be strictly positive to compute the sMAPE.",
+        logger,
+    )
+    return 200.0 * _masked_mean(
+        aligned, np.abs(y_true - y_pred) / (np.abs(y_true) + np.abs(y_pred))
+    )
+
+
+def _ope(aligned: AlignedSeries, **kwargs) -> np.ndarray:
+    true_sums = aligned.masked(aligned.y_true).sum(axis=1)
+    pred_sums = aligned.masked(aligned.y_pred).sum(axis=1)
+    raise_if(
+        (true_sums[aligned.counts > 0] <= 0).any(),
+        "The series of actual value cannot sum to zero when computing OPE.",
+        logger,
+    )
+    return np.where(
+        aligned.counts > 0, np.abs((true_sums - pred_sums) / true_sums) * 100.0, np.nan
+    )
+
+
+def _marre(aligned: AlignedSeries, **kwargs) -> np.ndarray:
+    true_ranges = aligned.masked(aligned.y_true, -np.inf).max(axis=1) - aligned.masked(
+        aligned.y_true, np.inf
+    ).min(axis=1)
+    raise_if(
+        (true_ranges[aligned.counts > 0] <= 0).any(),
+        "The difference between the max and min values must be strictly"
+        "positive to compute the MARRE.",
+        logger,
+    )
+    return 100.0 * _masked_mean(
+        aligned,
+        np.abs(aligned.y_true - aligned.y_pred) / true_ranges[:, np.newaxis, :],
+    )
+
+
+def _r2_score(aligned: AlignedSeries, **kwargs) -> np.ndarray:
+    ss_errors = aligned.masked((aligned.y_true - aligned.y_pred) ** 2).sum(axis=1)
+    true_means = _masked_mean(aligned, aligned.y_true)
+    ss_tot = aligned.masked((aligned.y_true - true_means[:, np.newaxis, :]) ** 2).sum(
+        axis=1
+    )
+    return 1 - ss_errors / ss_tot
+
+
+def _mase(aligned: AlignedSeries, m: int = 1, **kwargs) -> np.ndarray:
+    raise_if(
+        aligned.insample is None, "The MASE requires the `insample` series.", logger
+    )
+    raise_if_not(
+        isinstance(m, int) and m >= 1,
+        "The batched MASE requires an integer seasonality `m` >= 1.",
+        logger,
+    )
+    insample, insample_mask = aligned.insample, aligned.insample_mask
+    naive_mask = insample_mask[:, m:] & insample_mask[:, :-m]
+    naive_errors = np.where(naive_mask, np.abs(insample[:, m:] - insample[:, :-m]), 0)
+    scales = naive_errors.sum(axis=1) / naive_mask.sum(axis=1)
+    raise_if(
+        np.isclose(scales[aligned.counts > 0], 0).any(),
+        "cannot use MASE with periodical signals",
+        logger,
+    )
+    return _mae(aligned) / scales
+
+
+_METRICS = {
+    "mae": _mae,
+    "mse": _mse,
+    "rmse": _rmse,
+    "rmsle": _rmsle,
+    "coefficient_of_variation": _coefficient_of_variation,
+    "mape": _mape,
+    "smape": _smape,
+    "mase": _mase,
+    "ope": _ope,
+    "marre": _marre,
+    "r2_score": _r2_score,
+}
+
+
+def batch_metrics(
+    actual_series: Union[TimeSeries, Sequence[TimeSeries]],
+    pred_series: Union[TimeSeries, Sequence[TimeSeries]],
+    metrics: Sequence[Union[str, Callable]],
+    insample: Optional[Union[TimeSeries, Sequence[TimeSeries]]] = None,
+    m: int = 1,
+    intersect: bool = True,
+    *,
+    reduction: Optional[Callable[..., np.ndarray]] = np.nanmean,
+    inter_reduction: Optional[Callable[..., np.ndarray]] = None,
+) -> Dict[str, Union[float, np.ndarray]]:
+    """
+    Computes several metrics on many pairs of series at once.
+
+    All the pairs of series are first aligned on their common time index into padded arrays
+    (see :func:`align_series()`), which are then shared by all the metrics. Each metric is computed for all the
+    series and components with vectorized operations, and gives the same values as the corresponding function of
+    :mod:`darts.metrics.metrics` (except that the NaN values are always ignored).
+
+    The supported metrics are ``"mae"``, ``"mse"``, ``"rmse"``, ``"rmsle"``, ``"coefficient_of_variation"``,
+    ``"mape"``, ``"smape"``, ``"mase"``, ``"ope"``, ``"marre"`` and ``"r2_score"``. They can be given by name, or as
+    the metric functions of :mod:`darts.metrics` themselves.
+
+    Parameters
+    ----------
+    actual_series
+        The (sequence of) actual series.
+    pred_series
+        The (sequence of) predicted series.
+    metrics
+        The metrics to compute.
+    insample
+        The (sequence of) training series used to forecast `pred_series`, which are only required by the MASE.
+    m
+        The seasonality used for differencing in the MASE.
+    intersect
+        For time series that are overlapping in time without having the same time index, setting `True`
+        will consider the values only over their common time interval (intersection in time).
+    reduction
+        Optionally, a function reducing the metrics of the components of each series, called with an array of shape
+        (series, component) and ``axis=1``. The components which only pad the series narrower than the widest one are
+        NaN, hence the default ``np.nanmean``. If `None`, the metrics of each component are returned.
+    inter_reduction
+        Optionally, a function reducing the metrics of the series, called with the array of the (reduced) metrics
+        and ``axis=0``. If `None`, the metrics of each series are returned.
+
+    Returns
+    -------
+    Dict[str, Union[float, np.ndarray]]
+        The values of each metric, by name. Without reductions, they are arrays of shape (series, component), or
+        (series,) with the default `reduction`. If a single pair of series was given and the values are reduced to
+        one per series, a float is returned instead.
+    """
+    names = [
+        metric if isinstance(metric, str) else metric.__name__ for metric in metrics
+    ]
+    for name in names:
+        raise_if_not(
+            name in _METRICS,
+            f"Unsupported batched metric: `{name}`. Supported metrics: {list(_METRICS)}.",
+            logger,
+        )
+
+    aligned = align_series(
+        actual_series,
+        pred_series,
+        intersect=intersect,
+        insample=insample if "mase" in names else None,
+        with_true_means="coefficient_of_variation" in names,
+    )
+
+    results = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for name in names:
+            values = _METRICS[name](aligned, m=m)
+            if reduction is not None:
+                values = reduction(values, axis=1)
+            if inter_reduction is not None:
+                values = inter_reduction(values, axis=0)
+            elif isinstance(actual_series, TimeSeries) and np.ndim(values) == 1:
+                values = float(values[0])
+            results[name] = values
+    return results
+
+
+def _is_batched_metric(metric: Callable) -> bool:
+    """Whether `metric` is a metric function of :mod:`darts.metrics.metrics` computed the same way by
+    :func:`batch_metrics()` when called with only two series (i.e. without the `insample` series of the MASE)"""
+    from darts.metrics import metrics as metrics_module
+
+    name = getattr(metric, "__name__", None)
+    return (
+        name in _METRICS
+        and name != "mase"
+        and getattr(metrics_module, name, None) is metric
+    )
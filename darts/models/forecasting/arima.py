@@ -78,6 +78,18 @@ class ARIMA(DualCovariatesForecastingModel):
 
         return self
 
+    def _supports_update(self) -> bool:
+        return True
+
+    def _update(
+        self, new_values: np.ndarray, future_covariates: Optional[np.ndarray] = None
+    ):
+        # extend the state space model with the new observations, and re-estimate its parameters starting from the
+        # current estimates
+        self.model = self.model.append(new_values, exog=future_covariates, refit=True)
+
+        return self
+
     def _predict(
         self,
         n: int,
@@ -37,6 +37,17 @@ class NaiveMean(ForecastingModel):
         self.mean_val = np.mean(series.univariate_values())
         return self
 
+    def _supports_update(self) -> bool:
+        return True
+
+    def _update(self, new_values: np.ndarray):
+        # running mean over the extended training series
+        n_old = len(self.training_series) - len(new_values)
+        self.mean_val = (self.mean_val * n_old + new_values.sum()) / len(
+            self.training_series
+        )
+        return self
+
     def predict(self, n: int, num_samples: int = 1):
         super().predict(n, num_samples)
         forecast = np.array([self.mean_val for _ in range(n)])
@@ -102,6 +113,13 @@ class NaiveDrift(ForecastingModel):
         series = self.training_series
         return self
 
+    def _supports_update(self) -> bool:
+        return True
+
+    def _update(self, new_values: np.ndarray):
+        # the drift only depends on the first and last values of the training series
+        return self
+
     def predict(self, n: int, num_samples: int = 1):
         super().predict(n, num_samples)
         first, last = (
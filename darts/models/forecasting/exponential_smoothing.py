@@ -81,6 +81,51 @@ class ExponentialSmoothing(ForecastingModel):
 
     def fit(self, series: TimeSeries):
         super().fit(series)
+        self._fit_model(self.fit_kwargs)
+        return self
+
+    def _supports_update(self) -> bool:
+        return True
+
+    def _update(self, new_values: np.ndarray):
+        # fit the model on the extended training series, warm-starting the optimization
+        # of the smoothing parameters and initial states from their current estimates
+        start_params = self._current_params()
+        if start_params is None:
+            self._fit_model(self.fit_kwargs)
+        else:
+            self._fit_model(
+                {"use_brute": False, **self.fit_kwargs, "start_params": start_params}
+            )
+        return self
+
+    def _current_params(self) -> Optional[np.ndarray]:
+        """Returns the estimated parameters of the fitted model, in the order expected for the `start_params` of
+        statsmodels, or None if the fit did not estimate them."""
+        if not self.fit_kwargs.get("optimized", True) or any(
+            name in self.fit_kwargs for name in ["start_params", "method"]
+        ):
+            return None
+
+        hw_model, params = self.model.model, self.model.params
+        estimated = [
+            ("smoothing_level", True),
+            ("smoothing_trend", hw_model.has_trend),
+            ("smoothing_seasonal", hw_model.has_seasonal),
+            ("initial_level", True),
+            ("initial_trend", hw_model.has_trend),
+            ("damping_trend", hw_model.damped_trend),
+        ]
+        start_params = [
+            params[name]
+            for name, is_estimated in estimated
+            if is_estimated and self.fit_kwargs.get(name) is None
+        ]
+        if hw_model.has_seasonal:
+            start_params += list(params["initial_seasons"])
+        return np.array(start_params)
+
+    def _fit_model(self, fit_kwargs: dict):
         series = self.training_series
 
         # if the model was initially created with `self.seasonal_periods=None`, make sure that
@@ -104,14 +149,12 @@ class ExponentialSmoothing(ForecastingModel):
             freq=series.freq if series.has_datetime_index else None,
             dates=series.time_index if series.has_datetime_index else None,
         )
-        hw_results = hw_model.fit(**self.fit_kwargs)
+        hw_results = hw_model.fit(**fit_kwargs)
         self.model = hw_results
 
         if self.infer_seasonal_periods:
             self.seasonal_periods = hw_model.seasonal_periods
 
-        return self
-
     def predict(self, n, num_samples=1):
         super().predict(n, num_samples)
 
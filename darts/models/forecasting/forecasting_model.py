@@ -27,15 +27,36 @@ from darts.utils import (
     _historical_forecasts_general_checks,
     _parallel_apply,
 )
+from darts.utils.cache import _cached_model_method, _uncached_model_method
 from darts.utils.timeseries_generation import _generate_index
 import inspect
 
 from darts import metrics
+from darts.metrics.batched import batch_metrics, _is_batched_metric
 
 logger = get_logger(__name__)
 
 
 class ModelMeta(ABCMeta):
+    # the methods whose calls are memoized while a `darts.utils.cache.ForecastingCache` is active
+    _cached_methods = ("fit", "update", "predict", "historical_forecasts")
+    # the other methods changing the state of the models, after which the cache no longer identifies it
+    _uncached_state_methods = (
+        "fit_from_dataset",
+        "fit_distributed",
+        "load_weights_from_checkpoint",
+        "reset_model",
+    )
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        for method_name in mcs._cached_methods:
+            if method_name in namespace:
+                namespace[method_name] = _cached_model_method(namespace[method_name])
+        for method_name in mcs._uncached_state_methods:
+            if method_name in namespace:
+                namespace[method_name] = _uncached_model_method(namespace[method_name])
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
     def __call__(cls, *args, **kwargs):
         cls.model_call = (args, kwargs)
         return super(ModelMeta, cls).__call__(*args, **kwargs)
@@ -87,6 +108,67 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         if series.has_range_index:
             self._supports_range_index()
 
+    def update(self, series: TimeSeries) -> "ForecastingModel":
+        """Update the fitted model with the new values of the provided series.
+
+        `series` must extend the series on which the model was last fitted (or updated): it has to start at the
+        same time, and contains some new values after the end of the training series. Models supporting incremental
+        updates only process these new values, starting from their current state; the other models are simply
+        fitted again on the whole `series`. Note that models re-estimating their parameters on update (such as
+        ``ARIMA`` and ``ExponentialSmoothing``) start the optimization from their current estimates, which can end
+        in a different local optimum than a fit from scratch.
+
+        Parameters
+        ----------
+        series
+            The extended training series.
+
+        Returns
+        -------
+        self
+            Updated model.
+        """
+        self._update_sanity_checks(series)
+
+        if not self._supports_update():
+            return self.fit(series)
+
+        new_values = series.values(copy=False)[len(self.training_series) :]
+        self.training_series = series
+        return self._update(new_values)
+
+    def _update_sanity_checks(self, series: TimeSeries) -> None:
+        """Checks that `series` can be used to update the model fitted on `self.training_series`"""
+        raise_if_not(
+            self._fit_called and self.training_series is not None,
+            "The model must be fit on a single series before calling `update()`.",
+            logger,
+        )
+        training_series = self.training_series
+        raise_if_not(
+            series.freq == training_series.freq
+            and series.width == training_series.width
+            and series.start_time() == training_series.start_time()
+            and len(series) >= len(training_series),
+            "The series used to update the model must extend its training series: it must start at the same "
+            "time, with the same frequency and components.",
+            logger,
+        )
+
+    def _supports_update(self) -> bool:
+        """
+        Checks if the forecasting model can be updated incrementally with new values. By default, returns False.
+        Needs to be overwritten by models which implement `_update()`.
+        """
+        return False
+
+    def _update(self, new_values: np.ndarray) -> "ForecastingModel":
+        """Updates the state of the model with `new_values`, which follow the end of its previous training series.
+        When this method is called, `self.training_series` already holds the extended training series.
+        Models which support incremental updates must implement the update logic in this method.
+        """
+        raise NotImplementedError()
+
     def _supports_range_index(self) -> bool:
         """Checks if the forecasting model supports a range index.
         Some models may not support this, if for instance the rely on underlying dates.
@@ -112,6 +194,29 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         """
         return False
 
+    def _batched_historical_forecasts(
+        self,
+        series: TimeSeries,
+        past_covariates: Optional[TimeSeries],
+        future_covariates: Optional[TimeSeries],
+        pred_times: List[Union[pd.Timestamp, int]],
+        forecast_horizon: int,
+        stride: int,
+        num_samples: int,
+    ) -> Optional[np.ndarray]:
+        """
+        Computes at once all the historical forecasts starting at `pred_times` without retraining the model.
+        By default, returns None, in which case the forecasts are computed one by one with `predict()`.
+        Can be overwritten by models which can produce these forecasts more efficiently.
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            An array of shape `(len(pred_times), forecast_horizon, n_components, num_samples)` containing the values
+            of the historical forecasts, or None.
+        """
+        return None
+
     @property
     def uses_past_covariates(self):
         return "past_covariates" in inspect.signature(self.fit).parameters.keys()
@@ -163,6 +268,14 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
     ):
         self.fit(series)
 
+    def _update_wrapper(
+        self,
+        series: TimeSeries,
+        past_covariates: Optional[TimeSeries],
+        future_covariates: Optional[TimeSeries],
+    ):
+        self.update(series)
+
     def _predict_wrapper(
         self,
         n: int,
@@ -209,27 +322,26 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         input_series = (
             input_series if input_series is not None else self.training_series
         )
-        time_index_length = (
-            len(points_preds)
+        values = (
+            points_preds
             if isinstance(points_preds, np.ndarray)
-            else len(points_preds[0])
+            else np.stack(points_preds, axis=2)
         )
-        time_index = self._generate_new_dates(
-            time_index_length, input_series=input_series
-        )
-        if isinstance(points_preds, np.ndarray):
-            return TimeSeries.from_times_and_values(
-                time_index,
-                points_preds,
-                freq=input_series.freq_str,
-                columns=input_series.columns,
-            )
+        values = values.reshape(values.shape + (1,) * (3 - values.ndim))
+        if values.dtype not in (np.float32, np.float64):
+            values = values.astype(np.float64)
 
-        return TimeSeries.from_times_and_values(
-            time_index,
-            np.stack(points_preds, axis=2),
-            freq=input_series.freq_str,
-            columns=input_series.columns,
+        # the new time index is regular and starts right after the input series,
+        # so we can skip the validation done by the TimeSeries factory methods
+        last = input_series.end_time()
+        start = (
+            last + input_series.freq if input_series.has_datetime_index else last + 1
+        )
+        return TimeSeries._from_trusted_values(
+            values,
+            components=input_series.components,
+            start=start,
+            freq=input_series.freq if input_series.has_datetime_index else None,
         )
 
     def _historical_forecasts_sanity_checks(self, *args: Any, **kwargs: Any) -> None:
@@ -249,7 +361,8 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         """
         # parse args and kwargs
         series = args[0]
-        _historical_forecasts_general_checks(series, kwargs)
+        for ts in [series] if isinstance(series, TimeSeries) else series:
+            _historical_forecasts_general_checks(ts, kwargs)
 
     def _get_last_prediction_time(self, series, forecast_horizon, overlap_end):
         if overlap_end:
@@ -262,9 +375,9 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
     @_with_sanity_checks("_historical_forecasts_sanity_checks")
     def historical_forecasts(
         self,
-        series: TimeSeries,
-        past_covariates: Optional[TimeSeries] = None,
-        future_covariates: Optional[TimeSeries] = None,
+        series: Union[TimeSeries, Sequence[TimeSeries]],
+        past_covariates: Optional[Union[TimeSeries, Sequence[TimeSeries]]] = None,
+        future_covariates: Optional[Union[TimeSeries, Sequence[TimeSeries]]] = None,
         num_samples: int = 1,
         start: Union[pd.Timestamp, float, int] = 0.5,
         forecast_horizon: int = 1,
@@ -273,7 +386,8 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         overlap_end: bool = False,
         last_points_only: bool = True,
         verbose: bool = False,
-    ) -> Union[TimeSeries, List[TimeSeries]]:
+        n_jobs: int = 1,
+    ) -> Union[TimeSeries, List[TimeSeries], List[List[TimeSeries]]]:
 
         """Compute the historical forecasts that would have been obtained by this model on the `series`.
 
@@ -293,14 +407,20 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         (up to `start` time stamp), and only if it has not been trained before. This is not
         supported by all models.
 
+        If `series` is a sequence of series, the historical forecasts of each series are computed in turn,
+        and the method returns a list containing the result obtained for each series.
+
         Parameters
         ----------
         series
-            The target time series to use to successively train and evaluate the historical forecasts.
+            The target time series (or a sequence of target series) to use to successively train and evaluate the
+            historical forecasts.
         past_covariates
-            An optional past-observed covariate series. This applies only if the model supports past covariates.
+            An optional past-observed covariate series (or one covariate series per target series).
+            This applies only if the model supports past covariates.
         future_covariates
-            An optional future-known covariate series. This applies only if the model supports future covariates.
+            An optional future-known covariate series (or one covariate series per target series).
+            This applies only if the model supports future covariates.
         num_samples
             Number of times a prediction is sampled from a probabilistic model. Should be left set to 1
             for deterministic models.
@@ -320,6 +440,11 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         retrain
             Whether to retrain the model for every prediction or not. Not all models support setting
             `retrain` to `False`. Notably, this is supported by neural networks based models.
+            Without retraining, regression models and neural networks based models compute all the historical
+            forecasts at once.
+            When retraining sequentially, the models supporting incremental updates (see :func:`update()`), such as
+            the naive baselines, ``ARIMA`` and ``ExponentialSmoothing``, are only fitted on the first training window
+            of each series, and then updated with the new values of each subsequent window.
         overlap_end
             Whether the returned forecasts can go beyond the series' end or not
         last_points_only
@@ -328,11 +453,16 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
             Otherwise returns a list of historical ``TimeSeries`` forecasts.
         verbose
             Whether to print progress
+        n_jobs
+            The number of jobs to run in parallel over the prediction times (and series). When ``n_jobs != 1``,
+            the forecasts are computed by copies of the model, which is therefore not retrained itself.
+            `-1` means using all processors. Defaults to `1` (sequential).
         Returns
         -------
         TimeSeries or List[TimeSeries]
             By default, a single ``TimeSeries`` instance created from the last point of each individual forecast.
             If `last_points_only` is set to False, a list of the historical forecasts.
+            If `series` is a sequence, a list containing the above for each series.
         """
 
         # TODO: do we need a check here? I'd rather leave these checks to the models/datasets.
@@ -352,10 +482,129 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
             logger,
         )
 
+        called_with_single_series = isinstance(series, TimeSeries)
+        series = [series] if called_with_single_series else series
+        past_covariates = (
+            [past_covariates]
+            if isinstance(past_covariates, TimeSeries)
+            else past_covariates
+        )
+        future_covariates = (
+            [future_covariates]
+            if isinstance(future_covariates, TimeSeries)
+            else future_covariates
+        )
+        for covariates in [past_covariates, future_covariates]:
+            raise_if_not(
+                covariates is None or len(covariates) == len(series),
+                "The number of covariate series must be equal to the number of target series.",
+                logger,
+            )
+        past_covariates = past_covariates or [None] * len(series)
+        future_covariates = future_covariates or [None] * len(series)
+
+        # build the prediction times in advance (to be able to use tqdm)
+        pred_times = [
+            self._get_historical_forecasts_pred_times(
+                ts, start, forecast_horizon, stride, overlap_end
+            )
+            for ts in series
+        ]
+
+        # Either store the whole forecasts or only the last points of each forecast, depending on last_points_only
+        forecasts = [[] for _ in series]
+
+        # without retraining, some models can compute all the forecasts of a series at once
+        tasks = []
+        for idx, (ts, past_cov, future_cov) in enumerate(
+            zip(series, past_covariates, future_covariates)
+        ):
+            batched_values = (
+                None
+                if retrain
+                else self._batched_historical_forecasts(
+                    series=ts,
+                    past_covariates=past_cov,
+                    future_covariates=future_cov,
+                    pred_times=pred_times[idx],
+                    forecast_horizon=forecast_horizon,
+                    stride=stride,
+                    num_samples=num_samples,
+                )
+            )
+            if batched_values is None:
+                tasks += [
+                    (idx, ts, past_cov, future_cov, pred_time)
+                    for pred_time in pred_times[idx]
+                ]
+                continue
+
+            forecasts[idx] = [
+                TimeSeries._from_trusted_values(
+                    values,
+                    components=ts.components,
+                    start=pred_time,
+                    freq=ts.freq if ts.has_datetime_index else None,
+                )
+                for pred_time, values in zip(pred_times[idx], batched_values)
+            ]
+
+        iterator = _build_tqdm_iterator(tasks, verbose)
+
+        # iterate and forecast; the forecasting steps are independent from each other when running in parallel
+        if n_jobs == 1:
+            # the successive training windows of a series extend each other, so the models supporting it are
+            # only updated with the new values of each window after their first fit on the series
+            incremental = retrain and self._supports_update()
+            task_forecasts, previous_idx = [], None
+            for task in iterator:
+                task_forecasts.append(
+                    self._historical_forecast(
+                        *task[1:],
+                        forecast_horizon=forecast_horizon,
+                        retrain=retrain,
+                        num_samples=num_samples,
+                        update=incremental and task[0] == previous_idx,
+                    )
+                )
+                previous_idx = task[0]
+        else:
+            task_forecasts = _parallel_apply(
+                (task[1:] for task in iterator),
+                self._historical_forecast,
+                n_jobs,
+                fn_args=(),
+                fn_kwargs={
+                    "forecast_horizon": forecast_horizon,
+                    "retrain": retrain,
+                    "num_samples": num_samples,
+                },
+            )
+
+        for task, forecast in zip(tasks, task_forecasts):
+            forecasts[task[0]].append(forecast)
+
+        if last_points_only:
+            forecasts = [
+                self._historical_forecasts_last_points(ts, ts_forecasts, stride)
+                for ts, ts_forecasts in zip(series, forecasts)
+            ]
+
+        return forecasts[0] if called_with_single_series else forecasts
+
+    def _get_historical_forecasts_pred_times(
+        self,
+        series: TimeSeries,
+        start: Union[pd.Timestamp, float, int],
+        forecast_horizon: int,
+        stride: int,
+        overlap_end: bool,
+    ) -> List[Union[pd.Timestamp, int]]:
+        """Returns the prediction times of the historical forecasts of `series`"""
+
         # prepare the start parameter -> pd.Timestamp
         start = series.get_timestamp_at_point(start)
 
-        # build the prediction times in advance (to be able to use tqdm)
         last_valid_pred_time = self._get_last_prediction_time(
             series, forecast_horizon, overlap_end
         )
@@ -369,64 +618,76 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         if pred_times[-1] > last_valid_pred_time:
             pred_times.pop(-1)
 
-        iterator = _build_tqdm_iterator(pred_times, verbose)
-
-        # Either store the whole forecasts or only the last points of each forecast, depending on last_points_only
-        forecasts = []
-
-        last_points_times = []
-        last_points_values = []
-
-        # iterate and forecast
-        for pred_time in iterator:
-            train = series.drop_after(pred_time)  # build the training series
-
-            # train_cov = covariates.drop_after(pred_time) if covariates else None
+        return pred_times
 
-            if retrain:
-                self._fit_wrapper(
-                    series=train,
-                    past_covariates=past_covariates,
-                    future_covariates=future_covariates,
-                )
+    def _historical_forecast(
+        self,
+        series: TimeSeries,
+        past_covariates: Optional[TimeSeries],
+        future_covariates: Optional[TimeSeries],
+        pred_time: Union[pd.Timestamp, int],
+        forecast_horizon: int,
+        retrain: bool,
+        num_samples: int,
+        update: bool = False,
+    ) -> TimeSeries:
+        """Computes the historical forecast of `series` starting at `pred_time`, optionally retraining the model.
+        If `update` is True, the model was fitted on a previous training window of `series`, and is only updated
+        with the new values instead of being retrained.
+        """
+        train = series.drop_after(pred_time)  # build the training series
 
-            forecast = self._predict_wrapper(
-                n=forecast_horizon,
+        if update:
+            self._update_wrapper(
+                series=train,
+                past_covariates=past_covariates,
+                future_covariates=future_covariates,
+            )
+        elif retrain:
+            self._fit_wrapper(
                 series=train,
                 past_covariates=past_covariates,
                 future_covariates=future_covariates,
-                num_samples=num_samples,
             )
 
-            if last_points_only:
-                last_points_values.append(forecast.all_values()[-1])
-                last_points_times.append(forecast.end_time())
-            else:
-                forecasts.append(forecast)
+        return self._predict_wrapper(
+            n=forecast_horizon,
+            series=train,
+            past_covariates=past_covariates,
+            future_covariates=future_covariates,
+            num_samples=num_samples,
+        )
 
-        if last_points_only:
-            if series.has_datetime_index:
-                return TimeSeries.from_times_and_values(
-                    pd.DatetimeIndex(last_points_times, freq=series.freq * stride),
-                    np.array(last_points_values),
-                )
-            else:
-                return TimeSeries.from_times_and_values(
-                    pd.RangeIndex(
-                        start=last_points_times[0],
-                        stop=last_points_times[-1] + 1,
-                        step=1,
-                    ),
-                    np.array(last_points_values),
-                )
+    @staticmethod
+    def _historical_forecasts_last_points(
+        series: TimeSeries, forecasts: List[TimeSeries], stride: int
+    ) -> TimeSeries:
+        """Builds a single series made of the last point of each of the historical `forecasts` of `series`"""
+        last_points_values = np.array(
+            [forecast.all_values(copy=False)[-1] for forecast in forecasts]
+        )
+        last_points_times = [forecast.end_time() for forecast in forecasts]
 
-        return forecasts
+        if series.has_datetime_index:
+            return TimeSeries.from_times_and_values(
+                pd.DatetimeIndex(last_points_times, freq=series.freq * stride),
+                last_points_values,
+            )
+        else:
+            return TimeSeries.from_times_and_values(
+                pd.RangeIndex(
+                    start=last_points_times[0],
+                    stop=last_points_times[-1] + 1,
+                    step=1,
+                ),
+                last_points_values,
+            )
 
     def backtest(
         self,
-        series: TimeSeries,
-        past_covariates: Optional[TimeSeries] = None,
-        future_covariates: Optional[TimeSeries] = None,
+        series: Union[TimeSeries, Sequence[TimeSeries]],
+        past_covariates: Optional[Union[TimeSeries, Sequence[TimeSeries]]] = None,
+        future_covariates: Optional[Union[TimeSeries, Sequence[TimeSeries]]] = None,
         num_samples: int = 1,
         start: Union[pd.Timestamp, float, int] = 0.5,
         forecast_horizon: int = 1,
@@ -434,10 +695,21 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         retrain: bool = True,
         overlap_end: bool = False,
         last_points_only: bool = False,
-        metric: Callable[[TimeSeries, TimeSeries], float] = metrics.mape,
+        metric: Union[
+            Callable[[TimeSeries, TimeSeries], float],
+            Sequence[Callable[[TimeSeries, TimeSeries], float]],
+            Dict[str, Callable[[TimeSeries, TimeSeries], float]],
+        ] = metrics.mape,
         reduction: Union[Callable[[np.ndarray], float], None] = np.mean,
         verbose: bool = False,
-    ) -> Union[float, List[float]]:
+        n_jobs: int = 1,
+    ) -> Union[
+        float,
+        List[float],
+        pd.Series,
+        pd.DataFrame,
+        List[Union[float, List[float], pd.Series, pd.DataFrame]],
+    ]:
 
         """Compute error values that the model would have produced when
         used on `series`.
@@ -459,14 +731,20 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         (up to `start` time stamp), and only if it has not been trained before. Then, at every iteration, the
         newly expanded input sequence will be fed to the model to produce the new output.
 
+        If `series` is a sequence of series, the errors are computed for each series and the method returns
+        a list containing the result obtained for each series.
+
         Parameters
         ----------
         series
-            The target time series to use to successively train and evaluate the historical forecasts
+            The target time series (or a sequence of target series) to use to successively train and evaluate the
+            historical forecasts
         past_covariates
-            An optional past-observed covariate series. This applies only if the model supports past covariates.
+            An optional past-observed covariate series (or one covariate series per target series).
+            This applies only if the model supports past covariates.
         future_covariates
-            An optional future-known covariate series. This applies only if the model supports future covariates.
+            An optional future-known covariate series (or one covariate series per target series).
+            This applies only if the model supports future covariates.
         num_samples
             Number of times a prediction is sampled from a probabilistic model. Should be left set to 1
             for deterministic models.
@@ -491,17 +769,29 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         last_points_only
             Whether to use the whole historical forecasts or only the last point of each forecast to compute the error
         metric
-            A function that takes two ``TimeSeries`` instances as inputs and returns an error value.
+            A function that takes two ``TimeSeries`` instances as inputs and returns an error value. It can also be a
+            list of such functions, or a dictionary of them by name, which are all computed on the same historical
+            forecasts. The metrics of a list are named after their ``__name__`` (or their ``repr()``), which must be
+            unique. The metrics of :mod:`darts.metrics` are then computed together, with
+            :func:`darts.metrics.batch_metrics()`.
         reduction
             A function used to combine the individual error scores obtained when `last_points_only` is set to False.
             If explicitely set to `None`, the method will return a list of the individual error scores instead.
             Set to ``np.mean`` by default.
         verbose
             Whether to print progress
+        n_jobs
+            The number of jobs to run in parallel over the prediction times (and series). When ``n_jobs != 1``,
+            the forecasts are computed by copies of the model, which is therefore not retrained itself.
+            `-1` means using all processors. Defaults to `1` (sequential).
         Returns
         -------
-        float or List[float]
-            The error score, or the list of individual error scores if `reduction` is `None`
+        float or List[float] or pandas.Series or pandas.DataFrame
+            The error score, or the list of individual error scores if `reduction` is `None`.
+            With several metrics, a Series of the error scores indexed by metric name, or if `reduction` is `None`
+            (and `last_points_only` is False), a DataFrame of the individual error scores indexed by forecast start
+            time, with one column per metric.
+            If `series` is a sequence, a list containing the above for each series.
         """
         forecasts = self.historical_forecasts(
             series=series,
@@ -515,8 +805,31 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
             overlap_end=overlap_end,
             last_points_only=last_points_only,
             verbose=verbose,
+            n_jobs=n_jobs,
         )
 
+        errors_fn = (
+            self._backtest_errors
+            if callable(metric)
+            else self._backtest_multiple_errors
+        )
+        if isinstance(series, TimeSeries):
+            return errors_fn(series, forecasts, last_points_only, metric, reduction)
+
+        return [
+            errors_fn(ts, ts_forecasts, last_points_only, metric, reduction)
+            for ts, ts_forecasts in zip(series, forecasts)
+        ]
+
+    @staticmethod
+    def _backtest_errors(
+        series: TimeSeries,
+        forecasts: Union[TimeSeries, List[TimeSeries]],
+        last_points_only: bool,
+        metric: Callable[[TimeSeries, TimeSeries], float],
+        reduction: Union[Callable[[np.ndarray], float], None],
+    ) -> Union[float, List[float]]:
+        """Computes the backtest error(s) of the historical `forecasts` of `series`"""
         if last_points_only:
             return metric(series, forecasts)
 
@@ -526,6 +839,80 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
 
         return reduction(np.array(errors))
 
+    @staticmethod
+    def _backtest_multiple_errors(
+        series: TimeSeries,
+        forecasts: Union[TimeSeries, List[TimeSeries]],
+        last_points_only: bool,
+        metric: Union[Sequence[Callable], Dict[str, Callable]],
+        reduction: Union[Callable[[np.ndarray], float], None],
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """Computes the backtest errors of the historical `forecasts` of `series` for several metrics"""
+        forecasts = [forecasts] if last_points_only else forecasts
+        errors = pd.DataFrame(
+            ForecastingModel._compute_metrics(
+                [series] * len(forecasts), forecasts, metric
+            ),
+            index=pd.Index(
+                [forecast.start_time() for forecast in forecasts], name=series._time_dim
+            ),
+        )
+        if last_points_only:
+            return errors.iloc[0].rename(None)
+        if reduction is None:
+            return errors
+
+        return pd.Series(
+            {name: reduction(errors[name].to_numpy()) for name in errors.columns}
+        )
+
+    @staticmethod
+    def _compute_metrics(
+        actual_series: Sequence[TimeSeries],
+        pred_series: Sequence[TimeSeries],
+        metric: Union[Sequence[Callable], Dict[str, Callable]],
+    ) -> Dict[str, np.ndarray]:
+        """Computes several metrics on each pair of series, by name. The metrics of `darts.metrics` share the
+        alignment of the series, and are computed together by `batch_metrics()`."""
+        if isinstance(metric, dict):
+            metric = dict(metric)
+        else:
+            names = [
+                getattr(metric_fn, "__name__", repr(metric_fn)) for metric_fn in metric
+            ]
+            raise_if(
+                len(set(names)) < len(names),
+                f"Several metrics have the same name ({', '.join(names)}); "
+                "pass a dictionary of the metrics by name instead.",
+                logger,
+            )
+            metric = dict(zip(names, metric))
+
+        batched_metrics = {
+            name: metric_fn
+            for name, metric_fn in metric.items()
+            if _is_batched_metric(metric_fn)
+        }
+        if batched_metrics:
+            values = batch_metrics(
+                actual_series,
+                pred_series,
+                list(batched_metrics.values()),
+                reduction=np.mean,
+            )
+
+        return {
+            name: values[metric_fn.__name__]
+            if name in batched_metrics
+            else np.array(
+                [
+                    metric_fn(actual, pred)
+                    for actual, pred in zip(actual_series, pred_series)
+                ]
+            )
+            for name, metric_fn in metric.items()
+        }
+
     @classmethod
     def gridsearch(
         model_class,
@@ -539,12 +926,20 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         last_points_only: bool = False,
         val_series: Optional[TimeSeries] = None,
         use_fitted_values: bool = False,
-        metric: Callable[[TimeSeries, TimeSeries], float] = metrics.mape,
+        metric: Union[
+            Callable[[TimeSeries, TimeSeries], float],
+            Sequence[Callable[[TimeSeries, TimeSeries], float]],
+            Dict[str, Callable[[TimeSeries, TimeSeries], float]],
+        ] = metrics.mape,
         reduction: Callable[[np.ndarray], float] = np.mean,
         verbose=False,
         n_jobs: int = 1,
         n_random_samples: Optional[Union[int, float]] = None,
-    ) -> Tuple["ForecastingModel", Dict]:
+        halving_factor: Optional[int] = None,
+        budget_parameter: Optional[str] = None,
+    ) -> Union[
+        Tuple["ForecastingModel", Dict], Tuple["ForecastingModel", Dict, pd.DataFrame]
+    ]:
         """
         Find the best hyper-parameters among a given set using a grid search.
 
@@ -576,6 +971,15 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
         member. The fitted values are the result of the fit of the model on `series`. Comparing with the
         fitted values can be a quick way to assess the model, but one cannot see if the model is overfitting the series.
 
+        Successive halving (activated when `halving_factor` is passed):
+        Instead of evaluating all the hyper-parameter combinations on the full budget, the combinations are first
+        evaluated on a small budget, and only the best ``1 / halving_factor`` of them are promoted to the next
+        round, whose budget is `halving_factor` times larger. The last round compares the remaining combinations on
+        the full budget. By default, the budget is the amount of data: in expanding window mode, only the most
+        recent forecasts of the backtest are evaluated; in the other modes, the models are only trained on the most
+        recent values of `series`. If `budget_parameter` is given, the budget instead scales this (integer) model
+        parameter, e.g. the number of training epochs `n_epochs` of neural networks.
+
         Derived classes must ensure that a single instance of a model will not share parameters with the other
         instances, e.g., saving models in the same path. Otherwise, an unexpected behavior can arise while running
         several models in parallel (when ``n_jobs != 1``). If this cannot be avoided, then gridsearch
@@ -615,7 +1019,10 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
             If `True`, uses the comparison with the fitted values.
             Raises an error if ``fitted_values`` is not an attribute of `model_class`.
         metric
-            A function that takes two TimeSeries instances as inputs and returns a float error value.
+            A function that takes two TimeSeries instances as inputs and returns a float error value. It can also be a
+            list of such functions, or a dictionary of them by name, which are all computed on the same forecasts (see
+            :func:`backtest`). The best hyper-parameters are then chosen according to the first metric, and the
+            scores of all metrics are returned as well.
         reduction
             A reduction function (mapping array to float) describing how to aggregate the errors obtained
             on the different validation series when backtesting. By default it'll compute the mean of errors.
@@ -632,12 +1039,22 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
             must be between `0` and the total number of parameter combinations.
             If a float, `n_random_samples` is the ratio of parameter combinations selected from the full grid and must
             be between `0` and `1`. Defaults to `None`, for which random selection will be ignored.
+        halving_factor
+            Optionally, the factor (at least `2`) by which the number of hyper-parameter combinations is divided, and
+            the budget is multiplied, at each round of a successive halving search.
+        budget_parameter
+            Optionally, the name of an integer parameter of `model_class` (present in `parameters`) that is scaled by
+            the budget of each round of a successive halving search, instead of the amount of data.
 
         Returns
         -------
         ForecastingModel, Dict
             A tuple containing an untrained `model_class` instance created from the best-performing hyper-parameters,
             along with a dictionary containing these best hyper-parameters.
+            With several metrics, the tuple also contains a DataFrame with one row per evaluated hyper-parameter
+            combination, holding the hyper-parameters and the scores of each metric. In a successive halving search,
+            these scores are those of the last round in which each combination was evaluated, whose budget is given
+            by a `budget` column.
         """
         raise_if_not(
             (forecast_horizon is not None)
@@ -663,6 +1080,16 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
                 logger,
             )
 
+        if halving_factor is not None:
+            raise_if_not(
+                halving_factor >= 2, "`halving_factor` must be at least 2.", logger
+            )
+            raise_if_not(
+                budget_parameter is None or budget_parameter in parameters,
+                "The `budget_parameter` must be one of the searched `parameters`.",
+                logger,
+            )
+
         # TODO: here too I'd say we can leave these checks to the models
         # if covariates is not None:
         #     raise_if_not(series.has_same_time_as(covariates), 'The provided series and covariates must have the '
@@ -677,29 +1104,47 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
                 params_cross_product, n_random_samples
             )
 
-        # iterate through all combinations of the provided parameters and choose the best one
-        iterator = _build_tqdm_iterator(
-            zip(params_cross_product), verbose, total=len(params_cross_product)
-        )
-
-        def _evaluate_combination(param_combination):
+        def _evaluate_combination(param_combination, budget: float = 1.0):
             param_combination_dict = dict(
                 list(zip(parameters.keys(), param_combination))
             )
+            if budget < 1 and budget_parameter is not None:
+                param_combination_dict[budget_parameter] = max(
+                    1, int(round(param_combination_dict[budget_parameter] * budget))
+                )
             model = model_class(**param_combination_dict)
+
+            train_series, eval_start = series, start
+            if budget < 1 and budget_parameter is None:
+                if use_fitted_values or val_series is not None:
+                    # only train on the most recent values
+                    n_train = max(
+                        int(np.ceil(budget * len(series))),
+                        model.min_train_series_length,
+                    )
+                    train_series = series[-n_train:]
+                else:
+                    # only evaluate the most recent forecasts
+                    pred_times = model._get_historical_forecasts_pred_times(
+                        series, start, forecast_horizon, stride, overlap_end=False
+                    )
+                    eval_start = pred_times[
+                        -max(1, int(np.ceil(budget * len(pred_times))))
+                    ]
+
             if use_fitted_values:  # fitted value mode
-                model._fit_wrapper(series, past_covariates, future_covariates)
+                model._fit_wrapper(train_series, past_covariates, future_covariates)
                 fitted_values = TimeSeries.from_times_and_values(
-                    series.time_index, model.fitted_values
+                    train_series.time_index, model.fitted_values
                 )
-                error = metric(fitted_values, series)
+                error = evaluate_metric(fitted_values, train_series)
             elif val_series is None:  # expanding window mode
                 error = model.backtest(
                     series=series,
                     past_covariates=past_covariates,
                     future_covariates=future_covariates,
                     num_samples=1,
-                    start=start,
+                    start=eval_start,
                     forecast_horizon=forecast_horizon,
                     stride=stride,
                     metric=metric,
@@ -707,29 +1152,96 @@ class ForecastingModel(ABC, metaclass=ModelMeta):
                     last_points_only=last_points_only,
                 )
             else:  # split mode
-                model._fit_wrapper(series, past_covariates, future_covariates)
+                model._fit_wrapper(train_series, past_covariates, future_covariates)
                 pred = model._predict_wrapper(
                     len(val_series),
-                    series,
+                    train_series,
                     past_covariates,
                     future_covariates,
                     num_samples=1,
                 )
-                error = metric(pred, val_series)
+                error = evaluate_metric(pred, val_series)
 
             return error
 
-        errors = _parallel_apply(iterator, _evaluate_combination, n_jobs, {}, {})
+        def evaluate_metric(series_a: TimeSeries, series_b: TimeSeries):
+            if single_metric:
+                return metric(series_a, series_b)
+            return pd.Series(
+                {
+                    name: values[0]
+                    for name, values in model_class._compute_metrics(
+                        [series_a], [series_b], metric
+                    ).items()
+                }
+            )
+
+        # with several metrics, the combinations are ranked by the first one
+        single_metric = callable(metric)
+        scores = {}
+
+        def ranking_errors(errors, candidates, budget):
+            if single_metric:
+                return errors
+            for idx, error in zip(candidates, errors):
+                scores[idx] = dict(
+                    zip(parameters.keys(), params_cross_product[idx]),
+                    **({} if halving_factor is None else {"budget": budget}),
+                    **error,
+                )
+            return [error.iloc[0] for error in errors]
 
-        min_error = min(errors)
+        if halving_factor is None:
+            # iterate through all combinations of the provided parameters and choose the best one
+            iterator = _build_tqdm_iterator(
+                zip(params_cross_product), verbose, total=len(params_cross_product)
+            )
+            errors = _parallel_apply(iterator, _evaluate_combination, n_jobs, {}, {})
+            errors = ranking_errors(errors, range(len(params_cross_product)), 1.0)
+            best_index = errors.index(min(errors))
+        else:
+            # successive halving: the number of rounds is such that the last one compares the remaining
+            # combinations on the full budget
+            n_rounds, n_remaining = 0, len(params_cross_product)
+            while n_remaining > 1:
+                n_remaining = int(np.ceil(n_remaining / halving_factor))
+                n_rounds += 1
+
+            candidates = list(range(len(params_cross_product)))
+            for round_idx in range(n_rounds):
+                budget = float(halving_factor) ** (round_idx + 1 - n_rounds)
+                iterator = _build_tqdm_iterator(
+                    zip(params_cross_product[idx] for idx in candidates),
+                    verbose,
+                    total=len(candidates),
+                )
+                errors = _parallel_apply(
+                    iterator, _evaluate_combination, n_jobs, (), {"budget": budget}
+                )
+                errors = ranking_errors(errors, candidates, budget)
+                # promote the best combinations to the next round
+                ranking = np.argsort(errors, kind="stable")
+                candidates = [
+                    candidates[idx]
+                    for idx in ranking[: int(np.ceil(len(candidates) / halving_factor))]
+                ]
+            best_index = candidates[0]
 
         best_param_combination = dict(
-            list(zip(parameters.keys(), params_cross_product[errors.index(min_error)]))
+            list(zip(parameters.keys(), params_cross_product[best_index]))
         )
 
         logger.info("Chosen parameters: " + str(best_param_combination))
 
-        return model_class(**best_param_combination), best_param_combination
+        if single_metric:
+            return model_class(**best_param_combination), best_param_combination
+
+        scores = pd.DataFrame([scores[idx] for idx in sorted(scores)])
+        return (
+            model_class(**best_param_combination),
+            best_param_combination,
+            scores,
+        )
 
     def residuals(
         self, series: TimeSeries, forecast_horizon: int = 1, verbose: bool = False
@@ -1047,6 +1559,72 @@ class DualCovariatesForecastingModel(ForecastingModel, ABC):
         """
         pass
 
+    def update(
+        self, series: TimeSeries, future_covariates: Optional[TimeSeries] = None
+    ):
+        """Update the fitted model with the new values of the provided series.
+
+        `series` must extend the series on which the model was last fitted (or updated): it has to start at the
+        same time, and contains some new values after the end of the training series. Models supporting incremental
+        updates only process these new values, starting from their current state; the other models are simply
+        fitted again on the whole `series`. Note that models re-estimating their parameters on update (such as
+        ``ARIMA`` and ``ExponentialSmoothing``) start the optimization from their current estimates, which can end
+        in a different local optimum than a fit from scratch.
+
+        Parameters
+        ----------
+        series
+            The extended training series.
+        future_covariates
+            A time series of future-known covariates, which must be provided if the model was trained with
+            some. It must contain at least the same time steps/indices as the target `series`.
+
+        Returns
+        -------
+        self
+            Updated model.
+        """
+        self._update_sanity_checks(series)
+        raise_if_not(
+            (future_covariates is not None) == self._expect_covariate,
+            "The `future_covariates` must be provided to `update()` if and only if the model was trained with "
+            "some.",
+            logger,
+        )
+
+        if future_covariates is not None:
+            if not series.has_same_time_as(future_covariates):
+                future_covariates = future_covariates.slice_intersect(series)
+
+            raise_if_not(
+                series.has_same_time_as(future_covariates),
+                "The provided `future_covariates` series must contain at least the same time steps/"
+                "indices as the target `series`.",
+                logger,
+            )
+
+        if not self._supports_update():
+            return self.fit(series, future_covariates=future_covariates)
+
+        n_old = len(self.training_series)
+        self.training_series = series
+        return self._update(
+            series.values(copy=False)[n_old:],
+            future_covariates=future_covariates.values(copy=False)[n_old:]
+            if future_covariates is not None
+            else None,
+        )
+
+    def _update(
+        self, new_values: np.ndarray, future_covariates: Optional[np.ndarray] = None
+    ):
+        """Updates the state of the model with `new_values`, which follow the end of its previous training series,
+        and with the matching values of the future covariates.
+        When this method is called, `self.training_series` already holds the extended training series.
+        DualCovariatesModels which support incremental updates must implement the update logic in this method.
+        """
+        raise NotImplementedError()
+
     def predict(
         self,
         n: int,
@@ -1133,6 +1711,14 @@ class DualCovariatesForecastingModel(ForecastingModel, ABC):
     ):
         self.fit(series, future_covariates=future_covariates)
 
+    def _update_wrapper(
+        self,
+        series: TimeSeries,
+        past_covariates: Optional[TimeSeries],
+        future_covariates: Optional[TimeSeries],
+    ):
+        self.update(series, future_covariates=future_covariates)
+
     def _predict_wrapper(
         self,
         n: int,
@@ -175,7 +175,7 @@ class _Block(nn.Module):
         batch_size = x.shape[0]
 
         # fully connected layer stack
-        for layer in self.linear_layer_stack_list:
+        for layer in self.fc_stack:
             x = self.relu(layer(x))
 
         # forked linear layers producing waveform generator parameters
@@ -286,7 +286,7 @@ class _Stack(nn.Module):
             dtype=x.dtype,
         )
 
-        for block in self.blocks_list:
+        for block in self.blocks:
             # pass input through block
             x_hat, y_hat = block(x)
 
@@ -435,7 +435,7 @@ class _NBEATSModule(nn.Module):
             dtype=x.dtype,
         )
 
-        for stack in self.stacks_list:
+        for stack in self.stacks:
             # compute stack output
             stack_residual, stack_forecast = stack(x)
 
@@ -586,6 +586,24 @@ class NBEATSModel(
             Whether or not to automatically save the untrained model and checkpoints from training.
             If set to `False`, the model can still be manually saved using :func:`save_model()`
             and loaded using :func:`load_model()`.
+        mixed_precision
+            Optionally, ``"bf16"`` or ``"fp16"`` to train the model with automatic mixed precision. This requires
+            float32 series, and is supported on CPU as well.
+        accumulate_grad_batches
+            The number of batches over which the gradients are accumulated before each optimizer step.
+        compile_model
+            Optionally, ``"compile"`` or ``"torchscript"`` to train with the network compiled by
+            ``torch.compile()`` or ``torch.jit.script()``.
+        early_stopping_patience
+            Optionally, the number of validation loss evaluations without improvement after which the training is
+            stopped.
+        early_stopping_min_delta
+            The minimum decrease of the validation loss counted as an improvement by early stopping.
+        restore_best_weights
+            Whether to restore the weights with the best validation loss at the end of the training.
+        checkpoint_state_dicts
+            If set (along with `save_checkpoints`), the checkpoints only contain state dicts, written by a background
+            thread.
 
         References
         ----------
@@ -26,6 +26,7 @@ denoting past lags and positive values including 0 denoting future lags).
 from typing import Union, Sequence, Optional, Tuple, List
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from darts.timeseries import TimeSeries
 from sklearn.linear_model import LinearRegression
@@ -33,6 +34,7 @@ from sklearn.multioutput import MultiOutputRegressor
 from darts.models.forecasting.forecasting_model import GlobalForecastingModel
 from darts.logging import raise_if, raise_if_not, get_logger, raise_log
 from darts.utils.data.inference_dataset import MixedCovariatesInferenceDataset
+from darts.utils.data.utils import _index_diff
 
 
 logger = get_logger(__name__)
@@ -85,6 +87,28 @@ def _update_min_max(
     return new_min, new_max
 
 
+def _lagged_windows(
+    values: np.ndarray, first: int, n_rows: int, lags: Sequence[int], stride: int = 1
+) -> np.ndarray:
+    """
+    Helper function that gathers lagged values of `values` (of shape (time, n_components)) without copying the
+    series, using a sliding window view over the positions spanned by the lags.
+
+    Returns an array of shape (n_rows, len(lags), n_components), where entry `[i, j]` holds the values at position
+    `first + i * stride + lags[j]`. Flattening the last two dimensions gives the lag-major column order used for
+    tabularization.
+    """
+    lags = np.asarray(lags)
+    min_lag, max_lag = lags.min(), lags.max()
+    span = max_lag - min_lag + 1
+    start = first + min_lag
+    # windows has shape (n_rows, n_components, span)
+    windows = sliding_window_view(
+        values[start : start + (n_rows - 1) * stride + span], span, axis=0
+    )[::stride]
+    return windows[:, :, lags - min_lag].transpose(0, 2, 1)
+
+
 class RegressionModel(GlobalForecastingModel):
     def __init__(
         self,
@@ -310,61 +334,121 @@ class RegressionModel(GlobalForecastingModel):
             else future_covariates
         )
 
-        Xs, ys = [], []
-        # iterate over series
+        # each group holds the series and the lags to extract from it, in column order
+        lags_future = (self.lags_historical_covariates or []) + (
+            self.lags_future_covariates or []
+        )
+        groups_per_series = []
         for idx, target_ts in enumerate(target_series):
-            covariates = [
-                (past_covariates[idx].pd_dataframe(), self.lags_past_covariates)
-                if past_covariates
-                else (None, None),
-                (
-                    future_covariates[idx].pd_dataframe(),
-                    (
-                        self.lags_historical_covariates
-                        if self.lags_historical_covariates
-                        else []
-                    )
-                    + (
-                        self.lags_future_covariates
-                        if self.lags_future_covariates
-                        else []
-                    ),
+            groups = [(target_ts, self.lags)]
+            if past_covariates:
+                groups.append((past_covariates[idx], self.lags_past_covariates))
+            if future_covariates:
+                groups.append((future_covariates[idx], lags_future))
+            groups_per_series.append([(ts, lags) for ts, lags in groups if lags])
+
+        # find, for every series, the range of target positions for which all lagged values are available
+        n_features = sum(len(lags) * ts.width for ts, lags in groups_per_series[0])
+        sample_ranges = []
+        for target_ts, groups in zip(target_series, groups_per_series):
+            first, last = 0, len(target_ts) - 1
+            offsets = []
+            for ts, lags in groups:
+                raise_if_not(
+                    ts.freq == target_ts.freq,
+                    "The target and covariate series must have the same frequency.",
+                    logger,
                 )
-                if future_covariates
-                else (None, None),
-            ]
-
-            df_X = []
-            df_y = target_ts.pd_dataframe()
+                # position of the first target time step in `ts`
+                offset = _index_diff(
+                    self=ts.start_time(), other=target_ts.start_time(), freq=ts.freq
+                )
+                offsets.append(offset)
+                # the sample time itself must also lie within `ts`
+                first = max(first, -offset - min(min(lags), 0))
+                last = min(last, len(ts) - 1 - offset - max(max(lags), 0))
 
-            # target lags
-            if self.lags:
-                for lag in self.lags:
-                    df_X.append(df_y.shift(-lag))
+            raise_if(
+                last < first,
+                "Unable to build any training samples; target and covariate series overlap too little.",
+                logger,
+            )
+            sample_ranges.append((first, last + 1, offsets))
+
+        def fill(X, y, target_ts, groups, first, n_rows, offsets):
+            col = 0
+            for (ts, lags), offset in zip(groups, offsets):
+                width = len(lags) * ts.width
+                X[:, col : col + width] = _lagged_windows(
+                    ts.values(copy=False), first + offset, n_rows, lags
+                ).reshape(n_rows, width)
+                col += width
+            y[:] = target_ts.values(copy=False)[first : first + n_rows]
+
+        # fill one preallocated matrix with the samples of all series
+        n_rows_per_series = [
+            last - first
+            if not max_samples_per_ts
+            else min(last - first, max_samples_per_ts)
+            for first, last, _ in sample_ranges
+        ]
+        dtype = np.result_type(
+            *[ts.dtype for ts in target_series],
+            *[ts.dtype for groups in groups_per_series for ts, _ in groups],
+        )
+        n_total = sum(n_rows_per_series)
+        # column-major, as the features are consumed column-wise by most regressors
+        X = np.empty((n_total, n_features), dtype=dtype, order="F")
+        y = np.empty((n_total, target_series[0].width), dtype=dtype)
+
+        row = 0
+        for target_ts, groups, (first, last, offsets), n_rows in zip(
+            target_series, groups_per_series, sample_ranges, n_rows_per_series
+        ):
+            fill(
+                X[row : row + n_rows],
+                y[row : row + n_rows],
+                target_ts,
+                groups,
+                last - n_rows,
+                n_rows,
+                offsets,
+            )
+            row += n_rows
 
-            # covariate lags
-            for df_cov, lags in covariates:
-                if lags:
-                    for lag in lags:
-                        df_X.append(df_cov.shift(-lag))
+        # samples containing missing values are discarded
+        valid = ~(np.isnan(X).any(axis=1) | np.isnan(y).any(axis=1))
+        if valid.all():
+            return X, y
 
-            # combine lags
-            df_X = pd.concat(df_X, axis=1)
-            df_X_y = pd.concat([df_X, df_y], axis=1)
-            X_y = df_X_y.dropna().values
+        Xs, ys = [], []
+        row = 0
+        for target_ts, groups, (first, last, offsets), n_rows in zip(
+            target_series, groups_per_series, sample_ranges, n_rows_per_series
+        ):
+            series_valid = valid[row : row + n_rows]
+            X_ts, y_ts = X[row : row + n_rows], y[row : row + n_rows]
+            if not series_valid.all() and n_rows < last - first:
+                # the most recent samples contained gaps; rebuild using all possible samples
+                X_ts = np.empty((last - first, n_features), dtype=dtype)
+                y_ts = np.empty((last - first, y.shape[1]), dtype=dtype)
+                fill(X_ts, y_ts, target_ts, groups, first, last - first, offsets)
+                series_valid = ~(
+                    np.isnan(X_ts).any(axis=1) | np.isnan(y_ts).any(axis=1)
+                )
+            X_ts, y_ts = X_ts[series_valid], y_ts[series_valid]
 
             # keep most recent max_samples_per_ts samples
             if max_samples_per_ts:
-                X_y = X_y[-max_samples_per_ts:]
+                X_ts, y_ts = X_ts[-max_samples_per_ts:], y_ts[-max_samples_per_ts:]
 
             raise_if(
-                X_y.shape[0] == 0,
+                X_ts.shape[0] == 0,
                 "Unable to build any training samples; target and covariate series overlap too little.",
             )
-
-            X, y = np.split(X_y, [df_X.shape[1]], axis=1)
-            Xs.append(X)
-            ys.append(y)
+            Xs.append(X_ts)
+            ys.append(y_ts)
+            row += n_rows
 
         # combine samples from all series
         X = np.concatenate(Xs, axis=0)
@@ -642,26 +726,37 @@ class RegressionModel(GlobalForecastingModel):
         lag_cov_X_dim_0 | lag_cov_X_dim_1 | .., that means, the lag X value of all the dimension of the covariate
         series (when multivariate).
         """
+        # the prediction matrix is allocated once and refilled at every step
+        matrices = [
+            (target_matrix, self.lags),
+            (past_covariates_matrix, self.lags_past_covariates),
+            (historic_future_covariates_matrix, self.lags_historical_covariates),
+            (future_covariates_matrix, self.lags_future_covariates),
+        ]
+        X = np.empty(
+            (
+                len(series),
+                sum(len(lags) * m.shape[2] for m, lags in matrices if lags is not None),
+            ),
+            dtype=np.result_type(*[m for m, lags in matrices if lags is not None]),
+        )
+
         for i in range(n):
             # building prediction matrix
-            X = []
-            if self.lags is not None:
-                target_series = target_matrix[:, self.lags]
-
-                X.append(target_series.reshape(len(series), -1))
-
-            covariates_matrices = [
+            matrices = [
+                (target_matrix, self.lags),
                 (past_covariates_matrix, self.lags_past_covariates),
                 (historic_future_covariates_matrix, self.lags_historical_covariates),
                 (future_covariates_matrix, self.lags_future_covariates),
             ]
 
-            for covariate_matrix, lags in covariates_matrices:
+            col = 0
+            for matrix, lags in matrices:
                 if lags is not None:
-                    covariates = covariate_matrix[:, lags]
-                    X.append(covariates.reshape(len(series), -1))
+                    width = len(lags) * matrix.shape[2]
+                    X[:, col : col + width] = matrix[:, lags].reshape(len(series), -1)
+                    col += width
 
-            X = np.concatenate(X, axis=1)
             prediction = self.model.predict(X, **kwargs)
             # reshape to (n_series, time (always 1), n_components)
             prediction = prediction.reshape(len(series), 1, -1)
@@ -706,5 +801,130 @@ class RegressionModel(GlobalForecastingModel):
 
         return predictions[0] if called_with_single_series else predictions
 
+    def _batched_historical_forecasts(
+        self,
+        series: TimeSeries,
+        past_covariates: Optional[TimeSeries],
+        future_covariates: Optional[TimeSeries],
+        pred_times: List[Union[pd.Timestamp, int]],
+        forecast_horizon: int,
+        stride: int,
+        num_samples: int,
+    ) -> Optional[np.ndarray]:
+        """
+        Computes all the historical forecasts of the fitted model at once: the prediction matrix of every forecast
+        step is built for all the prediction times in one go, and the predictions are fed back as target lags for
+        the next steps. Returns None whenever `predict()` would not accept the inputs, so that the regular code path
+        reports the problem.
+        """
+        covariates = [
+            (past_covariates, self.lags_past_covariates),
+            (
+                future_covariates,
+                (self.lags_historical_covariates or [])
+                + (self.lags_future_covariates or []),
+            ),
+        ]
+        if (
+            not self._fit_called
+            or num_samples != 1
+            or any((ts is None) != (not lags) for ts, lags in covariates)
+            or any(ts is not None and ts.freq != series.freq for ts, _ in covariates)
+        ):
+            return None
+
+        in_dim = sum(
+            ts.width
+            for ts in [series, past_covariates, future_covariates]
+            if ts is not None
+        )
+        if in_dim != self.input_dim:
+            return None
+
+        # positions of the first and last prediction times, and length requirements as in `predict()`
+        first = series.time_index.get_loc(pred_times[0])
+        last = first + (len(pred_times) - 1) * stride
+        input_length = max(0, -self.min_lag)
+        n = max(forecast_horizon + self.max_lag, forecast_horizon)
+        if first < input_length:
+            return None
+
+        # as in `predict()` (with `MixedCovariatesInferenceDataset` and `output_chunk_length=1`), the covariates must
+        # extend `max(0, n - 1)` (past) or `max(n, 1)` (future) time steps after the end of the last input series
+        input_end = last - 1
+        covariate_ends = [input_end + max(0, n - 1), input_end + max(n, 1)]
+
+        covariate_offsets = []
+        for (ts, lags), cov_end in zip(covariates, covariate_ends):
+            if ts is None:
+                covariate_offsets.append(None)
+                continue
+            # position of the first target time step in `ts`
+            offset = _index_diff(
+                self=ts.start_time(), other=series.start_time(), freq=series.freq
+            )
+            if first - input_length + offset < 0 or cov_end + offset >= len(ts):
+                return None
+            covariate_offsets.append(offset)
+
+        dtype = np.result_type(
+            *[
+                ts.dtype
+                for ts in [series, past_covariates, future_covariates]
+                if ts is not None
+            ]
+        )
+        # past target values of every forecast, followed by the predicted values
+        target = np.empty(
+            (len(pred_times), input_length + forecast_horizon, series.width),
+            dtype=dtype,
+        )
+        if input_length:
+            target[:, :input_length] = _lagged_windows(
+                series.values(copy=False),
+                first,
+                len(pred_times),
+                range(-input_length, 0),
+                stride,
+            )
+
+        X = np.empty(
+            (
+                len(pred_times),
+                sum(
+                    len(lags) * ts.width
+                    for ts, lags in [(series, self.lags)] + covariates
+                    if lags
+                ),
+            ),
+            dtype=dtype,
+        )
+        for step in range(forecast_horizon):
+            col = 0
+            if self.lags:
+                width = len(self.lags) * series.width
+                X[:, :width] = target[
+                    :, input_length + step + np.array(self.lags)
+                ].reshape(len(pred_times), width)
+                col = width
+
+            for (ts, lags), offset in zip(covariates, covariate_offsets):
+                if ts is not None:
+                    width = len(lags) * ts.width
+                    X[:, col : col + width] = _lagged_windows(
+                        ts.values(copy=False),
+                        first + offset + step,
+                        len(pred_times),
+                        lags,
+                        stride,
+                    ).reshape(len(pred_times), width)
+                    col += width
+
+            target[:, input_length + step] = self.model.predict(X).reshape(
+                len(pred_times), series.width
+            )
+
+        return target[:, input_length:, :, np.newaxis]
+
     def __str__(self):
         return self.model.__str__()
@@ -5,11 +5,13 @@ Recurrent Neural Networks
 
 import torch.nn as nn
 import torch
+import numpy as np
+from collections import OrderedDict
 from numpy.random import RandomState
-from typing import Sequence, Optional, Union, Tuple
+from typing import Hashable, List, Sequence, Optional, Union, Tuple
 from darts.timeseries import TimeSeries
 
-from darts.logging import raise_if_not, get_logger
+from darts.logging import raise_if, raise_if_not, get_logger
 from darts.models.forecasting.torch_forecasting_model import (
     TorchParametricProbabilisticForecastingModel,
     DualCovariatesTorchModel,
@@ -115,6 +117,7 @@ class RNNModel(TorchParametricProbabilisticForecastingModel, DualCovariatesTorch
         training_length: int = 24,
         likelihood: Optional[Likelihood] = None,
         random_state: Optional[Union[int, RandomState]] = None,
+        inference_cache_size: int = 10000,
         **kwargs
     ):
 
@@ -168,6 +171,9 @@ class RNNModel(TorchParametricProbabilisticForecastingModel, DualCovariatesTorch
         random_state
             Control the randomness of the weights initialization. Check this
             `link <https://scikit-learn.org/stable/glossary.html#term-random_state>`_ for more details.
+        inference_cache_size
+            The maximum number of series whose hidden state is kept by :func:`predict_incremental()`. The states of
+            the least recently predicted series are discarded first.
 
         batch_size
             Number of time series (input and output sequences) used in each training pass.
@@ -233,6 +239,24 @@ class RNNModel(TorchParametricProbabilisticForecastingModel, DualCovariatesTorch
             Whether or not to automatically save the untrained model and checkpoints from training.
             If set to `False`, the model can still be manually saved using :func:`save_model()`
             and loaded using :func:`load_model()`.
+        mixed_precision
+            Optionally, ``"bf16"`` or ``"fp16"`` to train the model with automatic mixed precision. This requires
+            float32 series, and is supported on CPU as well.
+        accumulate_grad_batches
+            The number of batches over which the gradients are accumulated before each optimizer step.
+        compile_model
+            Optionally, ``"compile"`` or ``"torchscript"`` to train with the network compiled by
+            ``torch.compile()`` or ``torch.jit.script()``.
+        early_stopping_patience
+            Optionally, the number of validation loss evaluations without improvement after which the training is
+            stopped.
+        early_stopping_min_delta
+            The minimum decrease of the validation loss counted as an improvement by early stopping.
+        restore_best_weights
+            Whether to restore the weights with the best validation loss at the end of the training.
+        checkpoint_state_dicts
+            If set (along with `save_checkpoints`), the checkpoints only contain state dicts, written by a background
+            thread.
         """
 
         kwargs["input_chunk_length"] = input_chunk_length
@@ -256,6 +280,14 @@ class RNNModel(TorchParametricProbabilisticForecastingModel, DualCovariatesTorch
         self.n_rnn_layers = n_rnn_layers
         self.training_length = training_length
 
+        raise_if_not(
+            inference_cache_size > 0,
+            "`inference_cache_size` must be a positive integer.",
+            logger,
+        )
+        self.inference_cache_size = inference_cache_size
+        self._inference_cache = None
+
     def _create_model(self, train_sample: Tuple[torch.Tensor]) -> torch.nn.Module:
         # samples are made of (past_target, historic_future_covariates, future_covariates, future_target)
         # historic_future_covariates and future_covariates have the same width
@@ -354,9 +386,21 @@ class RNNModel(TorchParametricProbabilisticForecastingModel, DualCovariatesTorch
             input_series = past_target
             cov_future = None
 
-        batch_prediction = []
         out, last_hidden_state = self._produce_predict_output(input_series)
-        batch_prediction.append(out[:, -1:, :])
+        return self._roll_out(n, out, last_hidden_state, cov_future)
+
+    def _roll_out(
+        self,
+        n: int,
+        out: torch.Tensor,
+        last_hidden_state,
+        cov_future: Optional[torch.Tensor],
+    ) -> torch.Tensor:
+        """
+        Auto-regressively forecasts `n` values, from the output and hidden state of the last input step and
+        the covariates of the next steps.
+        """
+        batch_prediction = [out[:, -1:, :]]
         prediction_length = 1
 
         while prediction_length < n:
@@ -388,3 +432,247 @@ class RNNModel(TorchParametricProbabilisticForecastingModel, DualCovariatesTorch
         batch_prediction = batch_prediction[:, :n, :]
 
         return batch_prediction
+
+    @random_method
+    def predict_incremental(
+        self,
+        n: int,
+        series: Union[TimeSeries, Sequence[TimeSeries]],
+        series_ids: Union[Hashable, Sequence[Hashable]],
+        future_covariates: Optional[Union[TimeSeries, Sequence[TimeSeries]]] = None,
+        num_samples: int = 1,
+        max_state_length: Optional[int] = None,
+    ) -> Union[TimeSeries, Sequence[TimeSeries]]:
+        """Forecasts the next `n` time steps of some streamed series, by advancing their cached hidden states.
+
+        :func:`predict()` runs the RNN over the last `input_chunk_length` points of each series, from an
+        initial state. In a streaming setting, where a few new points of each series arrive between consecutive
+        forecasts, this method instead keeps the hidden state of each series (identified by its id) after its last
+        observed points, and only feeds the points which arrived since its previous call before rolling out the
+        forecast.
+
+        The state of a series is (re)built from its last `input_chunk_length` points (as :func:`predict()` does)
+        on its first forecast, when more than `input_chunk_length` points arrived since its previous forecast, when
+        its previous last point is not part of `series` anymore, or when the state would summarize more than
+        `max_state_length` points. As the cached states summarize more points than the input chunks, the forecasts
+        generally differ from those of :func:`predict()`.
+
+        At most `inference_cache_size` states are kept, and the cache is cleared when the model is trained again.
+
+        Parameters
+        ----------
+        n
+            The number of time steps after the end of the series for which to produce predictions.
+        series
+            The series (or sequence of series) to forecast, containing at least their last `input_chunk_length`
+            points, and the points observed since their previous forecast.
+        series_ids
+            The id (or sequence of ids, one per series) of the series, under which their states are cached.
+        future_covariates
+            Optionally, the future-known covariates of the series, if the model was trained with future covariates.
+            They must extend `n` time steps after the end of the series.
+        num_samples
+            Number of times a prediction is sampled from a probabilistic model. Should be left set to 1
+            for deterministic models.
+        max_state_length
+            The maximum number of points summarized by the states. By default, the `training_length` of the model
+            (the length of the sequences it was trained on), or `input_chunk_length` if it is larger.
+
+        Returns
+        -------
+        Union[TimeSeries, Sequence[TimeSeries]]
+            The forecast of each series.
+        """
+        raise_if(
+            self.model is None,
+            "The model must be fitted before calling `predict_incremental()`.",
+            logger,
+        )
+        raise_if_not(n > 0, "`n` must be a positive integer.", logger)
+        raise_if_not(
+            num_samples > 0, "`num_samples` must be a positive integer.", logger
+        )
+
+        called_with_single_series = isinstance(series, TimeSeries)
+        if called_with_single_series:
+            series, series_ids = [series], [series_ids]
+        if isinstance(future_covariates, TimeSeries):
+            future_covariates = [future_covariates]
+        raise_if_not(
+            len(series_ids) == len(series),
+            "There must be one id for each series.",
+            logger,
+        )
+
+        if self.encoders.encoding_available:
+            _, future_covariates = self.encoders.encode_inference(
+                n=n,
+                target=series,
+                past_covariate=None,
+                future_covariate=future_covariates,
+            )
+        uses_covariates = self.train_sample[1] is not None
+        raise_if_not(
+            uses_covariates == (future_covariates is not None),
+            "The model was trained with future covariates; they must be provided."
+            if uses_covariates
+            else "The model was trained without future covariates.",
+            logger,
+        )
+
+        # the states of a previous training of the network are not valid anymore
+        model_version = (self.model, self.total_epochs)
+        if self._inference_cache is None or self._inference_cache[0] != model_version:
+            self._inference_cache = (model_version, OrderedDict())
+        cache = self._inference_cache[1]
+        max_state_length = (
+            max(self.training_length, self.input_chunk_length)
+            if max_state_length is None
+            else max_state_length
+        )
+        raise_if_not(
+            max_state_length >= self.input_chunk_length,
+            "`max_state_length` must be at least `input_chunk_length`.",
+            logger,
+        )
+
+        # the series are grouped by their number of new points, and whether their state is rebuilt
+        groups = {}
+        for idx, (ts, series_id) in enumerate(zip(series, series_ids)):
+            raise_if(
+                len(ts) < self.input_chunk_length,
+                "All series must have at least `input_chunk_length` points.",
+                logger,
+            )
+            n_new, cached = None, cache.get(series_id)
+            if cached is not None:
+                try:
+                    # the new points, followed by the last point
+                    n_new = len(ts) - 2 - ts._time_index.get_loc(cached[0])
+                except KeyError:
+                    pass
+                if n_new is not None and (
+                    not (0 <= n_new < self.input_chunk_length)
+                    or cached[1] + n_new + 1 > max_state_length
+                ):
+                    n_new = None
+            if n_new is None:
+                group = (True, self.input_chunk_length - 1)
+            else:
+                group = (False, n_new)
+            groups.setdefault(group, []).append(idx)
+
+        dtype = next(self.model.parameters()).dtype
+        predictions = [None] * len(series)
+        self.model.eval()
+        with torch.no_grad():
+            for (rebuild, n_new), indices in groups.items():
+                # the new points and the last point of the series, with the covariates of their next time steps
+                inputs = np.stack(
+                    [series[idx].values(copy=False)[-n_new - 1 :] for idx in indices]
+                )
+                if uses_covariates:
+                    covariates = np.stack(
+                        [
+                            _future_covariate_values(
+                                series[idx], future_covariates[idx], n_new, n
+                            )
+                            for idx in indices
+                        ]
+                    )
+                    inputs = np.concatenate(
+                        [inputs, covariates[:, : n_new + 1]], axis=2
+                    )
+                inputs = torch.tensor(inputs, dtype=dtype, device=self.device)
+
+                if rebuild:
+                    state = None
+                else:
+                    state = _cat_states([cache[series_ids[idx]][2] for idx in indices])
+                    state_lengths = [cache[series_ids[idx]][1] for idx in indices]
+                if n_new > 0:
+                    _, state = self.model(inputs[:, :n_new], state)
+
+                # cache the states after the points preceding the last one, which is fed at every forecast
+                for position, idx in enumerate(indices if state is not None else []):
+                    cache[series_ids[idx]] = (
+                        series[idx]._time_index[-2],
+                        n_new + (0 if rebuild else state_lengths[position]),
+                        _select_state(state, position),
+                    )
+                    cache.move_to_end(series_ids[idx])
+
+                cov_future = None
+                if uses_covariates:
+                    cov_future = torch.tensor(
+                        covariates[:, n_new + 1 :], dtype=dtype, device=self.device
+                    ).tile((num_samples, 1, 1))
+
+                # all the samples are rolled out in a single batch
+                last_input = inputs[:, n_new:].tile((num_samples, 1, 1))
+                if state is not None:
+                    state = _tile_state(state, num_samples)
+                out, state = self._produce_predict_output(last_input, state)
+                batch_prediction = self._roll_out(n, out, state, cov_future)
+                batch_prediction = (
+                    batch_prediction.reshape(
+                        (num_samples, len(indices)) + batch_prediction.shape[1:]
+                    )
+                    .cpu()
+                    .numpy()
+                )
+                for position, idx in enumerate(indices):
+                    predictions[idx] = self._build_forecast_series(
+                        list(batch_prediction[:, position]), series[idx]
+                    )
+
+        while len(cache) > self.inference_cache_size:
+            cache.popitem(last=False)
+
+        return predictions[0] if called_with_single_series else predictions
+
+    def __getstate__(self):
+        # the cached inference states are not saved with the model
+        state = super().__getstate__()
+        state["_inference_cache"] = None
+        return state
+
+
+def _future_covariate_values(
+    series: TimeSeries, covariates: TimeSeries, n_new: int, n: int
+) -> np.ndarray:
+    """Returns the values of the future covariates fed along the last `n_new + 1` points of `series` (the covariates
+    of the next time steps), followed by those of the `n - 1` next steps of the forecast."""
+    try:
+        end = covariates._time_index.get_loc(series.end_time())
+    except KeyError:
+        end = None
+    raise_if(
+        end is None or end - n_new < 0 or end + n >= len(covariates),
+        "The future covariates must extend from the time step following the first new point of the series, "
+        "to `n` time steps after the end of the series.",
+        logger,
+    )
+    return covariates.values(copy=False)[end - n_new + 1 : end + n + 1]
+
+
+def _select_state(state, position: int):
+    """Returns the hidden state of one series of a batch, which is a tensor (or a tuple of tensors for LSTMs) of
+    shape (num_layers, batch_size, hidden_dim)."""
+    if isinstance(state, torch.Tensor):
+        return state[:, position : position + 1].clone()
+    return tuple(_select_state(tensor, position) for tensor in state)
+
+
+def _cat_states(states: List):
+    """Concatenates the hidden states of several series into the state of a batch."""
+    if isinstance(states[0], torch.Tensor):
+        return torch.cat(states, dim=1)
+    return tuple(_cat_states(list(tensors)) for tensors in zip(*states))
+
+
+def _tile_state(state, num_samples: int):
+    """Repeats the hidden state of a batch for each sample."""
+    if isinstance(state, torch.Tensor):
+        return state.tile((1, num_samples, 1))
+    return tuple(_tile_state(tensor, num_samples) for tensor in state)
@@ -107,8 +107,8 @@ class _ResidualBlock(nn.Module):
         residual = x
 
         # first step
-        left_padding = (self.dilation_base ** self.nr_blocks_below) * (
-            self.kernel_size - 1
+        left_padding = int(
+            (self.dilation_base ** self.nr_blocks_below) * (self.kernel_size - 1)
         )
         x = F.pad(x, (left_padding, 0))
         x = self.dropout_fn(F.relu(self.conv1(x)))
@@ -238,7 +238,7 @@ class _TCNModule(nn.Module):
         batch_size = x.size(0)
         x = x.transpose(1, 2)
 
-        for res_block in self.res_blocks_list:
+        for res_block in self.res_blocks:
             x = res_block(x)
 
         x = x.transpose(1, 2)
@@ -361,6 +361,24 @@ class TCNModel(TorchParametricProbabilisticForecastingModel, PastCovariatesTorch
             Whether or not to automatically save the untrained model and checkpoints from training.
             If set to `False`, the model can still be manually saved using :func:`save_model()`
             and loaded using :func:`load_model()`.
+        mixed_precision
+            Optionally, ``"bf16"`` or ``"fp16"`` to train the model with automatic mixed precision. This requires
+            float32 series, and is supported on CPU as well.
+        accumulate_grad_batches
+            The number of batches over which the gradients are accumulated before each optimizer step.
+        compile_model
+            Optionally, ``"compile"`` or ``"torchscript"`` to train with the network compiled by
+            ``torch.compile()`` or ``torch.jit.script()``.
+        early_stopping_patience
+            Optionally, the number of validation loss evaluations without improvement after which the training is
+            stopped.
+        early_stopping_min_delta
+            The minimum decrease of the validation loss counted as an improvement by early stopping.
+        restore_best_weights
+            Whether to restore the weights with the best validation loss at the end of the training.
+        checkpoint_state_dicts
+            If set (along with `save_checkpoints`), the checkpoints only contain state dicts, written by a background
+            thread.
 
         References
         ----------
@@ -698,6 +698,24 @@ class TFTModel(TorchParametricProbabilisticForecastingModel, MixedCovariatesTorc
             Whether or not to automatically save the untrained model and checkpoints from training.
             If set to `False`, the model can still be manually saved using :func:`save_model()`
             and loaded using :func:`load_model()`.
+        mixed_precision
+            Optionally, ``"bf16"`` or ``"fp16"`` to train the model with automatic mixed precision. This requires
+            float32 series, and is supported on CPU as well.
+        accumulate_grad_batches
+            The number of batches over which the gradients are accumulated before each optimizer step.
+        compile_model
+            Optionally, ``"compile"`` or ``"torchscript"`` to train with the network compiled by
+            ``torch.compile()`` or ``torch.jit.script()``.
+        early_stopping_patience
+            Optionally, the number of validation loss evaluations without improvement after which the training is
+            stopped.
+        early_stopping_min_delta
+            The minimum decrease of the validation loss counted as an improvement by early stopping.
+        restore_best_weights
+            Whether to restore the weights with the best validation loss at the end of the training.
+        checkpoint_state_dicts
+            If set (along with `save_checkpoints`), the checkpoints only contain state dicts, written by a background
+            thread.
 
         References
         ----------
@@ -969,114 +987,54 @@ class TFTModel(TorchParametricProbabilisticForecastingModel, MixedCovariatesTorc
             else 0
         )
 
-        input_past = torch.cat(
-            [
-                ds
-                for ds in [past_target, past_covariates, historic_future_covariates]
-                if ds is not None
-            ],
-            dim=dim_component,
-        )
-
-        input_future = (
-            future_covariates[:, :roll_size, :]
-            if future_covariates is not None
-            else None
-        )
-
-        out = self._produce_predict_output(
-            x=(past_target, past_covariates, historic_future_covariates, input_future)
-        )[:, self.first_prediction_index :, :]
-
-        batch_prediction = [out[:, :roll_size, :]]
-        prediction_length = roll_size
-
-        while prediction_length < n:
-            # we want the last prediction to end exactly at `n` into the future.
-            # this means we may have to truncate the previous prediction and step
-            # back the roll size for the last chunk
-            if prediction_length + self.output_chunk_length > n:
-                spillover_prediction_length = (
-                    prediction_length + self.output_chunk_length - n
-                )
-                roll_size -= spillover_prediction_length
-                prediction_length -= spillover_prediction_length
-                batch_prediction[-1] = batch_prediction[-1][:, :roll_size, :]
-
-            # ==========> PAST INPUT <==========
-            # roll over input series to contain latest target and covariate
-            input_past = torch.roll(input_past, -roll_size, 1)
-
-            # update target input to include next `roll_size` predictions
-            if self.input_chunk_length >= roll_size:
-                input_past[:, -roll_size:, :n_targets] = out[:, :roll_size, :]
-            else:
-                input_past[:, :, :n_targets] = out[:, -self.input_chunk_length :, :]
-
-            # set left and right boundaries for extracting future elements
-            if self.input_chunk_length >= roll_size:
-                left_past, right_past = prediction_length - roll_size, prediction_length
-            else:
-                left_past, right_past = (
-                    prediction_length - self.input_chunk_length,
-                    prediction_length,
-                )
-
-            # update past covariates to include next `roll_size` future past covariates elements
-            if n_past_covs and self.input_chunk_length >= roll_size:
-                input_past[
-                    :, -roll_size:, n_targets : n_targets + n_past_covs
-                ] = future_past_covariates[:, left_past:right_past, :]
-            elif n_past_covs:
-                input_past[
-                    :, :, n_targets : n_targets + n_past_covs
-                ] = future_past_covariates[:, left_past:right_past, :]
-
-            # update historic future covariates to include next `roll_size` future covariates elements
-            if n_future_covs and self.input_chunk_length >= roll_size:
-                input_past[
-                    :, -roll_size:, n_targets + n_past_covs :
-                ] = future_covariates[:, left_past:right_past, :]
-            elif n_future_covs:
-                input_past[:, :, n_targets + n_past_covs :] = future_covariates[
-                    :, left_past:right_past, :
-                ]
-
-            # ==========> FUTURE INPUT <==========
-            left_future, right_future = (
-                right_past,
-                right_past + self.output_chunk_length,
-            )
-            # update future covariates to include next `roll_size` future covariates elements
-            if n_future_covs:
-                input_future = future_covariates[:, left_future:right_future, :]
-
-            # convert back into separate datasets
-            input_past_target = input_past[:, :, :n_targets]
-            input_past_covs = (
-                input_past[:, :, n_targets : n_targets + n_past_covs]
-                if n_past_covs
-                else None
-            )
-            input_historic_future_covs = (
-                input_past[:, :, n_targets + n_past_covs :] if n_future_covs else None
+        # the input chunk followed by the forecast horizon, where the predictions are written
+        history = past_target.new_empty(
+            (
+                past_target.shape[0],
+                self.input_chunk_length + n,
+                n_targets + n_past_covs + n_future_covs,
             )
-            input_future_covs = input_future if n_future_covs else None
-
-            # take only last part of the output sequence where needed
-            out = self._produce_predict_output(
+        )
+        history[:, : self.input_chunk_length, :n_targets] = past_target
+        if n_past_covs:
+            history[
+                :, : self.input_chunk_length, n_targets : n_targets + n_past_covs
+            ] = past_covariates
+            if future_past_covariates is not None:
+                n_future = min(future_past_covariates.shape[1], n)
+                history[
+                    :,
+                    self.input_chunk_length : self.input_chunk_length + n_future,
+                    n_targets : n_targets + n_past_covs,
+                ] = future_past_covariates[:, :n_future]
+        if n_future_covs:
+            n_future = min(future_covariates.shape[1], n)
+            history[
+                :, : self.input_chunk_length, n_targets + n_past_covs :
+            ] = historic_future_covariates
+            history[
+                :,
+                self.input_chunk_length : self.input_chunk_length + n_future,
+                n_targets + n_past_covs :,
+            ] = future_covariates[:, :n_future]
+
+        def produce_output(start: int) -> torch.Tensor:
+            input_past = history[:, start : start + self.input_chunk_length]
+            return self._produce_predict_output(
                 x=(
-                    input_past_target,
-                    input_past_covs,
-                    input_historic_future_covs,
-                    input_future_covs,
+                    input_past[:, :, :n_targets],
+                    input_past[:, :, n_targets : n_targets + n_past_covs]
+                    if n_past_covs
+                    else None,
+                    input_past[:, :, n_targets + n_past_covs :]
+                    if n_future_covs
+                    else None,
+                    future_covariates[:, start : start + self.output_chunk_length]
+                    if n_future_covs
+                    else None,
                 )
             )[:, self.first_prediction_index :, :]
 
-            batch_prediction.append(out)
-            prediction_length += self.output_chunk_length
-
-        # bring predictions into desired format and drop unnecessary values
-        batch_prediction = torch.cat(batch_prediction, dim=1)
-        batch_prediction = batch_prediction[:, :n, :]
-        return batch_prediction
+        return self._roll_out_prediction(
+            n, roll_size, history, n_targets, produce_output
+        )
@@ -18,17 +18,33 @@ This file contains several abstract classes:
 """
 
 import numpy as np
+import pandas as pd
 import os
 import re
 from glob import glob
 import shutil
-from joblib import Parallel, delayed
-from typing import Optional, Dict, Tuple, Union, Sequence, List
+import copy
+import pickle
+import socket
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Callable, Optional, Dict, Tuple, Union, Sequence, List
 from abc import ABC, abstractmethod
 import torch
 from torch import Tensor
 import torch.nn as nn
-from torch.utils.data import DataLoader
+import torch.distributed as dist
+import torch.multiprocessing as mp
+from torch.nn.parallel import DistributedDataParallel
+from torch.utils.data import (
+    DataLoader,
+    BatchSampler,
+    RandomSampler,
+    Sampler,
+    SequentialSampler,
+)
+from torch.utils.data.distributed import DistributedSampler
 from torch.utils.tensorboard import SummaryWriter
 import datetime
 
@@ -43,6 +59,7 @@ from darts.utils.data.training_dataset import (
     DualCovariatesTrainingDataset,
     MixedCovariatesTrainingDataset,
     SplitCovariatesTrainingDataset,
+    _TensorizedBatches,
 )
 from darts.utils.data.inference_dataset import (
     InferenceDataset,
@@ -60,6 +77,7 @@ from darts.utils.data.sequential_dataset import (
     SplitCovariatesSequentialDataset,
 )
 from darts.utils.data.encoders import SequentialEncoder
+from darts.utils.bulk_io import ForecastArray
 
 from darts.utils.likelihood_models import Likelihood
 from darts.logging import raise_if_not, get_logger, raise_log, raise_if
@@ -101,6 +119,13 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         force_reset: bool = False,
         save_checkpoints: bool = False,
         add_encoders: Optional[Dict] = None,
+        mixed_precision: Optional[str] = None,
+        accumulate_grad_batches: int = 1,
+        compile_model: Optional[str] = None,
+        early_stopping_patience: Optional[int] = None,
+        early_stopping_min_delta: float = 0.0,
+        restore_best_weights: bool = False,
+        checkpoint_state_dicts: bool = False,
     ):
 
         """Pytorch-based Forecasting Model.
@@ -159,9 +184,67 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
             Whether or not to automatically save the untrained model and checkpoints from training.
             If set to `False`, the model can still be manually saved using :func:`save_model()`
             and loaded using :func:`load_model()`.
+        mixed_precision
+            Optionally, ``"bf16"`` or ``"fp16"`` to train the model with automatic mixed precision, i.e. to run the
+            forward pass in bfloat16 or float16 where possible. Float16 training uses a gradient scaler to prevent
+            the underflow of small gradients. This requires float32 series, and is supported on CPU as well.
+        accumulate_grad_batches
+            The number of batches over which the gradients are accumulated before each optimizer step. This trains
+            with an effective batch size of ``batch_size * accumulate_grad_batches`` with the memory of `batch_size`.
+        compile_model
+            Optionally, ``"compile"`` to train with the network compiled by ``torch.compile()``, or
+            ``"torchscript"`` to train with the network compiled by ``torch.jit.script()``. The compiled network
+            shares its weights with the model, and is only used for training. If the network cannot be scripted,
+            a warning is logged and it is trained eagerly.
+        early_stopping_patience
+            Optionally, the number of validation loss evaluations (every `nr_epochs_val_period` epochs) without an
+            improvement of at least `early_stopping_min_delta` after which the training is stopped. Early stopping
+            only applies when training with a validation set.
+        early_stopping_min_delta
+            The minimum decrease of the validation loss counted as an improvement by early stopping.
+        restore_best_weights
+            Whether to restore the weights of the network with the best validation loss at the end of the training.
+            The best weights are kept in memory during the training, which requires a validation set.
+        checkpoint_state_dicts
+            If set (along with `save_checkpoints`), the checkpoints only contain the state dicts of the network,
+            optimizer and learning rate scheduler, and are written to disk by a background thread so that the training
+            loop does not wait for them. They are loaded with :func:`load_weights_from_checkpoint()`.
         """
         super().__init__()
 
+        raise_if_not(
+            mixed_precision in (None, "bf16", "fp16"),
+            "`mixed_precision` must be one of None, 'bf16' or 'fp16'.",
+            logger,
+        )
+        raise_if_not(
+            accumulate_grad_batches >= 1,
+            "`accumulate_grad_batches` must be at least 1.",
+            logger,
+        )
+        raise_if_not(
+            compile_model in (None, "compile", "torchscript"),
+            "`compile_model` must be one of None, 'compile' or 'torchscript'.",
+            logger,
+        )
+        raise_if(
+            compile_model == "compile" and not hasattr(torch, "compile"),
+            "`compile_model='compile'` requires PyTorch 2.0 or later.",
+            logger,
+        )
+        raise_if_not(
+            early_stopping_patience is None or early_stopping_patience >= 1,
+            "`early_stopping_patience` must be at least 1.",
+            logger,
+        )
+        self.mixed_precision = mixed_precision
+        self.accumulate_grad_batches = accumulate_grad_batches
+        self.compile_model = compile_model
+        self.early_stopping_patience = early_stopping_patience
+        self.early_stopping_min_delta = early_stopping_min_delta
+        self.restore_best_weights = restore_best_weights
+        self.checkpoint_state_dicts = checkpoint_state_dicts
+
         if torch_device_str is None:
             self.device = self._get_best_torch_device()
         else:
@@ -188,6 +271,9 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         self.total_epochs = 0  # 0 means it wasn't trained yet.
         self.batch_size = batch_size
 
+        # whether the model is being trained by several processes, with `fit_distributed()`
+        self._distributed = False
+
         # Define the loss function
         self.criterion = loss_fn
 
@@ -236,6 +322,44 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         """
         return self.input_chunk_length + self.output_chunk_length
 
+    def _build_data_loader(
+        self,
+        dataset: TrainingDataset,
+        shuffle: bool,
+        num_loader_workers: int,
+        sampler: Optional[Sampler] = None,
+    ) -> DataLoader:
+        """
+        Returns the ``DataLoader`` of a training or validation dataset, drawing the samples from `sampler` if
+        specified. The batches of tensorized datasets are gathered at once from the positions yielded by a batch
+        sampler, and the other datasets are collated sample by sample.
+        """
+        # Setting drop_last to False makes the model see each sample at least once, and guarantee the presence of at
+        # least one batch no matter the chosen batch size
+        if dataset.is_tensorized:
+            if sampler is None:
+                sampler = (
+                    RandomSampler(dataset) if shuffle else SequentialSampler(dataset)
+                )
+            return DataLoader(
+                _TensorizedBatches(dataset),
+                batch_size=None,
+                sampler=BatchSampler(sampler, self.batch_size, drop_last=False),
+                num_workers=num_loader_workers,
+                pin_memory=True,
+                collate_fn=tuple,
+            )
+        return DataLoader(
+            dataset,
+            batch_size=self.batch_size,
+            shuffle=shuffle and sampler is None,
+            sampler=sampler,
+            num_workers=num_loader_workers,
+            pin_memory=True,
+            drop_last=False,
+            collate_fn=self._batch_collate_fn,
+        )
+
     def _batch_collate_fn(self, batch: List[Tuple]) -> Tuple:
         """
         Returns a batch Tuple from a list of samples
@@ -395,6 +519,51 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         """
         pass
 
+    def _roll_out_prediction(
+        self,
+        n: int,
+        roll_size: int,
+        history: Tensor,
+        n_targets: int,
+        produce_output: Callable[[int], Tensor],
+    ) -> Tensor:
+        """
+        Auto-regressively forecasts the next `n` target values of a batch, writing the predictions in place in a
+        preallocated buffer instead of rolling and concatenating new tensors at each step.
+
+        Parameters
+        ----------
+        n
+            prediction length
+        roll_size
+            number of predicted values fed back into the model at each step. The last step is moved back so that
+            its output chunk ends exactly at `n`.
+        history
+            tensor of shape (batch, input_chunk_length + n, components), holding the input chunk followed by the
+            forecast horizon. The first `n_targets` components are the targets, whose values in the horizon are
+            written by the roll-out, and the other components are covariates already filled in the horizon.
+        n_targets
+            number of target components
+        produce_output
+            function returning the output chunk predicted from the input chunk starting at the given position of
+            `history` (i.e. ending at this position of the horizon)
+
+        Returns
+        -------
+        Tensor
+            the predicted targets, of shape (batch, n, n_targets)
+        """
+        predictions = history[:, self.input_chunk_length :, :n_targets]
+        start = 0
+        while True:
+            out = produce_output(start)
+            if start + self.output_chunk_length >= n:
+                predictions[:, start:] = out[:, : n - start]
+                return predictions
+            next_start = min(start + roll_size, n - self.output_chunk_length)
+            predictions[:, start:next_start] = out[:, : next_start - start]
+            start = next_start
+
     @random_method
     def fit(
         self,
@@ -408,6 +577,7 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         epochs: int = 0,
         max_samples_per_ts: Optional[int] = None,
         num_loader_workers: int = 0,
+        tensorize: bool = False,
     ):
         """Fit/train the model on one or multiple series.
 
@@ -457,6 +627,11 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
             both for the training and validation loaders (if any).
             A larger number of workers can sometimes increase performance, but can also incur extra overheads
             and increase memory usage, as more batches are loaded in parallel.
+        tensorize
+            Whether to tensorize the training and validation datasets (see :func:`TrainingDataset.tensorize()`).
+            The values of all the series are then held in contiguous tensors, and whole batches are gathered at
+            once instead of being sliced sample by sample, which removes most of the data loading overhead when
+            training on many samples.
 
         Returns
         -------
@@ -547,6 +722,11 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
 
         logger.info("Train dataset contains {} samples.".format(len(train_dataset)))
 
+        if tensorize:
+            train_dataset.tensorize()
+            if val_dataset is not None:
+                val_dataset.tensorize()
+
         return self.fit_from_dataset(
             train_dataset, val_dataset, verbose, epochs, num_loader_workers
         )
@@ -585,6 +765,7 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         verbose: bool = False,
         epochs: int = 0,
         num_loader_workers: int = 0,
+        sampler: Optional[Sampler] = None,
     ):
         """
         Train the model with a specific :class:`darts.utils.data.TrainingDataset` instance.
@@ -595,6 +776,9 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         This function can be called several times to do some extra training. If `epochs` is specified, the model
         will be trained for some (extra) `epochs` epochs.
 
+        The batches of datasets tensorized with :func:`TrainingDataset.tensorize()` are gathered at once from the
+        sample positions yielded by a batch sampler, instead of being sliced and collated sample by sample.
+
         Parameters
         ----------
         train_dataset
@@ -613,6 +797,10 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
             both for the training and validation loaders (if any).
             A larger number of workers can sometimes increase performance, but can also incur extra overheads
             and increase memory usage, as more batches are loaded in parallel.
+        sampler
+            Optionally, a torch ``Sampler`` yielding the positions of the training samples of each epoch, such as a
+            :class:`darts.utils.data.WindowSampler` drawing the distinct windows of the series with weighted
+            probabilities. By default, each epoch goes through all the samples of `train_dataset` in random order.
 
         Returns
         -------
@@ -661,41 +849,57 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
                 ),
             )
 
-        # Setting drop_last to False makes the model see each sample at least once, and guarantee the presence of at
-        # least one batch no matter the chosen batch size
-        train_loader = DataLoader(
+        if self._distributed:
+            raise_if(
+                sampler is not None,
+                "Custom samplers are not supported by distributed training.",
+                logger,
+            )
+            # each process trains on its own shard of the samples, drawn in the same order by all processes
+            seed = torch.randint(0, 2 ** 31 - 1, ())
+            dist.broadcast(seed, src=0)
+            sampler = DistributedSampler(train_dataset, shuffle=True, seed=int(seed))
+
+        train_loader = self._build_data_loader(
             train_dataset,
-            batch_size=self.batch_size,
             shuffle=True,
-            num_workers=num_loader_workers,
-            pin_memory=True,
-            drop_last=False,
-            collate_fn=self._batch_collate_fn,
+            num_loader_workers=num_loader_workers,
+            sampler=sampler,
         )
 
         # Prepare validation data
         val_loader = (
             None
             if val_dataset is None
-            else DataLoader(
-                val_dataset,
-                batch_size=self.batch_size,
-                shuffle=False,
-                num_workers=num_loader_workers,
-                pin_memory=True,
-                drop_last=False,
-                collate_fn=self._batch_collate_fn,
+            else self._build_data_loader(
+                val_dataset, shuffle=False, num_loader_workers=num_loader_workers
             )
         )
 
         # Prepare tensorboard writer
-        tb_writer = self._prepare_tensorboard_writer()
+        tb_writer = (
+            self._prepare_tensorboard_writer() if self._is_main_process() else None
+        )
 
         # if user wants to train the model for more epochs, ignore the n_epochs parameter
         train_num_epochs = epochs if epochs > 0 else self.n_epochs
 
+        raise_if(
+            self.mixed_precision is not None
+            and next(self.model.parameters()).dtype != torch.float32,
+            "Mixed precision training requires float32 series; they can be converted with "
+            "`series.astype(np.float32)`.",
+            logger,
+        )
+
         # Train model
-        self._train(train_loader, val_loader, tb_writer, verbose, train_num_epochs)
+        self._train(
+            train_loader,
+            val_loader,
+            tb_writer,
+            verbose and self._is_main_process(),
+            train_num_epochs,
+        )
 
         # Close tensorboard writer
         if tb_writer is not None:
@@ -704,6 +908,106 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
 
         return self
 
+    def fit_distributed(
+        self,
+        num_processes: Optional[int] = None,
+        backend: str = "gloo",
+        init_method: Optional[str] = None,
+        **fit_kwargs,
+    ):
+        """
+        Train the model with several processes, in a data-parallel way, using PyTorch ``DistributedDataParallel``.
+
+        Each process trains a replica of the network on its own shard of the training samples, and the gradients
+        are averaged over all the processes at each optimization step, so that all replicas keep the same weights.
+        The validation loss is evaluated identically by all processes, and only the first process saves the
+        checkpoints and TensorBoard logs. At the end of the training, this model is an ordinary fitted model,
+        which can be used to predict or be saved as usual.
+
+        The processes are either:
+
+        * spawned on this machine, if `num_processes` is specified. The fitted model of the first process is then
+          loaded in this model.
+        * or launched by the user, for instance with ``torchrun`` on one or several hosts, in which case each
+          process calls `fit_distributed()` with the same arguments. The process group is initialized from the
+          ``MASTER_ADDR``, ``MASTER_PORT``, ``RANK`` and ``WORLD_SIZE`` environment variables (or `init_method`),
+          unless it is already initialized. The processes should create their models with the same `random_state`.
+
+        Parameters
+        ----------
+        num_processes
+            Optionally, the number of processes to spawn on this machine.
+        backend
+            The backend of ``torch.distributed``; "gloo" (the default) for training on CPUs, or "nccl" for GPUs.
+        init_method
+            Optionally, the URL used to initialize the process group. By default, a free local TCP port if
+            `num_processes` is specified, or the environment variables otherwise.
+        fit_kwargs
+            The keyword arguments of :func:`fit()`, or of :func:`fit_from_dataset()` if `train_dataset` is given.
+
+        Returns
+        -------
+        self
+            Fitted model.
+        """
+        raise_if_not(
+            dist.is_available(),
+            "Distributed training is not supported by this PyTorch installation.",
+            logger,
+        )
+
+        if num_processes is None:
+            created_group = not dist.is_initialized()
+            if created_group:
+                dist.init_process_group(backend, init_method=init_method or "env://")
+            try:
+                self._fit_in_process_group(fit_kwargs)
+            finally:
+                if created_group:
+                    dist.destroy_process_group()
+            return self
+
+        raise_if_not(
+            num_processes > 0, "`num_processes` must be a positive integer.", logger
+        )
+        if init_method is None:
+            with socket.socket() as sock:
+                sock.bind(("127.0.0.1", 0))
+                init_method = "tcp://127.0.0.1:{}".format(sock.getsockname()[1])
+
+        with tempfile.TemporaryDirectory() as folder:
+            result_path = os.path.join(folder, "model.pkl")
+            mp.start_processes(
+                _fit_distributed_worker,
+                args=(
+                    num_processes,
+                    backend,
+                    init_method,
+                    self,
+                    fit_kwargs,
+                    result_path,
+                ),
+                nprocs=num_processes,
+                join=True,
+                start_method="spawn",
+            )
+            with open(result_path, "rb") as f:
+                fitted_model = pickle.load(f)
+
+        self.__dict__.update(fitted_model.__dict__)
+        return self
+
+    def _fit_in_process_group(self, fit_kwargs: Dict) -> None:
+        """Trains the model in this process of an initialized process group."""
+        self._distributed = True
+        try:
+            if "train_dataset" in fit_kwargs:
+                self.fit_from_dataset(**fit_kwargs)
+            else:
+                self.fit(**fit_kwargs)
+        finally:
+            self._distributed = False
+
     @random_method
     def predict(
         self,
@@ -717,7 +1021,8 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         roll_size: Optional[int] = None,
         num_samples: int = 1,
         num_loader_workers: int = 0,
-    ) -> Union[TimeSeries, Sequence[TimeSeries]]:
+        return_array: bool = False,
+    ) -> Union[TimeSeries, Sequence[TimeSeries], ForecastArray]:
         """Predict the `n` time step following the end of the training series, or of the specified `series`.
 
         Below, all possible parameters are documented, but not all models support all parameters. For instance,
@@ -757,7 +1062,7 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         verbose
             Optionally, whether to print progress.
         n_jobs
-            The number of jobs to run in parallel. `-1` means using all processors. Defaults to `1`.
+            Kept for backwards compatibility; the forecasts are now built in bulk, without parallel jobs.
         roll_size
             For self-consuming predictions, i.e. `n > output_chunk_length`, determines how many
             outputs of the model are fed back into it at every iteration of feeding the predicted target
@@ -771,12 +1076,17 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
             for the inference/prediction dataset loaders (if any).
             A larger number of workers can sometimes increase performance, but can also incur extra overheads
             and increase memory usage, as more batches are loaded in parallel.
+        return_array
+            Whether to return the forecasts of all series as a :class:`darts.utils.bulk_io.ForecastArray`, which holds
+            their values in a single array of shape (series, time, component, sample) along with the time index and
+            components of each forecast, instead of building a ``TimeSeries`` per series.
 
         Returns
         -------
-        Union[TimeSeries, Sequence[TimeSeries]]
+        Union[TimeSeries, Sequence[TimeSeries], ForecastArray]
             One or several time series containing the forecasts of `series`, or the forecast of the training series
-            if `series` is not specified and the model has been trained on a single series.
+            if `series` is not specified and the model has been trained on a single series. With `return_array`,
+            the forecasts of all series (even if only one series is given) as a `ForecastArray`.
         """
         super().predict(n, series, past_covariates, future_covariates)
 
@@ -831,8 +1141,13 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
             n_jobs=n_jobs,
             roll_size=roll_size,
             num_samples=num_samples,
+            return_array=return_array,
+        )
+        return (
+            predictions[0]
+            if called_with_single_series and not return_array
+            else predictions
         )
-        return predictions[0] if called_with_single_series else predictions
 
     def predict_from_dataset(
         self,
@@ -844,7 +1159,8 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         roll_size: Optional[int] = None,
         num_samples: int = 1,
         num_loader_workers: int = 0,
-    ) -> Sequence[TimeSeries]:
+        return_array: bool = False,
+    ) -> Union[Sequence[TimeSeries], ForecastArray]:
 
         """
         This method allows for predicting with a specific :class:`darts.utils.data.InferenceDataset` instance.
@@ -865,7 +1181,7 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         verbose
             Shows the progress bar for batch predicition. Off by default.
         n_jobs
-            The number of jobs to run in parallel. `-1` means using all processors. Defaults to `1`.
+            Kept for backwards compatibility; the forecasts are now built in bulk, without parallel jobs.
         roll_size
             For self-consuming predictions, i.e. `n > output_chunk_length`, determines how many
             outputs of the model are fed back into it at every iteration of feeding the predicted target
@@ -879,10 +1195,14 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
             for the inference/prediction dataset loaders (if any).
             A larger number of workers can sometimes increase performance, but can also incur extra overheads
             and increase memory usage, as more batches are loaded in parallel.
+        return_array
+            Whether to return the forecasts as a :class:`darts.utils.bulk_io.ForecastArray`, which holds their values
+            in a single array of shape (series, time, component, sample) along with the time index and components of
+            each forecast, instead of building a ``TimeSeries`` per series.
 
         Returns
         -------
-        Sequence[TimeSeries]
+        Union[Sequence[TimeSeries], ForecastArray]
             Returns one or more forecasts for time series.
         """
         self._verify_inference_dataset_type(input_series_dataset)
@@ -913,7 +1233,7 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
             drop_last=False,
             collate_fn=self._batch_collate_fn,
         )
-        predictions = []
+        predictions, input_series = [], []
         iterator = _build_tqdm_iterator(pred_loader, verbose=verbose)
 
         self.model.eval()
@@ -967,25 +1287,18 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
                     batch_predictions.append(batch_prediction)
                     sample_count += batch_sample_size
 
-                # concatenate the batch of samples, to form num_samples samples
+                # concatenate the batch of samples, to form num_samples samples, and move the samples last
                 batch_predictions = torch.cat(batch_predictions, dim=0)
-                batch_predictions = batch_predictions.cpu().detach().numpy()
-
-                # create `TimeSeries` objects from prediction tensors
-                ts_forecasts = Parallel(n_jobs=n_jobs)(
-                    delayed(self._build_forecast_series)(
-                        [
-                            batch_prediction[batch_idx]
-                            for batch_prediction in batch_predictions
-                        ],
-                        input_series,
-                    )
-                    for batch_idx, input_series in enumerate(batch_input_series)
+                predictions.append(
+                    batch_predictions.permute(1, 2, 3, 0).cpu().detach().numpy()
                 )
+                input_series.extend(batch_input_series)
 
-                predictions.extend(ts_forecasts)
-
-        return predictions
+        # the forecasts of all batches are built at once
+        forecasts = ForecastArray.from_input_series(
+            np.concatenate(predictions), input_series
+        )
+        return forecasts if return_array else forecasts.to_series()
 
     def _sample_tiling(self, input_data_tuple, batch_sample_size):
         tiled_input_data = []
@@ -1003,6 +1316,37 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         ]
         return tuple(batch)
 
+    def _batched_historical_forecasts(
+        self,
+        series: TimeSeries,
+        past_covariates: Optional[TimeSeries],
+        future_covariates: Optional[TimeSeries],
+        pred_times: List[Union[pd.Timestamp, int]],
+        forecast_horizon: int,
+        stride: int,
+        num_samples: int,
+    ) -> Optional[np.ndarray]:
+        """
+        Computes all the historical forecasts with a single call to `predict()`: the history of `series` up to
+        every prediction time is added to one inference dataset, which is then predicted in batches of
+        `batch_size` windows.
+        """
+        first = series.time_index.get_loc(pred_times[0])
+        positions = range(first, first + len(pred_times) * stride, stride)
+
+        forecasts = self.predict(
+            n=forecast_horizon,
+            series=[series[:position] for position in positions],
+            past_covariates=None
+            if past_covariates is None
+            else [past_covariates] * len(positions),
+            future_covariates=None
+            if future_covariates is None
+            else [future_covariates] * len(positions),
+            num_samples=num_samples,
+        )
+        return np.stack([forecast.all_values(copy=False) for forecast in forecasts])
+
     @property
     def first_prediction_index(self) -> int:
         """
@@ -1027,90 +1371,282 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         """
 
         best_loss = np.inf
+        best_state = None
+        evaluations_without_improvement = 0
+        if val_loader is None and (
+            self.restore_best_weights or self.early_stopping_patience is not None
+        ):
+            logger.warning(
+                "Early stopping and best weights restoration require a validation set, and are ignored."
+            )
+
+        # the state dict checkpoints are written in the order of the epochs by a single background thread
+        # with distributed training, all the processes hold the same weights, and only the first one saves them
+        save_checkpoints = self.save_checkpoints and self._is_main_process()
+        checkpoint_folder = _get_checkpoint_folder(self.work_dir, self.model_name)
+        checkpoint_writer = (
+            ThreadPoolExecutor(max_workers=1)
+            if save_checkpoints and self.checkpoint_state_dicts
+            else None
+        )
+        checkpoint_writes = []
 
         iterator = _build_tqdm_iterator(
             range(self.total_epochs, self.total_epochs + epochs),
             verbose=verbose,
         )
 
-        for epoch in iterator:
-            total_loss = 0
+        # the compiled network shares its parameters with `self.model`, which is only swapped during the batches
+        eager_model = self.model
+        train_model = self._compiled_model()
+        scaler = self._grad_scaler()
+
+        epoch_sampler = None
+        if self._distributed:
+            # the gradients are averaged over the processes during the backward passes
+            train_model = DistributedDataParallel(train_model)
+            # the distributed sampler is either the sampler of the loader, or wrapped in its batch sampler
+            epoch_sampler = getattr(
+                train_loader.sampler, "sampler", train_loader.sampler
+            )
 
-            for batch_idx, train_batch in enumerate(train_loader):
-                self.model.train()
-                train_batch = self._batch_to_device(train_batch)
-                output = self._produce_train_output(train_batch[:-1])
-                target = train_batch[
-                    -1
-                ]  # By convention target is always the last element returned by datasets
-                loss = self._compute_loss(output, target)
-                self.optimizer.zero_grad()
-                loss.backward()
-                self.optimizer.step()
-                total_loss += loss.item()
-            if isinstance(
-                self.lr_scheduler, torch.optim.lr_scheduler.ReduceLROnPlateau
-            ):
-                self.lr_scheduler.step(loss)
-            elif self.lr_scheduler is not None:
-                self.lr_scheduler.step()
-
-            if tb_writer is not None:
-                for name, param in self.model.named_parameters():
-                    # if the param doesn't require gradient, then param.grad = None and param.grad.data will crash
-                    if param.requires_grad:
-                        tb_writer.add_histogram(
-                            name + "/gradients", param.grad.data.cpu().numpy(), epoch
+        try:
+            for epoch in iterator:
+                # the losses are accumulated on the device, to avoid a synchronization at each batch
+                total_loss = torch.zeros((), device=self.device)
+                if isinstance(epoch_sampler, DistributedSampler):
+                    epoch_sampler.set_epoch(epoch)
+
+                train_model.train()
+                eager_model.train()
+                self.model = train_model
+                try:
+                    for batch_idx, train_batch in enumerate(train_loader):
+                        if batch_idx % self.accumulate_grad_batches == 0:
+                            self.optimizer.zero_grad(set_to_none=True)
+                        optimizer_step = (
+                            batch_idx + 1
+                        ) % self.accumulate_grad_batches == 0 or (batch_idx + 1) == len(
+                            train_loader
                         )
+                        # the gradients of the accumulated batches are only averaged over the processes once
+                        sync_context = (
+                            train_model.no_sync()
+                            if self._distributed and not optimizer_step
+                            else nullcontext()
+                        )
+                        train_batch = self._batch_to_device(train_batch)
+                        with sync_context:
+                            with self._autocast():
+                                output = self._produce_train_output(train_batch[:-1])
+                                target = train_batch[
+                                    -1
+                                ]  # By convention target is always the last element returned by datasets
+                                loss = self._compute_loss(output, target)
+                            scaler.scale(loss / self.accumulate_grad_batches).backward()
+                        if optimizer_step:
+                            scaler.step(self.optimizer)
+                            scaler.update()
+                        total_loss += loss.detach()
+                finally:
+                    self.model = eager_model
+
+                if self._distributed:
+                    # the processes must take the same decisions (learning rate, early stopping) from the losses
+                    loss = self._all_reduce_mean(loss.detach())
+                    total_loss = self._all_reduce_mean(total_loss)
+
+                if isinstance(
+                    self.lr_scheduler, torch.optim.lr_scheduler.ReduceLROnPlateau
+                ):
+                    self.lr_scheduler.step(loss)
+                elif self.lr_scheduler is not None:
+                    self.lr_scheduler.step()
+
+                if tb_writer is not None:
+                    for name, param in self.model.named_parameters():
+                        # if the param doesn't require gradient, then param.grad = None and param.grad.data will crash
+                        if param.requires_grad:
+                            tb_writer.add_histogram(
+                                name + "/gradients",
+                                param.grad.data.cpu().numpy(),
+                                epoch,
+                            )
 
-                tb_writer.add_scalar(
-                    "training/loss", total_loss / (batch_idx + 1), epoch
-                )
-                tb_writer.add_scalar(
-                    "training/loss_total", total_loss / (batch_idx + 1), epoch
-                )
-                tb_writer.add_scalar(
-                    "training/learning_rate", self._get_learning_rate(), epoch
-                )
-
-            self.total_epochs = epoch + 1
-
-            if self.save_checkpoints:
-                self._save_model_from_fit(
-                    is_best=False,
-                    folder=_get_checkpoint_folder(self.work_dir, self.model_name),
-                    epoch=epoch,
-                )
+                    tb_writer.add_scalar(
+                        "training/loss", total_loss.item() / (batch_idx + 1), epoch
+                    )
+                    tb_writer.add_scalar(
+                        "training/loss_total",
+                        total_loss.item() / (batch_idx + 1),
+                        epoch,
+                    )
+                    tb_writer.add_scalar(
+                        "training/learning_rate", self._get_learning_rate(), epoch
+                    )
 
-            if epoch % self.nr_epochs_val_period == 0:
-                training_loss = total_loss / len(train_loader)
-                if val_loader is not None:
-                    validation_loss = self._evaluate_validation_loss(val_loader)
-                    if tb_writer is not None:
-                        tb_writer.add_scalar(
-                            "validation/loss_total", validation_loss, epoch
+                self.total_epochs = epoch + 1
+
+                state_dicts = None
+                if checkpoint_writer is not None:
+                    state_dicts = self._copy_state_dicts(epoch)
+                    checkpoint_writes.append(
+                        checkpoint_writer.submit(
+                            self._save_model_from_fit,
+                            False,
+                            checkpoint_folder,
+                            epoch,
+                            state_dicts,
                         )
+                    )
+                elif save_checkpoints:
+                    self._save_model_from_fit(
+                        is_best=False,
+                        folder=checkpoint_folder,
+                        epoch=epoch,
+                    )
 
-                    if validation_loss < best_loss:
-                        best_loss = validation_loss
-                        if self.save_checkpoints:
-                            self._save_model_from_fit(
-                                is_best=True,
-                                folder=_get_checkpoint_folder(
-                                    self.work_dir, self.model_name
-                                ),
-                                epoch=epoch,
+                if epoch % self.nr_epochs_val_period == 0:
+                    training_loss = total_loss.item() / len(train_loader)
+                    if val_loader is not None:
+                        validation_loss = self._evaluate_validation_loss(val_loader)
+                        if tb_writer is not None:
+                            tb_writer.add_scalar(
+                                "validation/loss_total", validation_loss, epoch
                             )
 
-                    if verbose:
-                        print(
-                            "Training loss: {:.4f}, validation loss: {:.4f}, best val loss: {:.4f}".format(
-                                training_loss, validation_loss, best_loss
-                            ),
-                            end="\r",
+                        if validation_loss < best_loss - self.early_stopping_min_delta:
+                            best_loss = validation_loss
+                            evaluations_without_improvement = 0
+                            if self.restore_best_weights:
+                                best_state = {
+                                    name: tensor.detach().clone()
+                                    for name, tensor in self.model.state_dict().items()
+                                }
+                            if checkpoint_writer is not None:
+                                checkpoint_writes.append(
+                                    checkpoint_writer.submit(
+                                        self._save_model_from_fit,
+                                        True,
+                                        checkpoint_folder,
+                                        epoch,
+                                        state_dicts,
+                                    )
+                                )
+                            elif save_checkpoints:
+                                self._save_model_from_fit(
+                                    is_best=True,
+                                    folder=checkpoint_folder,
+                                    epoch=epoch,
+                                )
+                        else:
+                            evaluations_without_improvement += 1
+
+                        if verbose:
+                            print(
+                                "Training loss: {:.4f}, validation loss: {:.4f}, best val loss: {:.4f}".format(
+                                    training_loss, validation_loss, best_loss
+                                ),
+                                end="\r",
+                            )
+                    elif verbose:
+                        print("Training loss: {:.4f}".format(training_loss), end="\r")
+
+                if (
+                    self.early_stopping_patience is not None
+                    and evaluations_without_improvement >= self.early_stopping_patience
+                ):
+                    logger.info(
+                        "Early stopping after epoch {}: the validation loss did not improve for {} evaluations.".format(
+                            epoch, evaluations_without_improvement
                         )
-                elif verbose:
-                    print("Training loss: {:.4f}".format(training_loss), end="\r")
+                    )
+                    break
+        finally:
+            if checkpoint_writer is not None:
+                # the pending checkpoints are written even if the training fails
+                checkpoint_writer.shutdown(wait=True)
+
+        # raise the errors of the checkpoint writes, if any
+        for write in checkpoint_writes:
+            write.result()
+
+        if best_state is not None:
+            self.model.load_state_dict(best_state)
+
+    def _is_main_process(self) -> bool:
+        """Whether this process saves the checkpoints and logs of the training; the first process of a distributed
+        training, or the only process otherwise."""
+        return not self._distributed or dist.get_rank() == 0
+
+    @staticmethod
+    def _all_reduce_mean(tensor: Tensor) -> Tensor:
+        """Returns the mean of a tensor over the processes of a distributed training."""
+        tensor = tensor.clone()
+        dist.all_reduce(tensor)
+        return tensor / dist.get_world_size()
+
+    def _copy_state_dicts(self, epoch: int) -> Dict:
+        """Returns a copy of the state dicts of the network, optimizer and learning rate scheduler, which is
+        not modified by the next training steps."""
+        return copy.deepcopy(
+            {
+                "epoch": epoch,
+                "model": self.model.state_dict(),
+                "optimizer": self.optimizer.state_dict(),
+                "lr_scheduler": None
+                if self.lr_scheduler is None
+                else self.lr_scheduler.state_dict(),
+            }
+        )
+
+    def _autocast(self):
+        """Returns the autocast context of the mixed precision training (which is disabled by default)"""
+        return torch.autocast(
+            device_type=self.device.type,
+            dtype=torch.float16 if self.mixed_precision == "fp16" else torch.bfloat16,
+            enabled=self.mixed_precision is not None,
+        )
+
+    def _grad_scaler(self):
+        """Returns the gradient scaler of float16 training (which is a no-op otherwise)"""
+        enabled = self.mixed_precision == "fp16"
+        if hasattr(torch.amp, "GradScaler"):
+            return torch.amp.GradScaler(self.device.type, enabled=enabled)
+        return torch.cuda.amp.GradScaler(enabled=enabled)
+
+    def _compiled_model(self) -> nn.Module:
+        """Returns the network used for training, which is compiled according to `compile_model`. The compiled
+        network is kept for the next calls, as long as the network of the model is not replaced."""
+        if self.compile_model is None:
+            return self.model
+
+        compiled = self.__dict__.get("_compiled_network")
+        if (
+            compiled is not None
+            and compiled[0] is self.model
+            and compiled[1] == self.compile_model
+        ):
+            return compiled[2]
+
+        network = self.model
+        if self.compile_model == "compile":
+            network = torch.compile(self.model)
+        else:
+            try:
+                network = torch.jit.script(self.model)
+            except Exception as e:
+                logger.warning(
+                    f"The network could not be compiled with TorchScript, it is trained eagerly: {e}"
+                )
+        self._compiled_network = (self.model, self.compile_model, network)
+        return network
+
+    def __getstate__(self):
+        # the compiled network cannot be pickled, it is compiled again when needed
+        state = self.__dict__.copy()
+        state.pop("_compiled_network", None)
+        return state
 
     def _compute_loss(self, output, target):
         return self.criterion(output, target)
@@ -1119,7 +1655,7 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         return self.model(input)
 
     def _evaluate_validation_loss(self, val_loader: DataLoader):
-        total_loss = 0
+        total_loss = torch.zeros((), device=self.device)
         self.model.eval()
         with torch.no_grad():
             for batch_idx, val_batch in enumerate(val_loader):
@@ -1127,9 +1663,11 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
                 output = self._produce_train_output(val_batch[:-1])
                 target = val_batch[-1]
                 loss = self._compute_loss(output, target)
-                total_loss += loss.item()
+                total_loss += loss
 
-        validation_loss = total_loss / (batch_idx + 1)
+        if self._distributed:
+            total_loss = self._all_reduce_mean(total_loss)
+        validation_loss = total_loss.item() / (batch_idx + 1)
         return validation_loss
 
     def save_model(self, path: str) -> None:
@@ -1150,13 +1688,18 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         with open(path, "wb") as f_out:
             torch.save(self, f_out)
 
-    def _save_model_from_fit(self, is_best: bool, folder: str, epoch: int) -> None:
+    def _save_model_from_fit(
+        self, is_best: bool, folder: str, epoch: int, state_dicts: Optional[Dict] = None
+    ) -> None:
         """
         Saves the torch model during training at a given epoch to the model's checkpoint folder.
         Only the latest five save files are kept at most plus an additional save file for the model's best performing
         state (on validation set).
         Older save files will be removed.
 
+        If `state_dicts` are given, they are saved instead of the whole model, in `weights_*` files (and
+        `best_weights_*` for the best state).
+
         Parameters
         ----------
         is_best
@@ -1166,24 +1709,36 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
             './.darts/checkpoints/{model_name}'
         epoch
             current epoch number
+        state_dicts
+            optionally, the state dicts to save instead of the model
         """
+        prefix, best_prefix = (
+            ("checkpoint_", "model_best_")
+            if state_dicts is None
+            else ("weights_", "best_weights_")
+        )
 
-        checklist = glob(os.path.join(folder, "checkpoint_*"))
+        checklist = glob(os.path.join(folder, prefix + "*"))
         checklist = sorted(checklist, key=lambda x: float(re.findall(r"(\d+)", x)[-1]))
-        file_name = "checkpoint_{0}.pth.tar".format(epoch)
+        file_name = "{0}{1}.pth.tar".format(prefix, epoch)
         os.makedirs(folder, exist_ok=True)
         file_path = os.path.join(folder, file_name)
 
-        self.save_model(file_path)
+        if state_dicts is None:
+            self.save_model(file_path)
+        else:
+            torch.save(state_dicts, file_path)
 
         if len(checklist) >= 5:
             # remove older files
             for chkpt in checklist[:-4]:
                 os.remove(chkpt)
         if is_best:
-            best_path = os.path.join(folder, "model_best_{0}.pth.tar".format(epoch))
+            best_path = os.path.join(
+                folder, "{0}{1}.pth.tar".format(best_prefix, epoch)
+            )
             shutil.copyfile(file_path, best_path)
-            checklist = glob(os.path.join(folder, "model_best_*"))
+            checklist = glob(os.path.join(folder, best_prefix + "*"))
             checklist = sorted(
                 checklist, key=lambda x: float(re.findall(r"(\d+)", x)[-1])
             )
@@ -1289,6 +1844,65 @@ class TorchForecastingModel(GlobalForecastingModel, ABC):
         logger.info("loading {}".format(file_name))
         return TorchForecastingModel.load_model(file_path)
 
+    def load_weights_from_checkpoint(
+        self, file_name: str = None, best: bool = True
+    ) -> "TorchForecastingModel":
+        """Load the state dicts saved automatically during the training of a model created with
+        `save_checkpoints=True` and `checkpoint_state_dicts=True` into this model.
+
+        The state dicts of the network, optimizer and learning rate scheduler are loaded from
+        ``{work_dir}/checkpoints/{model_name}/{file_name}``. If `file_name` is not given, the state dicts of the best
+        epoch (if `best` is `True`) or of the last epoch (if `best` is `False`) are loaded.
+        The network of this model must have been built (e.g. by fitting it), with the same parameters as the model
+        which saved the checkpoints.
+
+        Parameters
+        ----------
+        file_name
+            The name of the checkpoint file. If not specified, use the one of the best or last epoch.
+        best
+            If set, will retrieve the best weights (according to validation loss) instead of the most recent ones.
+            Ignored when `file_name` is given.
+
+        Returns
+        -------
+        TorchForecastingModel
+            The model itself, with the loaded weights.
+        """
+        raise_if(
+            self.model is None,
+            "The network of the model must be built (e.g. by fitting the model) before loading weights.",
+            logger,
+        )
+        checkpoint_dir = _get_checkpoint_folder(self.work_dir, self.model_name)
+
+        if file_name is None:
+            prefix = "best_weights_" if best else "weights_"
+            checklist = glob(os.path.join(checkpoint_dir, prefix + "*"))
+            if len(checklist) == 0:
+                raise_log(
+                    FileNotFoundError(
+                        "There is no file matching prefix {} in {}".format(
+                            prefix, checkpoint_dir
+                        )
+                    ),
+                    logger,
+                )
+            file_name = os.path.basename(
+                max(checklist, key=lambda x: float(re.findall(r"(\d+)", x)[-1]))
+            )
+
+        logger.info("loading {}".format(file_name))
+        state_dicts = torch.load(
+            os.path.join(checkpoint_dir, file_name), map_location=self.device
+        )
+        self.model.load_state_dict(state_dicts["model"])
+        self.optimizer.load_state_dict(state_dicts["optimizer"])
+        if self.lr_scheduler is not None and state_dicts["lr_scheduler"] is not None:
+            self.lr_scheduler.load_state_dict(state_dicts["lr_scheduler"])
+        self.total_epochs = state_dicts["epoch"] + 1
+        return self
+
     def _get_best_torch_device(self):
         is_cuda = torch.cuda.is_available()
         if is_cuda:
@@ -1343,6 +1957,31 @@ class TorchParametricProbabilisticForecastingModel(TorchForecastingModel, ABC):
         pass
 
 
+def _fit_distributed_worker(
+    rank: int,
+    world_size: int,
+    backend: str,
+    init_method: str,
+    model: TorchForecastingModel,
+    fit_kwargs: Dict,
+    result_path: str,
+):
+    """Trains a model in a process spawned by `fit_distributed()`, and saves the fitted model of the first process
+    under `result_path`."""
+    # the processes share the cores of the machine
+    torch.set_num_threads(max(1, torch.get_num_threads() // world_size))
+    dist.init_process_group(
+        backend, init_method=init_method, rank=rank, world_size=world_size
+    )
+    try:
+        model._fit_in_process_group(fit_kwargs)
+        if rank == 0:
+            with open(result_path, "wb") as f:
+                pickle.dump(model, f)
+    finally:
+        dist.destroy_process_group()
+
+
 def _raise_if_wrong_type(obj, exp_type, msg="expected type {}, got: {}"):
     raise_if_not(isinstance(obj, exp_type), msg.format(exp_type, type(obj)))
 
@@ -1545,70 +2184,33 @@ class PastCovariatesTorchModel(TorchForecastingModel, ABC):
             past_covariates.shape[dim_component] if past_covariates is not None else 0
         )
 
-        input_past = torch.cat(
-            [ds for ds in [past_target, past_covariates] if ds is not None],
-            dim=dim_component,
+        # the input chunk followed by the forecast horizon, where the predictions are written
+        history = past_target.new_empty(
+            (
+                past_target.shape[0],
+                self.input_chunk_length + n,
+                n_targets + n_past_covs,
+            )
+        )
+        history[:, : self.input_chunk_length, :n_targets] = past_target
+        if n_past_covs:
+            history[:, : self.input_chunk_length, n_targets:] = past_covariates
+            if future_past_covariates is not None:
+                n_future = min(future_past_covariates.shape[1], n)
+                history[
+                    :,
+                    self.input_chunk_length : self.input_chunk_length + n_future,
+                    n_targets:,
+                ] = future_past_covariates[:, :n_future]
+
+        def produce_output(start: int) -> Tensor:
+            return self._produce_predict_output(
+                history[:, start : start + self.input_chunk_length]
+            )[:, self.first_prediction_index :, :]
+
+        return self._roll_out_prediction(
+            n, roll_size, history, n_targets, produce_output
         )
-
-        out = self._produce_predict_output(input_past)[
-            :, self.first_prediction_index :, :
-        ]
-
-        batch_prediction = [out[:, :roll_size, :]]
-        prediction_length = roll_size
-
-        while prediction_length < n:
-            # we want the last prediction to end exactly at `n` into the future.
-            # this means we may have to truncate the previous prediction and step
-            # back the roll size for the last chunk
-            if prediction_length + self.output_chunk_length > n:
-                spillover_prediction_length = (
-                    prediction_length + self.output_chunk_length - n
-                )
-                roll_size -= spillover_prediction_length
-                prediction_length -= spillover_prediction_length
-                batch_prediction[-1] = batch_prediction[-1][:, :roll_size, :]
-
-            # ==========> PAST INPUT <==========
-            # roll over input series to contain latest target and covariate
-            input_past = torch.roll(input_past, -roll_size, 1)
-
-            # update target input to include next `roll_size` predictions
-            if self.input_chunk_length >= roll_size:
-                input_past[:, -roll_size:, :n_targets] = out[:, :roll_size, :]
-            else:
-                input_past[:, :, :n_targets] = out[:, -self.input_chunk_length :, :]
-
-            # set left and right boundaries for extracting future elements
-            if self.input_chunk_length >= roll_size:
-                left_past, right_past = prediction_length - roll_size, prediction_length
-            else:
-                left_past, right_past = (
-                    prediction_length - self.input_chunk_length,
-                    prediction_length,
-                )
-
-            # update past covariates to include next `roll_size` future past covariates elements
-            if n_past_covs and self.input_chunk_length >= roll_size:
-                input_past[
-                    :, -roll_size:, n_targets : n_targets + n_past_covs
-                ] = future_past_covariates[:, left_past:right_past, :]
-            elif n_past_covs:
-                input_past[
-                    :, :, n_targets : n_targets + n_past_covs
-                ] = future_past_covariates[:, left_past:right_past, :]
-
-            # take only last part of the output sequence where needed
-            out = self._produce_predict_output(input_past)[
-                :, self.first_prediction_index :, :
-            ]
-            batch_prediction.append(out)
-            prediction_length += self.output_chunk_length
-
-        # bring predictions into desired format and drop unnecessary values
-        batch_prediction = torch.cat(batch_prediction, dim=1)
-        batch_prediction = batch_prediction[:, :n, :]
-        return batch_prediction
 
     @property
     def _model_encoder_settings(self) -> Tuple[int, int, bool, bool]:
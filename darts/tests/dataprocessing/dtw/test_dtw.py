@@ -216,6 +216,130 @@ class DynamicTimeWarpingTestCase(DartsBaseTestClass):
 
         self.assertTrue(np.all(alignment_uni.path() == alignment_multi.path()))
 
+    def test_vectorized_cost_matrix(self):
+        # custom distances are computed cell by cell, the built-in ones by anti-diagonals
+        def distance_uni(x, y):
+            return abs(x - y)
+
+        def distance_multi(x, y):
+            return np.sum(np.abs(x - y))
+
+        np.random.seed(0)
+        for n, m, n_components in [(31, 17, 1), (24, 40, 3)]:
+            series1 = TimeSeries.from_values(np.random.randn(n, n_components))
+            series2 = TimeSeries.from_values(np.random.randn(m, n_components))
+            distance = distance_uni if n_components == 1 else distance_multi
+
+            for kwargs in [
+                {},
+                {"window": dtw.SakoeChiba(window_size=abs(n - m) + 3)},
+                {"window": dtw.Itakura(max_slope=m / n + 1)},
+            ] + ([{"multi_grid_radius": 1}] if n_components == 1 else []):
+                alignment = dtw.dtw(series1, series2, **kwargs)
+                expected = dtw.dtw(series1, series2, distance=distance, **kwargs)
+
+                self.assertIs(type(alignment.cost), type(expected.cost))
+                np.testing.assert_array_equal(
+                    alignment.cost.to_dense(), expected.cost.to_dense()
+                )
+                np.testing.assert_array_equal(alignment.path(), expected.path())
+                self.assertEqual(alignment.distance(), expected.distance())
+
+    def test_distance_matrix(self):
+        np.random.seed(0)
+        for n_components in [1, 2]:
+            series = [
+                TimeSeries.from_values(
+                    np.random.randn(length, n_components).cumsum(axis=0)
+                )
+                for length in np.random.choice([8, 10, 12], size=12)
+            ]
+            for window in [dtw.NoWindow(), dtw.SakoeChiba(5), dtw.Itakura(2.0)]:
+                distances = dtw.dtw_distance_matrix(series, window=window)
+
+                # condensed matrix of the distances between series[i] and series[j > i]
+                self.assertEqual(distances.shape, (len(series) * 11 / 2,))
+                expected = [
+                    dtw.dtw(series[i], series[j], window=window).distance()
+                    for i in range(len(series))
+                    for j in range(i + 1, len(series))
+                ]
+                np.testing.assert_allclose(distances, expected, rtol=1e-6)
+
+                # only the distances up to max_distance are computed, in parallel jobs
+                max_distance = np.quantile(distances, 0.25)
+                np.testing.assert_array_equal(
+                    dtw.dtw_distance_matrix(
+                        series,
+                        window=window,
+                        max_distance=max_distance,
+                        n_jobs=2,
+                        pairs_per_job=10,
+                    ),
+                    np.where(distances <= max_distance, distances, np.inf),
+                )
+
+        self.assertEqual(len(dtw.dtw_distance_matrix(series[:1])), 0)
+        with self.assertRaises(ValueError):
+            dtw.dtw_distance_matrix([self.series1, self.series1.stack(self.series2)])
+
+    def test_search(self):
+        np.random.seed(0)
+        values = np.random.randn(300).cumsum()
+        query = values[200:220] + 0.1 * np.random.randn(20)
+
+        def normalize(x):
+            return TimeSeries.from_values((x - x.mean()) / x.std())
+
+        for window in [dtw.NoWindow(), dtw.SakoeChiba(3)]:
+            # distances between the z-normalized query and all the subsequences
+            distances = np.array(
+                [
+                    dtw.dtw(
+                        normalize(values[start : start + 20]),
+                        normalize(query),
+                        window=window,
+                    ).distance()
+                    for start in range(281)
+                ]
+            )
+            starts, found_distances = dtw.dtw_search(
+                TimeSeries.from_values(values),
+                TimeSeries.from_values(query),
+                k=3,
+                window=window,
+            )
+            self.assertEqual(starts[0], 200)
+            np.testing.assert_allclose(
+                found_distances, distances[starts], rtol=1e-5, atol=1e-8
+            )
+            self.assertTrue(np.all(np.diff(found_distances) >= 0))
+
+            # the matches start more than `exclusion_zone` time steps apart
+            self.assertTrue(np.all(np.abs(np.diff(np.sort(starts))) > 10))
+            closest = np.argsort(distances)
+            self.assertEqual(starts[1], closest[np.abs(closest - 200) > 10][0])
+
+            starts, found_distances = dtw.dtw_search(
+                TimeSeries.from_values(values),
+                TimeSeries.from_values(query),
+                k=5,
+                window=window,
+                exclusion_zone=0,
+            )
+            np.testing.assert_array_equal(starts, closest[:5])
+
+        with self.assertRaises(ValueError):
+            dtw.dtw_search(
+                TimeSeries.from_values(values[:10]), TimeSeries.from_values(query)
+            )
+        with self.assertRaises(ValueError):
+            dtw.dtw_search(
+                TimeSeries.from_values(values),
+                TimeSeries.from_values(query),
+                window=dtw.Itakura(2.0),
+            )
+
 
 # MINI_BENCHMARK
 def _dtw_exact():
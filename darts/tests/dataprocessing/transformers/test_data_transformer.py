@@ -2,7 +2,7 @@ import unittest
 import logging
 
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler, StandardScaler
+from sklearn.preprocessing import MinMaxScaler, StandardScaler, RobustScaler
 
 from darts.dataprocessing.transformers import Scaler
 from darts.utils import timeseries_generation as tg
@@ -130,3 +130,59 @@ class DataTransformerTestCase(unittest.TestCase):
 
         # Test inverse transform
         np.testing.assert_allclose(s.all_values(), ssi.all_values())
+
+    def test_vectorized_scaling(self):
+        np.random.seed(0)
+        series = [
+            TimeSeries.from_values(np.random.randn(length, 3, 2) * 5 + 3)
+            for length in [5, 12, 30]
+        ] + [
+            TimeSeries.from_values(np.random.randn(8, 3, 1)),
+            TimeSeries.from_values(np.ones((6, 3, 1), dtype=np.float32)),
+        ]
+        values = series[0].all_values()
+        values[[1, 3], 0, 1] = np.nan
+        series[0] = series[0].with_values(values)
+
+        # the vectorized scalings match the scikit-learn scalers fitted per series
+        for name, scaler in [
+            ("minmax", MinMaxScaler()),
+            ("standard", StandardScaler()),
+            ("robust", RobustScaler()),
+        ]:
+            for component_mask in [None, np.array([True, False, True])]:
+                kwargs = (
+                    {} if component_mask is None else {"component_mask": component_mask}
+                )
+                vectorized = Scaler(name)
+                transformed = vectorized.fit_transform(series, **kwargs)
+                expected = Scaler(scaler).fit_transform(series, **kwargs)
+                self.assertEqual(
+                    vectorized._fitted_params[0].shape,
+                    (5, 3 if component_mask is None else 2),
+                )
+
+                for ts, expected_ts in zip(transformed, expected):
+                    self.assertEqual(ts.dtype, expected_ts.dtype)
+                    np.testing.assert_allclose(
+                        ts.all_values(),
+                        expected_ts.all_values(),
+                        rtol=1e-10,
+                        atol=1e-10,
+                    )
+                for ts, original in zip(
+                    vectorized.inverse_transform(transformed, **kwargs), series
+                ):
+                    np.testing.assert_allclose(
+                        ts.all_values(), original.all_values(), rtol=1e-10, atol=1e-10
+                    )
+                self.assertEqual(
+                    vectorized.transform(series[0], **kwargs), transformed[0]
+                )
+
+        with self.assertRaises(ValueError):
+            Scaler("unknown")
+        with self.assertRaises(ValueError):
+            Scaler("minmax").fit(series[:2]).transform(series)
+        with self.assertRaises(ValueError):
+            Scaler("minmax").fit([self.series1, self.series2])
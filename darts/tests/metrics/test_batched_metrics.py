@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+
+from darts import TimeSeries
+from darts.metrics import batch_metrics, metrics
+from darts.metrics.batched import align_series
+from darts.tests.base_test_class import DartsBaseTestClass
+from darts.utils import timeseries_generation as tg
+
+
+class BatchedMetricsTestCase(DartsBaseTestClass):
+    np.random.seed(42)
+    actual_series = []
+    pred_series = []
+    insample = []
+    for i in range(10):
+        length = np.random.randint(20, 40)
+        if i % 2:
+            actual = TimeSeries.from_values(np.random.rand(length, 2) + 1)
+        else:
+            actual = tg.linear_timeseries(
+                length=length, start_value=1, end_value=3, freq="M"
+            ).stack(tg.sine_timeseries(length=length, freq="M") + 2)
+        pred = actual[length // 2 :] + np.random.rand()
+        if i % 5 == 0:
+            pred = TimeSeries.from_times_and_values(
+                pred.time_index, np.random.rand(len(pred), 2, 4) + 1
+            )
+        # the actual series extend beyond the forecasts
+        actual_series.append(actual.append_values(np.ones((3, 2))))
+        pred_series.append(pred)
+        insample.append(actual[: length // 2])
+
+    def test_same_as_metrics(self):
+        names = [
+            "mae",
+            "mse",
+            "rmse",
+            "rmsle",
+            "coefficient_of_variation",
+            "mape",
+            "smape",
+            "ope",
+            "marre",
+            "r2_score",
+        ]
+        results = batch_metrics(self.actual_series, self.pred_series, names)
+        self.assertEqual(list(results), names)
+        for name in names:
+            expected = getattr(metrics, name)(self.actual_series, self.pred_series)
+            np.testing.assert_allclose(results[name], expected)
+
+        results = batch_metrics(
+            self.actual_series,
+            self.pred_series,
+            [metrics.mase],
+            insample=self.insample,
+            m=2,
+        )
+        np.testing.assert_allclose(
+            results["mase"],
+            metrics.mase(self.actual_series, self.pred_series, self.insample, m=2),
+        )
+
+    def test_reductions(self):
+        per_component = batch_metrics(
+            self.actual_series, self.pred_series, ["mae"], reduction=None
+        )["mae"]
+        self.assertEqual(per_component.shape, (10, 2))
+        np.testing.assert_allclose(
+            per_component[3],
+            metrics.mae(
+                self.actual_series[3], self.pred_series[3], reduction=lambda x: x
+            ),
+        )
+
+        self.assertAlmostEqual(
+            batch_metrics(
+                self.actual_series,
+                self.pred_series,
+                ["mae"],
+                inter_reduction=np.mean,
+            )["mae"],
+            metrics.mae(self.actual_series, self.pred_series, inter_reduction=np.mean),
+        )
+
+        # a single pair of series gives a float
+        value = batch_metrics(self.actual_series[0], self.pred_series[0], ["mae"])
+        self.assertIsInstance(value["mae"], float)
+
+    def test_padding_and_nans(self):
+        actual = [
+            tg.constant_timeseries(value=1.0, length=10),
+            tg.constant_timeseries(value=1.0, length=5).stack(
+                tg.constant_timeseries(value=2.0, length=5)
+            ),
+        ]
+        values = np.full((6, 1), 3.0)
+        values[2] = np.nan
+        pred = [
+            TimeSeries.from_times_and_values(
+                pd.date_range(actual[0].start_time(), periods=6, freq="D"), values
+            )[1:],
+            actual[1] + 1,
+        ]
+        aligned = align_series(actual, pred)
+        self.assertEqual(aligned.y_true.shape, (2, 5, 2))
+        np.testing.assert_array_equal(aligned.counts, [[4, 0], [5, 5]])
+
+        results = batch_metrics(actual, pred, ["mae"], reduction=None)["mae"]
+        np.testing.assert_array_equal(results, [[2.0, np.nan], [1.0, 1.0]])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            batch_metrics(self.actual_series, self.pred_series, ["dtw_metric"])
+        with self.assertRaises(ValueError):
+            batch_metrics(self.actual_series, self.pred_series[:-1], ["mae"])
+        with self.assertRaises(ValueError):
+            batch_metrics(self.actual_series, self.pred_series, ["mase"])
+
+        # disjoint series
+        series = tg.constant_timeseries(value=1.0, length=10)
+        with self.assertRaises(ValueError):
+            batch_metrics(series[:5], series[5:], ["mae"])
+        with self.assertRaises(ValueError):
+            batch_metrics(series, series[2:], ["mae"], intersect=False)
+
+        with self.assertRaises(ValueError):
+            batch_metrics(series - 1, series, ["mape"])
@@ -0,0 +1,123 @@
+import copy
+import pickle
+
+import numpy as np
+
+from darts.tests.base_test_class import DartsBaseTestClass
+from darts.logging import get_logger
+from darts.utils import timeseries_generation as tg
+
+logger = get_logger(__name__)
+
+try:
+    from darts.models.forecasting.rnn_model import RNNModel
+
+    TORCH_AVAILABLE = True
+except ImportError:
+    logger.warning("Torch not available. RNN tests will be skipped.")
+    TORCH_AVAILABLE = False
+
+
+if TORCH_AVAILABLE:
+
+    class RNNModelTestCase(DartsBaseTestClass):
+        __test__ = True
+        series = [
+            tg.sine_timeseries(length=80, value_frequency=0.05 * (k + 1), value_phase=k)
+            for k in range(3)
+        ]
+        covariates = [
+            tg.linear_timeseries(length=100).stack(tg.sine_timeseries(length=100))
+            for _ in range(3)
+        ]
+
+        def assert_forecasts_close(self, forecasts, expected):
+            self.assertEqual(len(forecasts), len(expected))
+            for forecast, expected_forecast in zip(forecasts, expected):
+                self.assertEqual(
+                    forecast.time_index[0], expected_forecast.time_index[0]
+                )
+                np.testing.assert_allclose(
+                    forecast.values(), expected_forecast.values(), atol=1e-6
+                )
+
+        def test_predict_incremental(self):
+            for rnn_type in ["GRU", "LSTM"]:
+                for covariates in [None, self.covariates]:
+                    model = RNNModel(
+                        rnn_type, 12, training_length=20, n_epochs=1, random_state=0
+                    )
+                    model.fit(self.series, future_covariates=covariates)
+
+                    # the first forecasts read the last `input_chunk_length` points, as predict()
+                    history = [ts[:50] for ts in self.series]
+                    self.assert_forecasts_close(
+                        model.predict_incremental(
+                            4, history, ["a", "b", "c"], future_covariates=covariates
+                        ),
+                        model.predict(4, history, future_covariates=covariates),
+                    )
+
+                    # the states are advanced by the new points, as if the network read a longer input chunk
+                    history = [ts[:53] for ts in self.series[:2]] + [
+                        self.series[2][:51]
+                    ]
+                    forecasts = model.predict_incremental(
+                        4, history, ["a", "b", "c"], future_covariates=covariates
+                    )
+                    longer_model = copy.deepcopy(model)
+                    for idx, chunk_length in [(0, 15), (2, 13)]:
+                        longer_model.input_chunk_length = chunk_length
+                        self.assert_forecasts_close(
+                            [forecasts[idx]],
+                            [
+                                longer_model.predict(
+                                    4,
+                                    history[idx],
+                                    future_covariates=None
+                                    if covariates is None
+                                    else covariates[idx],
+                                )
+                            ],
+                        )
+
+                    # the states summarizing more than `max_state_length` points are rebuilt
+                    self.assert_forecasts_close(
+                        model.predict_incremental(
+                            4,
+                            [ts[:60] for ts in self.series],
+                            ["a", "b", "c"],
+                            future_covariates=covariates,
+                        ),
+                        model.predict(
+                            4,
+                            [ts[:60] for ts in self.series],
+                            future_covariates=covariates,
+                        ),
+                    )
+
+        def test_inference_cache(self):
+            model = RNNModel(
+                "RNN", 6, n_epochs=1, random_state=0, inference_cache_size=2
+            )
+            with self.assertRaises(ValueError):
+                model.predict_incremental(2, self.series[0], "a")
+            model.fit(self.series)
+
+            model.predict_incremental(2, self.series, ["a", "b", "c"])
+            self.assertEqual(list(model._inference_cache[1]), ["b", "c"])
+            model.predict_incremental(2, self.series[0], "a")
+            self.assertEqual(list(model._inference_cache[1]), ["c", "a"])
+
+            # the states are not saved with the model, and are discarded when it is trained again
+            self.assertIsNone(pickle.loads(pickle.dumps(model))._inference_cache)
+            model.fit(self.series, epochs=1)
+            model.predict_incremental(2, self.series[1], "b")
+            self.assertEqual(list(model._inference_cache[1]), ["b"])
+
+            with self.assertRaises(ValueError):
+                model.predict_incremental(2, self.series, ["a", "b"])
+            with self.assertRaises(ValueError):
+                model.predict_incremental(
+                    2, self.series[0], "a", future_covariates=self.covariates[0]
+                )
@@ -1,3 +1,4 @@
+import functools
 import unittest
 import numpy as np
 import pandas as pd
@@ -6,7 +7,7 @@ from itertools import product
 
 from darts.tests.base_test_class import DartsBaseTestClass
 from darts import TimeSeries
-from darts.metrics import mape, r2_score
+from darts.metrics import mae, mape, r2_score
 from darts.utils.timeseries_generation import (
     linear_timeseries as lt,
     sine_timeseries as st,
@@ -194,6 +195,119 @@ class BacktestingTestCase(DartsBaseTestClass):
             self.assertEqual(pred.width, 2)
             self.assertEqual(pred.end_time(), linear_series.end_time())
 
+    def test_backtest_multiple_series_n_jobs(self):
+        series = [lt(length=50), st(length=40, value_y_offset=2)]
+        model = ExponentialSmoothing(seasonal=None)
+
+        forecasts = model.historical_forecasts(
+            series, start=0.7, forecast_horizon=3, last_points_only=False
+        )
+        self.assertEqual(len(forecasts), 2)
+        for ts, ts_forecasts in zip(series, forecasts):
+            self.assertEqual(
+                ts_forecasts,
+                model.historical_forecasts(
+                    ts, start=0.7, forecast_horizon=3, last_points_only=False
+                ),
+            )
+
+        # the parallel forecasts are identical and returned in the same order
+        self.assertEqual(
+            forecasts,
+            model.historical_forecasts(
+                series, start=0.7, forecast_horizon=3, last_points_only=False, n_jobs=2
+            ),
+        )
+
+        scores = model.backtest(series, start=0.7, forecast_horizon=3, n_jobs=2)
+        self.assertEqual(
+            scores,
+            [model.backtest(ts, start=0.7, forecast_horizon=3) for ts in series],
+        )
+
+    def test_backtest_multiple_metrics(self):
+        series = lt(length=50, start_value=1, end_value=10) + st(length=50)
+        model = NaiveDrift()
+
+        def max_error(actual_series, pred_series):
+            actual_series = actual_series.slice_intersect(pred_series)
+            return float(np.max(np.abs((actual_series - pred_series).values())))
+
+        metrics = {"mape": mape, "mae": mae, "max_error": max_error}
+        errors = model.backtest(
+            series, start=0.7, forecast_horizon=3, metric=metrics, reduction=None
+        )
+        forecasts = model.historical_forecasts(
+            series, start=0.7, forecast_horizon=3, last_points_only=False
+        )
+        self.assertIsInstance(errors, pd.DataFrame)
+        self.assertEqual(list(errors.columns), ["mape", "mae", "max_error"])
+        self.assertEqual(
+            list(errors.index), [forecast.start_time() for forecast in forecasts]
+        )
+        for name, metric in metrics.items():
+            np.testing.assert_allclose(
+                errors[name],
+                model.backtest(
+                    series,
+                    start=0.7,
+                    forecast_horizon=3,
+                    metric=metric,
+                    reduction=None,
+                ),
+            )
+
+        # reduced errors, by metric name
+        errors = model.backtest(
+            [series, series + 1], start=0.7, forecast_horizon=3, metric=[mape, mae]
+        )
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(list(errors[0].index), ["mape", "mae"])
+        self.assertAlmostEqual(
+            errors[1]["mape"],
+            model.backtest(series + 1, start=0.7, forecast_horizon=3, metric=mape),
+        )
+
+        # metrics without a name are named after their repr, and the names must be unique
+        scaled_mae = functools.partial(mae)
+        errors = model.backtest(
+            series, start=0.7, forecast_horizon=3, metric=[mae, scaled_mae]
+        )
+        self.assertEqual(list(errors.index), ["mae", repr(scaled_mae)])
+        self.assertAlmostEqual(errors["mae"], errors[repr(scaled_mae)])
+        with self.assertRaises(ValueError):
+            model.backtest(
+                series,
+                start=0.7,
+                forecast_horizon=3,
+                metric=[lambda a, b: 1.0, lambda a, b: 2.0],
+            )
+        errors = model.backtest(
+            series,
+            start=0.7,
+            forecast_horizon=3,
+            metric={"one": lambda a, b: 1.0, "two": lambda a, b: 2.0},
+        )
+        self.assertEqual(list(errors), [1.0, 2.0])
+
+        errors = model.backtest(
+            series,
+            start=0.7,
+            forecast_horizon=3,
+            metric=[mape, mae],
+            last_points_only=True,
+        )
+        self.assertAlmostEqual(
+            errors["mae"],
+            model.backtest(
+                series,
+                start=0.7,
+                forecast_horizon=3,
+                metric=mae,
+                last_points_only=True,
+            ),
+        )
+
     @unittest.skipUnless(TORCH_AVAILABLE, "requires torch")
     def test_backtest_regression(self):
         np.random.seed(4)
@@ -441,6 +555,96 @@ class BacktestingTestCase(DartsBaseTestClass):
 
             self.assertEqual(best_params1, best_params2)
 
+    def test_gridsearch_successive_halving(self):
+        np.random.seed(1)
+        dummy_series = st(length=100, value_frequency=1 / 12, value_y_offset=10) + gt(
+            length=100, std=0.05
+        )
+        params = {"K": list(range(1, 15))}
+
+        # the seasonal model repeating the right period is found on a fraction of the backtest
+        for halving_factor in [2, 3]:
+            _, best_params = NaiveSeasonal.gridsearch(
+                params,
+                dummy_series,
+                forecast_horizon=6,
+                start=0.5,
+                metric=mape,
+                halving_factor=halving_factor,
+            )
+            self.assertEqual(best_params, {"K": 12})
+
+        train, val = dummy_series.split_before(0.8)
+        _, best_params = NaiveSeasonal.gridsearch(
+            params, train, val_series=val, metric=mape, halving_factor=4
+        )
+        self.assertEqual(best_params, {"K": 12})
+
+        with self.assertRaises(ValueError):
+            NaiveSeasonal.gridsearch(
+                params, dummy_series, forecast_horizon=6, halving_factor=1
+            )
+        with self.assertRaises(ValueError):
+            NaiveSeasonal.gridsearch(
+                params,
+                dummy_series,
+                forecast_horizon=6,
+                halving_factor=2,
+                budget_parameter="n_epochs",
+            )
+
+    def test_gridsearch_multiple_metrics(self):
+        np.random.seed(1)
+        dummy_series = st(length=100, value_frequency=1 / 12, value_y_offset=10) + gt(
+            length=100, std=0.05
+        )
+        params = {"K": list(range(1, 15))}
+
+        # the combinations are ranked by the first metric
+        for kwargs in [
+            {"forecast_horizon": 6},
+            {"forecast_horizon": 6, "halving_factor": 3},
+            {"use_fitted_values": False, "val_series": dummy_series[80:]},
+        ]:
+            series = dummy_series if "forecast_horizon" in kwargs else dummy_series[:80]
+            _, best_params, scores = NaiveSeasonal.gridsearch(
+                params, series, metric=[mape, r2_score], **kwargs
+            )
+            self.assertEqual(best_params, {"K": 12})
+            self.assertEqual(scores["mape"].idxmin(), 11)
+            self.assertEqual(list(scores["K"])[-1], 14)
+            self.assertIn("r2_score", scores.columns)
+            self.assertEqual("budget" in scores.columns, "halving_factor" in kwargs)
+
+        _, _, scores = NaiveSeasonal.gridsearch(
+            params, dummy_series, forecast_horizon=6, metric={"error": mape}
+        )
+        self.assertEqual(list(scores.columns), ["K", "error"])
+        self.assertAlmostEqual(
+            scores["error"][0],
+            NaiveSeasonal(K=1).backtest(dummy_series, forecast_horizon=6, metric=mape),
+        )
+
+    @unittest.skipUnless(TORCH_AVAILABLE, "requires torch")
+    def test_gridsearch_successive_halving_budget_parameter(self):
+        dummy_series = st(length=60, value_frequency=0.1, value_y_offset=10) + lt(
+            length=60
+        )
+        train, val = dummy_series.split_before(0.8)
+        params = {"lags": [1, 5, 10, 20], "n_estimators": [20], "random_state": [0]}
+
+        # the budget parameter of the returned model is not scaled
+        model, best_params = RandomForest.gridsearch(
+            params,
+            train,
+            val_series=val,
+            metric=mape,
+            halving_factor=2,
+            budget_parameter="n_estimators",
+        )
+        self.assertEqual(best_params["n_estimators"], 20)
+        self.assertEqual(model.model.n_estimators, 20)
+
     @unittest.skipUnless(TORCH_AVAILABLE, "requires torch")
     def test_gridsearch_multi(self):
         dummy_series = st(length=40, value_y_offset=10).stack(
@@ -413,6 +413,49 @@ if TORCH_AVAILABLE:
                     )
                     self.assertEqual(len(pred), n)
 
+        def test_historical_forecasts_without_retraining(self):
+            # the batched historical forecasts must match forecasts obtained by calling predict() successively
+            for model_cls, kwargs, err in models_cls_kwargs_errs:
+                model = model_cls(
+                    input_chunk_length=IN_LEN, output_chunk_length=OUT_LEN, **kwargs
+                )
+                if model._is_probabilistic():
+                    continue
+
+                if isinstance(model, PastCovariatesTorchModel):
+                    past_covs, future_covs = self.covariates, None
+                elif isinstance(model, DualCovariatesTorchModel):
+                    past_covs, future_covs = None, self.covariates
+                else:
+                    past_covs, future_covs = self.covariates, self.covariates
+
+                model.fit(
+                    self.target_past,
+                    past_covariates=past_covs,
+                    future_covariates=future_covs,
+                    epochs=1,
+                )
+
+                forecasts = model.historical_forecasts(
+                    self.target[:300],
+                    past_covariates=past_covs,
+                    future_covariates=future_covs,
+                    start=0.8,
+                    forecast_horizon=OUT_LEN + 2,
+                    stride=5,
+                    retrain=False,
+                    last_points_only=False,
+                )
+                for forecast in forecasts:
+                    pred = model.predict(
+                        n=OUT_LEN + 2,
+                        series=self.target.drop_after(forecast.start_time()),
+                        past_covariates=past_covs,
+                        future_covariates=future_covs,
+                    )
+                    self.assertTrue(forecast.time_index.equals(pred.time_index))
+                    np.testing.assert_almost_equal(forecast.values(), pred.values())
+
         def test_same_result_with_different_n_jobs(self):
             for model_cls, kwargs, err in models_cls_kwargs_errs:
                 model = model_cls(
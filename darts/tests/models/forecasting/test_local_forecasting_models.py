@@ -7,6 +7,8 @@ from darts.utils import timeseries_generation as tg
 from darts.metrics import mape
 from darts.models import (
     NaiveSeasonal,
+    NaiveMean,
+    NaiveDrift,
     ExponentialSmoothing,
     ARIMA,
     Theta,
@@ -183,6 +185,56 @@ class LocalForecastingModelsTestCase(DartsBaseTestClass):
             with self.assertRaises(ValueError):
                 model.fit(self.ts_gaussian[1:], future_covariates=self.ts_gaussian[:-1])
 
+    def test_models_update(self):
+        train, extended = self.ts_pass_train[:-12], self.ts_pass_train
+        for model, tolerance in [
+            (NaiveMean(), 1e-10),
+            (NaiveDrift(), 1e-10),
+            (ExponentialSmoothing(seasonal=None), 1.0),
+            (ARIMA(2, 1, 1), 1.0),
+        ]:
+            # an update is equivalent to a (warm-started) fit on the extended series
+            updated = model.untrained_model().fit(train).update(extended)
+            refitted = model.untrained_model().fit(extended)
+            self.assertEqual(updated.training_series, extended)
+            self.assertLess(
+                mape(updated.predict(12), refitted.predict(12)), tolerance, str(model)
+            )
+
+            # the series must extend the training series
+            with self.assertRaises(ValueError):
+                model.untrained_model().update(extended)
+            with self.assertRaises(ValueError):
+                model.untrained_model().fit(train).update(extended[1:])
+
+        # models are updated with future covariates if and only if they were trained with some
+        model = ARIMA(2, 1, 1).fit(
+            self.ts_gaussian[:-10], future_covariates=self.ts_gaussian_long
+        )
+        model.update(self.ts_gaussian, future_covariates=self.ts_gaussian_long)
+        prediction = model.predict(
+            self.forecasting_horizon, future_covariates=self.ts_gaussian_long
+        )
+        self.assertEqual(
+            prediction.start_time(), self.ts_gaussian.end_time() + self.ts_gaussian.freq
+        )
+        with self.assertRaises(ValueError):
+            model.update(self.ts_gaussian)
+
+    def test_historical_forecasts_update(self):
+        # sequential historical forecasts update the model, while the parallel ones refit it
+        for model in [NaiveMean(), NaiveDrift()]:
+            updated = model.historical_forecasts(
+                self.ts_passengers, start=0.7, last_points_only=False
+            )
+            refitted = model.historical_forecasts(
+                self.ts_passengers, start=0.7, last_points_only=False, n_jobs=2
+            )
+            for forecast_updated, forecast_refitted in zip(updated, refitted):
+                np.testing.assert_allclose(
+                    forecast_updated.values(), forecast_refitted.values()
+                )
+
     def test_dummy_series(self):
         values = np.random.uniform(low=-10, high=10, size=100)
         ts = TimeSeries.from_dataframe(pd.DataFrame({"V1": values}))
@@ -212,6 +212,72 @@ if TORCH_AVAILABLE:
             )
             self.assertEqual(training_labels[0], 5)
 
+        def test_training_data_creation_alignment(self):
+            # covariates starting at other times than the target, and missing values in the target
+            values = np.arange(50.0)
+            values[[20, 40]] = np.nan
+            target = TimeSeries.from_times_and_values(
+                pd.date_range("2000-01-01", periods=50, freq="D"), values
+            )
+            past_covariates = tg.linear_timeseries(
+                start_value=0,
+                end_value=59,
+                start=pd.Timestamp("1999-12-25"),
+                length=60,
+            )
+            future_covariates = tg.linear_timeseries(
+                start_value=0,
+                end_value=59,
+                start=pd.Timestamp("2000-01-03"),
+                length=60,
+            )
+            model_instance = RegressionModel(
+                lags=self.lags_1,
+                lags_past_covariates=self.lags_past_covariates_1,
+                lags_future_covariates=self.lags_future_covariates_1,
+            )
+
+            # expected samples, built time step by time step
+            expected_X, expected_y = [], []
+            for time in target.time_index:
+                row = []
+                for ts, lags in [
+                    (target, self.lags_1),
+                    (past_covariates, self.lags_past_covariates_1),
+                    (future_covariates, self.lags_future_covariates_1),
+                ]:
+                    times = [time + lag * ts.freq for lag in lags + [0]]
+                    if times[0] < ts.start_time() or times[-2] > ts.end_time():
+                        break
+                    if time > ts.end_time() or time < ts.start_time():
+                        break
+                    row += [ts[t].univariate_values()[0] for t in times[:-1]]
+                else:
+                    label = target[time].univariate_values()[0]
+                    if not np.isnan(row + [label]).any():
+                        expected_X.append(row)
+                        expected_y.append([label])
+
+            for max_samples_per_ts in [None, 3, 15]:
+                X, y = model_instance._create_lagged_data(
+                    target_series=[target, target],
+                    past_covariates=[past_covariates, past_covariates],
+                    future_covariates=[future_covariates, future_covariates],
+                    max_samples_per_ts=max_samples_per_ts,
+                )
+                exp_X = (
+                    expected_X[-max_samples_per_ts:]
+                    if max_samples_per_ts
+                    else expected_X
+                )
+                exp_y = (
+                    expected_y[-max_samples_per_ts:]
+                    if max_samples_per_ts
+                    else expected_y
+                )
+                np.testing.assert_array_equal(X, np.array(exp_X + exp_X))
+                np.testing.assert_array_equal(y, np.array(exp_y + exp_y))
+
         def test_prediction_data_creation(self):
             model_instance = RegressionModel(
                 lags=self.lags_1,
@@ -437,6 +503,112 @@ if TORCH_AVAILABLE:
             )
             self.assertEqual(len(result), 51)
 
+        def test_historical_forecast_without_retraining(self):
+            # the batched historical forecasts must match forecasts obtained by calling predict() successively
+            series = self.ts_sum1[:100]
+            past_covariates = self.ts_cov1[:110]
+            future_covariates = self.ts_cov2[:120]
+            model = LinearRegressionModel(
+                lags=4, lags_past_covariates=[-3, -1], lags_future_covariates=(2, 3)
+            )
+            model.fit(
+                series[:50],
+                past_covariates=past_covariates,
+                future_covariates=future_covariates,
+            )
+
+            for forecast_horizon, stride in [(1, 1), (4, 3)]:
+                forecasts = model.historical_forecasts(
+                    series=series,
+                    past_covariates=past_covariates,
+                    future_covariates=future_covariates,
+                    start=0.4,
+                    forecast_horizon=forecast_horizon,
+                    stride=stride,
+                    retrain=False,
+                    last_points_only=False,
+                )
+                last_points = model.historical_forecasts(
+                    series=series,
+                    past_covariates=past_covariates,
+                    future_covariates=future_covariates,
+                    start=0.4,
+                    forecast_horizon=forecast_horizon,
+                    stride=stride,
+                    retrain=False,
+                    last_points_only=True,
+                )
+                self.assertEqual(len(forecasts), len(last_points))
+                self.assertEqual(last_points.freq, series.freq * stride)
+
+                for forecast in forecasts:
+                    expected = model.predict(
+                        n=forecast_horizon,
+                        series=series.drop_after(forecast.start_time()),
+                        past_covariates=past_covariates,
+                        future_covariates=future_covariates,
+                    )
+                    self.assertTrue(forecast.time_index.equals(expected.time_index))
+                    np.testing.assert_almost_equal(forecast.values(), expected.values())
+                    np.testing.assert_almost_equal(
+                        last_points[forecast.end_time()].values(),
+                        expected.values()[-1:],
+                    )
+
+        def test_historical_forecast_without_retraining_short_covariates(self):
+            # the batched historical forecasts accept exactly the covariates accepted by predict()
+            series = self.ts_sum1[:100]
+            covariates = {
+                "past_covariates": self.ts_cov1[:120],
+                "future_covariates": self.ts_cov2[:120],
+            }
+            model = LinearRegressionModel(
+                lags=4, lags_past_covariates=[-3, -1], lags_future_covariates=(2, 3)
+            )
+            model.fit(series[:50], **covariates)
+            forecast_horizon, pred_times = 4, list(series.time_index[60:91:3])
+
+            def predict_accepts(kwargs):
+                try:
+                    model.predict(
+                        n=forecast_horizon,
+                        series=series.drop_after(pred_times[-1]),
+                        **kwargs,
+                    )
+                except ValueError:
+                    return False
+                return True
+
+            for name, ts in covariates.items():
+                # the shortest covariates accepted by predict() for the last prediction time
+                length = next(
+                    length
+                    for length in range(90, len(ts))
+                    if predict_accepts({**covariates, name: ts[:length]})
+                )
+                for cov_length, accepted in [(length, True), (length - 1, False)]:
+                    kwargs = {**covariates, name: ts[:cov_length]}
+                    forecasts = model._batched_historical_forecasts(
+                        series=series,
+                        pred_times=pred_times,
+                        forecast_horizon=forecast_horizon,
+                        stride=3,
+                        num_samples=1,
+                        **kwargs,
+                    )
+                    self.assertEqual(forecasts is not None, accepted)
+                    self.assertEqual(predict_accepts(kwargs), accepted)
+
+                with self.assertRaises(ValueError):
+                    model.historical_forecasts(
+                        series=series,
+                        start=pred_times[0],
+                        forecast_horizon=forecast_horizon,
+                        stride=3,
+                        retrain=False,
+                        **{**covariates, name: ts[: length - 1]},
+                    )
+
         def test_regression_model(self):
             lags = 12
             models = [
@@ -1,6 +1,10 @@
 import os
+import pickle
+import unittest
 import tempfile
 import shutil
+import time
+import numpy as np
 import pandas as pd
 
 from darts import TimeSeries
@@ -11,7 +15,10 @@ from unittest.mock import patch
 logger = get_logger(__name__)
 
 try:
+    import torch
     from darts.models.forecasting.rnn_model import RNNModel
+    from darts.models.forecasting.tcn_model import TCNModel
+    from darts.utils.data import WindowSampler
 
     TORCH_AVAILABLE = True
 except ImportError:
@@ -273,3 +280,411 @@ if TORCH_AVAILABLE:
 
             model1.fit(series, epochs=15)
             self.assertEqual(model1.total_epochs, 25)
+
+        def test_mixed_precision(self):
+            series = TimeSeries.from_values(np.sin(np.arange(100) / 4)).astype(
+                np.float32
+            )
+            for mixed_precision in ["bf16", "fp16"]:
+                model = RNNModel(
+                    "RNN",
+                    10,
+                    10,
+                    n_epochs=2,
+                    mixed_precision=mixed_precision,
+                    work_dir=self.temp_work_dir,
+                )
+                model.fit(series)
+                self.assertTrue(np.isfinite(model.predict(n=4).values()).all())
+
+            # mixed precision requires float32 series
+            model = RNNModel(
+                "RNN", 10, 10, mixed_precision="bf16", work_dir=self.temp_work_dir
+            )
+            with self.assertRaises(ValueError):
+                model.fit(series.astype(np.float64))
+
+            with self.assertRaises(ValueError):
+                RNNModel("RNN", 10, 10, mixed_precision="int8")
+
+        def test_accumulate_grad_batches(self):
+            series = TimeSeries.from_values(np.sin(np.arange(100) / 4))
+            dataset = RNNModel("RNN", 10, 10)._build_train_dataset(
+                [series], None, None, None
+            )
+            n_samples = len(dataset) - len(dataset) % 2
+
+            # the accumulated gradients of two half batches are those of the full batch
+            predictions = []
+            for batch_size, accumulate_grad_batches in [
+                (n_samples, 1),
+                (n_samples // 2, 2),
+            ]:
+                model = RNNModel(
+                    "RNN",
+                    10,
+                    10,
+                    n_epochs=1,
+                    batch_size=batch_size,
+                    accumulate_grad_batches=accumulate_grad_batches,
+                    optimizer_cls=torch.optim.SGD,
+                    optimizer_kwargs={"lr": 0.1},
+                    random_state=42,
+                    work_dir=self.temp_work_dir,
+                )
+                model.fit(series[-(n_samples + 24) :])
+                predictions.append(model.predict(n=4).values())
+            np.testing.assert_allclose(predictions[0], predictions[1], rtol=1e-6)
+
+            with self.assertRaises(ValueError):
+                RNNModel("RNN", 10, 10, accumulate_grad_batches=0)
+
+        def test_tensorized_training(self):
+            series = [
+                TimeSeries.from_values(np.sin(np.arange(60) / 4)),
+                TimeSeries.from_values(np.cos(np.arange(50) / 3)),
+            ]
+            # the batch sampler draws the same batches as the default loader
+            predictions = []
+            for tensorize in [False, True]:
+                model = RNNModel(
+                    "RNN",
+                    10,
+                    10,
+                    n_epochs=2,
+                    batch_size=16,
+                    random_state=42,
+                    work_dir=self.temp_work_dir,
+                )
+                model.fit(series, val_series=series, tensorize=tensorize)
+                predictions.append(model.predict(n=4, series=series[0]).values())
+            np.testing.assert_allclose(predictions[0], predictions[1])
+
+        def test_fit_with_sampler(self):
+            series = [
+                TimeSeries.from_values(np.sin(np.arange(60) / 4)),
+                TimeSeries.from_values(np.cos(np.arange(30) / 3)),
+            ]
+            model = RNNModel(
+                "RNN", 10, 10, n_epochs=1, batch_size=8, work_dir=self.temp_work_dir
+            )
+            dataset = model._build_train_dataset(series, None, None, None)
+            sampler = WindowSampler(dataset, num_samples=24, replacement=False)
+            for tensorize in [False, True]:
+                if tensorize:
+                    dataset.tensorize()
+                loader = model._build_data_loader(
+                    dataset, shuffle=True, num_loader_workers=0, sampler=sampler
+                )
+                self.assertEqual(len(loader), 3)
+                self.assertEqual(sum(len(batch[0]) for batch in loader), 24)
+            model.fit_from_dataset(dataset, sampler=sampler)
+            self.assertEqual(model.total_epochs, 1)
+
+        def test_early_stopping(self):
+            series = TimeSeries.from_values(np.sin(np.arange(120) / 4))
+            train, val = series[:90], series[90:]
+
+            def fit_model(n_epochs, **kwargs):
+                model = RNNModel(
+                    "RNN",
+                    10,
+                    10,
+                    n_epochs=n_epochs,
+                    nr_epochs_val_period=1,
+                    optimizer_kwargs={"lr": 0.1},
+                    random_state=0,
+                    work_dir=self.temp_work_dir,
+                    **kwargs,
+                )
+                return model.fit(train, val_series=val)
+
+            # with an impossible improvement, the training stops after `patience` evaluations
+            model = fit_model(
+                20, early_stopping_patience=2, early_stopping_min_delta=1e9
+            )
+            self.assertEqual(model.total_epochs, 3)
+
+            # the weights of the best epoch are restored in place of the last ones
+            model = fit_model(10, restore_best_weights=True)
+            val_losses = []
+            for n_epochs in range(1, 11):
+                val_model = fit_model(n_epochs)
+                val_losses.append(
+                    val_model._evaluate_validation_loss(
+                        val_model._build_data_loader(
+                            val_model._build_train_dataset([val], None, None, None),
+                            shuffle=False,
+                            num_loader_workers=0,
+                        )
+                    )
+                )
+            best_model = fit_model(int(np.argmin(val_losses)) + 1)
+            np.testing.assert_allclose(
+                model.predict(n=4).values(), best_model.predict(n=4).values()
+            )
+
+        def test_state_dict_checkpoints(self):
+            series = TimeSeries.from_values(np.sin(np.arange(120) / 4))
+            model = RNNModel(
+                "RNN",
+                10,
+                10,
+                n_epochs=7,
+                nr_epochs_val_period=1,
+                random_state=0,
+                model_name="state_dicts",
+                work_dir=self.temp_work_dir,
+                save_checkpoints=True,
+                checkpoint_state_dicts=True,
+            )
+            model.fit(series[:90], val_series=series[90:])
+            checkpoints = os.listdir(
+                os.path.join(self.temp_work_dir, "checkpoints", "state_dicts")
+            )
+            # the files of the last epochs are kept
+            weights = [name for name in checkpoints if name.startswith("weights_")]
+            self.assertIn("weights_6.pth.tar", weights)
+            self.assertLessEqual(len(weights), 5)
+            self.assertEqual(
+                len([name for name in checkpoints if name.startswith("best_weights_")]),
+                1,
+            )
+
+            # the weights of the last epoch are those of the trained model
+            prediction = model.predict(n=4).values()
+            model.load_weights_from_checkpoint(best=False)
+            self.assertEqual(model.total_epochs, 7)
+            np.testing.assert_allclose(model.predict(n=4).values(), prediction)
+
+            model.load_weights_from_checkpoint(file_name="weights_3.pth.tar")
+            self.assertEqual(model.total_epochs, 4)
+            with self.assertRaises(FileNotFoundError):
+                RNNModel("RNN", 10, 10, work_dir=self.temp_work_dir, n_epochs=1).fit(
+                    series
+                ).load_weights_from_checkpoint()
+
+        def test_state_dict_checkpoints_failed_training(self):
+            series = TimeSeries.from_values(np.sin(np.arange(120) / 4))
+            model = RNNModel(
+                "RNN",
+                10,
+                10,
+                n_epochs=7,
+                nr_epochs_val_period=1,
+                random_state=0,
+                model_name="failed_training",
+                work_dir=self.temp_work_dir,
+                save_checkpoints=True,
+                checkpoint_state_dicts=True,
+            )
+            save_model_from_fit = model._save_model_from_fit
+
+            def slow_save_model_from_fit(*args, **kwargs):
+                time.sleep(0.2)
+                return save_model_from_fit(*args, **kwargs)
+
+            # the validation of the third epoch fails, after its checkpoint was queued
+            with patch.object(
+                model, "_save_model_from_fit", side_effect=slow_save_model_from_fit
+            ), patch.object(
+                model,
+                "_evaluate_validation_loss",
+                side_effect=[1.0, 1.0, RuntimeError("failed validation")],
+            ):
+                with self.assertRaises(RuntimeError):
+                    model.fit(series[:90], val_series=series[90:])
+
+            # the queued checkpoints were written before the error was raised
+            checkpoints = os.listdir(
+                os.path.join(self.temp_work_dir, "checkpoints", "failed_training")
+            )
+            for epoch in range(3):
+                self.assertIn(f"weights_{epoch}.pth.tar", checkpoints)
+
+        def test_predict_return_array(self):
+            series = [
+                TimeSeries.from_values(np.sin(np.arange(40) / (k + 2)))
+                for k in range(3)
+            ]
+            model = RNNModel("RNN", 10, 10, n_epochs=1, random_state=0)
+            model.fit(series)
+            forecasts = model.predict(n=3, series=series, batch_size=2)
+            array = model.predict(n=3, series=series, batch_size=2, return_array=True)
+            self.assertEqual(array.values.shape, (3, 3, 1, 1))
+            self.assertEqual(array.to_series(), forecasts)
+            # a single series also gives an array
+            array = model.predict(n=3, series=series[0], return_array=True)
+            self.assertEqual(len(array), 1)
+            self.assertTrue(array.time_index(0).equals(forecasts[0].time_index))
+
+        def test_autoregressive_roll_out(self):
+            series = TimeSeries.from_values(np.sin(np.arange(60) / 4))
+            covariates = TimeSeries.from_values(np.cos(np.arange(80) / 3))
+            model = TCNModel(12, 4, n_epochs=1, random_state=0)
+            model.fit(series, past_covariates=covariates)
+
+            # each step feeds back `roll_size` predictions, and the last one ends at `n`
+            prediction = model.predict(n=11, past_covariates=covariates, roll_size=1)
+            self.assertEqual(
+                model.predict(n=4, past_covariates=covariates)[:1], prediction[:1]
+            )
+            for start in [3, 6]:
+                self.assertEqual(
+                    model.predict(
+                        n=4,
+                        series=series.append(prediction[:start]),
+                        past_covariates=covariates,
+                    )[:1],
+                    prediction[start : start + 1],
+                )
+            self.assertEqual(
+                model.predict(
+                    n=4,
+                    series=series.append(prediction[:7]),
+                    past_covariates=covariates,
+                ),
+                prediction[7:],
+            )
+
+        @unittest.skipUnless(
+            torch.distributed.is_available(), "requires torch.distributed"
+        )
+        def test_distributed_training(self):
+            series = [
+                TimeSeries.from_values(np.sin(np.arange(60) / (k + 2)))
+                for k in range(3)
+            ]
+            model = RNNModel(
+                "RNN",
+                10,
+                10,
+                n_epochs=3,
+                batch_size=16,
+                random_state=0,
+                model_name="distributed",
+                work_dir=self.temp_work_dir,
+                save_checkpoints=True,
+            )
+            model.fit_distributed(
+                num_processes=2, series=series[:2], val_series=series[2]
+            )
+            self.assertEqual(model.total_epochs, 3)
+            self.assertFalse(model._distributed)
+            self.assertEqual(len(model.predict(n=4, series=series[0])), 4)
+            # the checkpoints are saved by the first process only
+            checkpoints = os.listdir(
+                os.path.join(self.temp_work_dir, "checkpoints", "distributed")
+            )
+            self.assertEqual(
+                len([name for name in checkpoints if name.startswith("model_best_")]),
+                1,
+            )
+
+            # in a process group initialized from the environment variables, with the training datasets
+            environment = {
+                "MASTER_ADDR": "127.0.0.1",
+                "MASTER_PORT": "29533",
+                "RANK": "0",
+                "WORLD_SIZE": "1",
+            }
+            with patch.dict(os.environ, environment):
+                model.fit_distributed(
+                    train_dataset=model._build_train_dataset(series, None, None, None),
+                    epochs=1,
+                )
+            self.assertEqual(model.total_epochs, 4)
+            self.assertFalse(torch.distributed.is_initialized())
+
+        def test_torchscript_training(self):
+            series = TimeSeries.from_values(np.sin(np.arange(60) / 4))
+            predictions = []
+            for compile_model in [None, "torchscript"]:
+                model = TCNModel(
+                    12,
+                    4,
+                    n_epochs=2,
+                    dropout=0.0,
+                    compile_model=compile_model,
+                    random_state=42,
+                    work_dir=self.temp_work_dir,
+                )
+                model.fit(series)
+                predictions.append(model.predict(n=4).values())
+            np.testing.assert_allclose(predictions[0], predictions[1], atol=1e-4)
+
+            # the compiled network is reused, and is not saved with the model
+            compiled_network = model._compiled_network[2]
+            self.assertIsInstance(compiled_network, torch.jit.ScriptModule)
+            model.fit(series, epochs=1)
+            self.assertIs(model._compiled_network[2], compiled_network)
+
+            loaded_model = pickle.loads(pickle.dumps(model))
+            self.assertNotIn("_compiled_network", loaded_model.__dict__)
+            self.assertEqual(loaded_model.predict(n=4), model.predict(n=4))
+
+            with self.assertRaises(ValueError):
+                TCNModel(12, 4, compile_model="jit")
+
+
+# MINI_BENCHMARK
+def _benchmark_long_horizon_predict(n_series=1024, n_repeats=5):
+    """Times the autoregressive predictions of NBEATS and TFT over 10 output chunks, for a batch of `n_series` series
+    with past covariates. Run it on two commits to compare them, e.g. before and after a change of
+    `TorchForecastingModel._roll_out_prediction`:
+
+        python -c "from darts.tests.models.forecasting.test_torch_forecasting_model import \
+_benchmark_long_horizon_predict; _benchmark_long_horizon_predict()"
+    """
+    import time
+    from darts.models import NBEATSModel, TFTModel
+
+    input_chunk_length, output_chunk_length = 96, 24
+    n = 10 * output_chunk_length
+    length = input_chunk_length + n
+    np.random.seed(42)
+    series = [
+        TimeSeries.from_values(np.random.randn(length).cumsum().astype(np.float32))
+        for _ in range(n_series)
+    ]
+    covariates = [
+        TimeSeries.from_values(np.random.randn(length + n, 8).astype(np.float32))
+        for _ in range(n_series)
+    ]
+
+    models = {
+        "NBEATS": NBEATSModel(
+            input_chunk_length,
+            output_chunk_length,
+            num_stacks=4,
+            num_blocks=1,
+            layer_widths=128,
+            n_epochs=1,
+            random_state=42,
+        ),
+        "TFT": TFTModel(
+            input_chunk_length,
+            output_chunk_length,
+            hidden_size=16,
+            num_attention_heads=2,
+            add_relative_index=True,
+            n_epochs=1,
+            random_state=42,
+        ),
+    }
+    for name, model in models.items():
+        model.fit(series[:32], past_covariates=covariates[:32])
+        timings = []
+        for _ in range(n_repeats):
+            start = time.perf_counter()
+            model.predict(
+                n=n,
+                series=series,
+                past_covariates=covariates,
+                batch_size=n_series,
+            )
+            timings.append(time.perf_counter() - start)
+        print(
+            f"{name}: predict(n={n}) of {n_series} series, "
+            f"median of {n_repeats} runs: {np.median(timings):.3f}s"
+        )
@@ -1,14 +1,21 @@
+import os
+import pickle
+import tempfile
+
 import pandas as pd
 import numpy as np
 
 from darts.tests.base_test_class import DartsBaseTestClass
 from darts import TimeSeries
 from darts.utils.timeseries_generation import gaussian_timeseries
+from darts.utils.bulk_io import load_series_binary, save_series_binary
 from darts.logging import get_logger
 
 logger = get_logger(__name__)
 
 try:
+    import torch
+
     from darts.utils.data import (  # noqa: F401
         PastCovariatesInferenceDataset,
         FutureCovariatesInferenceDataset,
@@ -26,6 +33,7 @@ try:
         MixedCovariatesShiftedDataset,
         SplitCovariatesShiftedDataset,
         HorizonBasedDataset,
+        WindowSampler,
     )
 
     TORCH_AVAILABLE = True
@@ -1144,3 +1152,135 @@ if TORCH_AVAILABLE:
             target = TimeSeries.from_values(np.random.randn(100))
             cov = TimeSeries.from_times_and_values(times2, np.random.randn(len(times2)))
             self.assertEqual(_get_matching_index(target, cov, idx=15), 5)
+
+        def test_tensorized_datasets(self):
+            # the target and covariates series don't start at the same time
+            cov1 = self.cov1.stack(self.cov1).append_values(np.ones((10, 2)))
+            cov2 = TimeSeries.from_times_and_values(
+                pd.date_range(end=self.cov2.end_time(), periods=160, freq="D"),
+                np.random.randn(160, 2),
+            )
+            targets, covariates = [self.target1, self.target2], [cov1, cov2]
+            datasets = [
+                PastCovariatesShiftedDataset(targets, covariates, length=10, shift=5),
+                MixedCovariatesShiftedDataset(
+                    targets, covariates, covariates, length=10, max_samples_per_ts=60
+                ),
+                DualCovariatesSequentialDataset(targets, None, 10, 5),
+                SplitCovariatesSequentialDataset(
+                    targets, covariates, covariates, 10, 5
+                ),
+                HorizonBasedDataset(
+                    targets, covariates, output_chunk_length=10, lh=(1, 3), lookback=2
+                ),
+            ]
+            for ds in datasets:
+                self.assertFalse(ds.is_tensorized)
+                with self.assertRaises(ValueError):
+                    ds.get_batch([0])
+
+                self.assertIs(ds.tensorize(), ds)
+                indices = np.random.randint(0, len(ds), size=20)
+                batch = ds.get_batch(indices)
+                for i, elem in enumerate(batch):
+                    samples = [ds[idx][i] for idx in indices]
+                    if elem is None:
+                        self.assertIsNone(samples[0])
+                    else:
+                        np.testing.assert_array_equal(elem.numpy(), np.stack(samples))
+
+            # windows out of the covariates raise at tensorization time
+            ds = PastCovariatesShiftedDataset(targets, [cov1, cov2[20:]], length=10)
+            with self.assertRaises(ValueError):
+                ds.tensorize()
+
+        def test_datasets_from_binary_files(self):
+            targets = [self.target1, self.target2]
+            covariates = [self.cov1.stack(self.cov1), self.cov2.stack(self.cov2)]
+            with tempfile.TemporaryDirectory() as temp_dir:
+                target_path = os.path.join(temp_dir, "target.bin")
+                covariates_path = os.path.join(temp_dir, "covariates.bin")
+                save_series_binary(target_path, targets)
+                save_series_binary(covariates_path, covariates)
+                target_file = load_series_binary(target_path)
+                covariates_file = load_series_binary(covariates_path)
+
+                for cls in [
+                    PastCovariatesSequentialDataset,
+                    SplitCovariatesSequentialDataset,
+                ]:
+                    args = (covariates,) * (cls is SplitCovariatesSequentialDataset)
+                    file_args = (covariates_file,) * (
+                        cls is SplitCovariatesSequentialDataset
+                    )
+                    ds = cls(targets, covariates, *args, 10, 5)
+                    file_ds = cls(target_file, covariates_file, *file_args, 10, 5)
+                    self.assertEqual(len(file_ds), len(ds))
+
+                    # the datasets are pickled (e.g. for the loader workers) without their series
+                    file_ds = pickle.loads(pickle.dumps(file_ds))
+                    self.assertLess(
+                        len(pickle.dumps(file_ds)), len(pickle.dumps(ds)) // 10
+                    )
+                    for idx in [0, 10, len(ds) - 1]:
+                        for expected, elem in zip(ds[idx], file_ds[idx]):
+                            np.testing.assert_array_equal(elem, expected)
+
+                ds = HorizonBasedDataset(
+                    target_file, covariates_file, output_chunk_length=10
+                ).tensorize()
+                np.testing.assert_array_equal(ds.get_batch([7])[0][0], ds[7][0])
+
+        def test_window_sampler(self):
+            targets = [
+                TimeSeries.from_values(np.arange(length) + 1000.0 * i)
+                for i, length in enumerate([20, 50, 13])
+            ]
+            # 13, 43 and 6 distinct windows, and 43 samples per series
+            ds = PastCovariatesSequentialDataset(targets, None, 5, 3)
+            windows = {
+                idx: tuple(ds[idx][0][:, 0])
+                for idx in range(len(ds))
+                if idx % 43 < [13, 43, 6][idx // 43]
+            }
+            self.assertEqual(len(set(windows.values())), 62)
+
+            # by default, the distinct windows are all drawn with the same probability
+            sampler = WindowSampler(ds)
+            self.assertEqual(len(sampler), 62)
+            self.assertTrue(set(sampler) <= set(windows))
+            sampler = WindowSampler(ds, num_samples=62, replacement=False)
+            self.assertEqual(sorted(sampler), sorted(windows))
+
+            torch.manual_seed(0)
+            indices = np.array(
+                list(
+                    WindowSampler(ds, series_weights=[0.0, 1.0, 3.0], num_samples=10000)
+                )
+            )
+            np.testing.assert_allclose(
+                np.bincount(indices // 43, minlength=3) / 10000,
+                [0.0, 0.25, 0.75],
+                atol=0.02,
+            )
+
+            # the probability of the windows of each series halves every `half_life` time steps
+            indices = np.array(
+                list(
+                    WindowSampler(
+                        ds, series_weights="uniform", half_life=2, num_samples=30000
+                    )
+                )
+            )
+            np.testing.assert_allclose(
+                np.bincount(indices // 43) / 30000, [1 / 3] * 3, atol=0.02
+            )
+            counts = np.bincount(indices[indices // 43 == 1] % 43)
+            self.assertAlmostEqual(counts[2] / counts[0], 0.5, delta=0.1)
+
+            with self.assertRaises(ValueError):
+                WindowSampler(ds, num_samples=63, replacement=False)
+            with self.assertRaises(ValueError):
+                WindowSampler(ds, series_weights=[1.0, 2.0])
+            with self.assertRaises(ValueError):
+                WindowSampler(ds, series_weights="recency")
@@ -1074,6 +1074,61 @@ class TimeSeriesTestCase(DartsBaseTestClass):
         with self.assertRaises(AssertionError):
             ts.to_csv("test.csv")
 
+    def test_trusted_values(self):
+        values = np.random.rand(10, 2, 1)
+        components = pd.Index(["a", "b"])
+
+        # regular index given by its start and frequency
+        ts = TimeSeries._from_trusted_values(
+            values, components=components, start=pd.Timestamp("20130101"), freq="D"
+        )
+        self.assertIsNone(ts._xa_cache)
+        self.assertIsNone(ts._time_index_cache)
+        self.assertEqual(ts.start_time(), pd.Timestamp("20130101"))
+        self.assertEqual(ts.end_time(), pd.Timestamp("20130110"))
+        self.assertTrue(np.shares_memory(ts.all_values(copy=False), values))
+
+        expected = TimeSeries.from_times_and_values(
+            self.times, values, columns=components
+        )
+        self.assertEqual(ts, expected)
+        self.assertEqual(ts.freq, expected.freq)
+        self.assertTrue(ts.time_index.equals(expected.time_index))
+
+        # the DataArray is built lazily and shares memory with the values
+        self.assertTrue(np.shares_memory(ts.data_array(copy=False).values, values))
+
+        # integer index
+        ts = TimeSeries._from_trusted_values(values, components=components, start=5)
+        self.assertTrue(ts.has_range_index)
+        self.assertEqual(ts.end_time(), 14)
+        self.assertTrue(ts.time_index.equals(pd.RangeIndex(5, 15)))
+
+    def test_derived_series_skip_copy(self):
+        ts = TimeSeries.from_times_and_values(self.times, np.random.rand(10, 2))
+        for derived in [ts[2:5], ts[self.times[2:5]], ts.drop_after(self.times[5])]:
+            self.assertTrue(
+                np.shares_memory(derived.all_values(copy=False), ts.all_values(False))
+            )
+            self.assertEqual(derived.freq, ts.freq)
+            self.assertEqual(derived, TimeSeries(derived.data_array()))
+
+        sliced = ts.slice(self.times[3], pd.Timestamp("20130220"))
+        self.assertEqual(sliced.start_time(), self.times[3])
+        self.assertEqual(sliced.end_time(), self.times[-1])
+
+        # non-contiguous selections still go through the DataArray
+        self.assertEqual(len(ts[[0, 2, 4]]), 3)
+
+    def test_pickle(self):
+        ts = TimeSeries.from_times_and_values(self.times, np.random.rand(10, 2))
+        _ = ts.data_array(copy=False)
+        with NamedTemporaryFile() as f:
+            ts.to_pickle(f.name)
+            ts_loaded = TimeSeries.from_pickle(f.name)
+        self.assertIsNone(ts_loaded._xa_cache)
+        self.assertEqual(ts, ts_loaded)
+
 
 class TimeSeriesConcatenateTestCase(DartsBaseTestClass):
 
@@ -0,0 +1,228 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from darts import TimeSeries
+from darts.tests.base_test_class import DartsBaseTestClass
+from darts.utils.bulk_io import (
+    ForecastArray,
+    iter_series_from_csv,
+    iter_series_from_parquet,
+    load_series_binary,
+    save_series_binary,
+)
+
+try:
+    import pyarrow  # noqa: F401
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+class BulkIOTestCase(DartsBaseTestClass):
+    np.random.seed(0)
+    lengths = {"a": 7, "b": 3, "c": 12, "d": 5}
+    df = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "id": series_id,
+                    "time": pd.date_range(
+                        "2021-01-31", periods=length, freq="M" if i % 2 else "D"
+                    ),
+                    "value": np.random.randn(length).round(4),
+                    "other": np.random.randn(length).round(4),
+                    "ignored": "x",
+                }
+            )
+            for i, (series_id, length) in enumerate(lengths.items())
+        ],
+        ignore_index=True,
+    )
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        self.temp_dir.cleanup()
+
+    def expected_series(self, df=None):
+        df = self.df if df is None else df
+        return {
+            series_id: TimeSeries.from_dataframe(group, "time", ["value", "other"])
+            for series_id, group in df.groupby("id", sort=False)
+        }
+
+    def assert_series_equal(self, series, expected):
+        self.assertEqual(list(series), list(expected))
+        for series_id, ts in series.items():
+            self.assertEqual(ts.freq, expected[series_id].freq)
+            self.assertEqual(ts, expected[series_id])
+
+    def test_csv_contiguous(self):
+        path = os.path.join(self.temp_dir.name, "long.csv")
+        self.df.to_csv(path, index=False)
+
+        # the series span several chunks, and chunks hold several series
+        for chunksize in [1, 3, 100]:
+            series = dict(
+                iter_series_from_csv(
+                    path,
+                    "id",
+                    "time",
+                    ["value", "other"],
+                    chunksize=chunksize,
+                )
+            )
+            self.assert_series_equal(series, self.expected_series())
+
+        # rows of a series in several places of the file
+        pd.concat([self.df.iloc[3:], self.df.iloc[:3]]).to_csv(path, index=False)
+        with self.assertRaises(ValueError):
+            list(iter_series_from_csv(path, "id", "time", ["value", "other"]))
+
+    def test_csv_not_contiguous(self):
+        path = os.path.join(self.temp_dir.name, "long.csv")
+        shuffled = self.df.sample(frac=1, random_state=0)
+        shuffled.drop(columns="ignored").to_csv(path, index=False)
+
+        series = dict(
+            iter_series_from_csv(path, "id", "time", chunksize=4, contiguous=False)
+        )
+        self.assert_series_equal(series, self.expected_series(shuffled))
+
+    def test_csv_int_index(self):
+        path = os.path.join(self.temp_dir.name, "long.csv")
+        df = pd.DataFrame(
+            {
+                "id": [1, 1, 1, 2, 2],
+                "time": [5, 6, 7, 0, 2],
+                "value": np.arange(5.0),
+            }
+        )
+        df.to_csv(path, index=False)
+
+        series = dict(iter_series_from_csv(path, "id", "time", "value", chunksize=2))
+        self.assertEqual(
+            series[1], TimeSeries.from_dataframe(df[df.id == 1], "time", "value")
+        )
+        self.assertEqual(list(series[2].time_index), [0, 2])
+
+    @unittest.skipUnless(PYARROW_AVAILABLE, "requires pyarrow")
+    def test_parquet(self):
+        path = os.path.join(self.temp_dir.name, "long.parquet")
+        self.df.to_parquet(path, index=False)
+
+        series = dict(
+            iter_series_from_parquet(
+                path, "id", "time", ["value", "other"], chunksize=3
+            )
+        )
+        self.assert_series_equal(series, self.expected_series())
+
+    def test_binary_round_trip(self):
+        path = os.path.join(self.temp_dir.name, "series.bin")
+        series = list(self.expected_series().values()) + [
+            TimeSeries.from_values(np.random.randn(6, 2, 3)),
+            TimeSeries.from_times_and_values(
+                pd.date_range("2021-03-28", periods=4, freq="H", tz="Europe/Paris"),
+                np.random.randn(4, 1),
+            ),
+        ]
+        save_series_binary(path, series)
+
+        for mmap in [True, False]:
+            loaded = load_series_binary(path, mmap=mmap)
+            self.assertEqual(len(loaded), len(series))
+            for ts, expected in zip(loaded, series):
+                self.assertEqual(ts.freq, expected.freq)
+                self.assertEqual(ts, expected)
+
+            # slices are loaded lazily, and share the values buffer
+            sliced = loaded[-2:]
+            self.assertEqual(len(sliced), 2)
+            self.assertEqual(sliced[0], series[-2])
+            self.assertEqual(sliced[-1], series[-1])
+            self.assertFalse(sliced[0].values(copy=False).flags.owndata)
+
+            # the lengths and values are read without building the series
+            np.testing.assert_array_equal(
+                sliced.lengths(), [len(ts) for ts in series[-2:]]
+            )
+            np.testing.assert_array_equal(sliced.values_at(1), series[-1].values())
+
+            # the sequences are pickled as their file path
+            unpickled = pickle.loads(pickle.dumps(sliced))
+            self.assertLess(len(pickle.dumps(sliced)), 500)
+            self.assertEqual(list(unpickled), series[-2:])
+
+        # the memory-mapped values are read-only
+        with self.assertRaises(ValueError):
+            load_series_binary(path)[0].values(copy=False)[0, 0] = 0.0
+
+        # the values of series of different dtypes are stored with their common dtype
+        save_series_binary(path, [series[0].astype(np.float32), series[1]])
+        self.assertEqual(load_series_binary(path)[0].dtype, np.float64)
+
+        with open(path, "wb") as f:
+            f.write(b"not a series file")
+        with self.assertRaises(ValueError):
+            load_series_binary(path)
+
+    def test_forecast_array(self):
+        series = [
+            TimeSeries.from_values(np.random.randn(5, 2)),
+            TimeSeries.from_times_and_values(
+                pd.Int64Index([3, 5, 7]), np.random.randn(3, 2)
+            ),
+            TimeSeries.from_times_and_values(
+                pd.date_range("2021-01-31", periods=4, freq="M"),
+                np.random.randn(4, 2),
+                columns=["a", "b"],
+            ),
+            TimeSeries.from_times_and_values(
+                pd.date_range(
+                    "2021-03-27 23:00", periods=5, freq="H", tz="Europe/Paris"
+                ),
+                np.random.randn(5, 2),
+            ),
+            TimeSeries.from_times_and_values(
+                pd.date_range(
+                    "2021-03-27 23:00", periods=5, freq="H", tz="Europe/Paris"
+                ),
+                np.random.randn(5, 2),
+            )[1:],
+            TimeSeries.from_times_and_values(
+                pd.date_range("2021-01-01", periods=6, freq="2D"),
+                np.random.randn(6, 2),
+            )[:4],
+        ]
+        values = np.random.randn(len(series), 3, 2, 4).astype(np.float32)
+        forecasts = ForecastArray.from_input_series(values, series)
+        self.assertEqual(len(forecasts), len(series))
+
+        # the forecasts follow their input series, as built by the forecasting models
+        for ts, forecast, forecast_values in zip(series, forecasts, values):
+            expected_index = pd.Index(
+                [
+                    ts.end_time() + (step + 1) * ts.freq
+                    for step in range(len(forecast_values))
+                ]
+            )
+            self.assertTrue(forecast.time_index.equals(expected_index))
+            self.assertEqual(forecast.freq, ts.freq)
+            self.assertEqual(list(forecast.components), list(ts.components))
+            np.testing.assert_array_equal(forecast.all_values(), forecast_values)
+        self.assertTrue(
+            forecasts.time_index(3).equals(forecasts.to_series()[3].time_index)
+        )
+        self.assertEqual(forecasts[2:4].to_series(), forecasts.to_series()[2:4])
+
+        with self.assertRaises(ValueError):
+            ForecastArray.from_input_series(values, series[:-1])
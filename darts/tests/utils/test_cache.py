@@ -0,0 +1,150 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from darts.tests.base_test_class import DartsBaseTestClass
+from darts.utils import timeseries_generation as tg
+from darts.utils.cache import (
+    ForecastingCache,
+    get_forecasting_cache,
+    set_forecasting_cache,
+)
+from darts.models import NaiveSeasonal, NaiveMean, ExponentialSmoothing
+from darts.logging import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from darts.models import TCNModel
+
+    TORCH_AVAILABLE = True
+except ImportError:
+    logger.warning("Torch not available. Cache tests of torch models will be skipped.")
+    TORCH_AVAILABLE = False
+
+
+class CountingNaiveSeasonal(NaiveSeasonal):
+    fit_calls = 0
+
+    def fit(self, series):
+        CountingNaiveSeasonal.fit_calls += 1
+        return super().fit(series)
+
+
+class ForecastingCacheTestCase(DartsBaseTestClass):
+    series = tg.sine_timeseries(length=100) + tg.linear_timeseries(length=100)
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        CountingNaiveSeasonal.fit_calls = 0
+
+    def tearDown(self):
+        super().tearDown()
+        set_forecasting_cache(None)
+        self.temp_dir.cleanup()
+
+    def test_fit_predict_memoization(self):
+        with ForecastingCache(self.temp_dir.name) as cache:
+            self.assertIs(get_forecasting_cache(), cache)
+            model = CountingNaiveSeasonal(K=4).fit(self.series)
+            forecast = model.predict(6)
+
+            # the same fit, with the same model parameters, is served from the cache
+            cached_model = CountingNaiveSeasonal(K=4).fit(series=self.series)
+            self.assertEqual(CountingNaiveSeasonal.fit_calls, 1)
+            self.assertTrue(cached_model._fit_called)
+            self.assertEqual(cached_model.training_series, self.series)
+            self.assertEqual(cached_model.predict(6), forecast)
+
+            # other parameters, values or time index miss the cache
+            CountingNaiveSeasonal(K=3).fit(self.series)
+            CountingNaiveSeasonal(K=4).fit(self.series + 1)
+            CountingNaiveSeasonal(K=4).fit(self.series.shift(1))
+            self.assertEqual(CountingNaiveSeasonal.fit_calls, 4)
+
+        self.assertIsNone(get_forecasting_cache())
+
+        # models fitted outside of the cache are not memoized
+        model = CountingNaiveSeasonal(K=4).fit(self.series)
+        with ForecastingCache(self.temp_dir.name):
+            model.fit(self.series)
+        self.assertEqual(CountingNaiveSeasonal.fit_calls, 6)
+
+    def test_refit_outside_of_cache(self):
+        series_a = tg.constant_timeseries(value=1.0, length=10)
+        series_b = tg.constant_timeseries(value=5.0, length=10)
+        with ForecastingCache(self.temp_dir.name):
+            model = NaiveMean().fit(series_a)
+            model.predict(2)
+
+        # the model refitted outside of the cache no longer identifies its former state
+        model.fit(series_b)
+        forecast = model.predict(2)
+        with ForecastingCache(self.temp_dir.name):
+            self.assertEqual(model.predict(2), forecast)
+        np.testing.assert_array_equal(forecast.values(), [[5.0], [5.0]])
+
+    @unittest.skipUnless(TORCH_AVAILABLE, "requires torch")
+    def test_fit_from_dataset_outside_of_cache(self):
+        series_a = tg.sine_timeseries(length=40)
+        series_b = tg.linear_timeseries(length=40)
+        with ForecastingCache(self.temp_dir.name):
+            model = TCNModel(
+                8,
+                2,
+                n_epochs=1,
+                random_state=42,
+                work_dir=self.temp_dir.name,
+            )
+            model.fit(series_a)
+            model.predict(2, series=series_b)
+
+            # the weights trained by fit_from_dataset() are unknown to the cache
+            model.fit_from_dataset(
+                model._build_train_dataset(series_b, None, None, None)
+            )
+            self.assertNotIn("_cache_state_key", model.__dict__)
+            forecast = model.predict(2, series=series_b)
+
+        self.assertEqual(model.predict(2, series=series_b), forecast)
+
+    def test_historical_forecasts_memoization(self):
+        set_forecasting_cache(ForecastingCache(self.temp_dir.name))
+        model = ExponentialSmoothing(seasonal=None)
+        forecasts = model.historical_forecasts(self.series, start=0.9)
+        cached_model = ExponentialSmoothing(seasonal=None)
+        self.assertEqual(
+            cached_model.historical_forecasts(self.series, start=0.9), forecasts
+        )
+
+        # the state of the model after retraining is restored
+        np.testing.assert_allclose(
+            cached_model.predict(3).values(), model.predict(3).values()
+        )
+        self.assertEqual(cached_model.training_series, model.training_series)
+
+    def test_lru_eviction(self):
+        cache = ForecastingCache(self.temp_dir.name)
+        cache.set("a", np.zeros(1000))
+        entry_size = cache.size
+        self.assertGreater(entry_size, 8000)
+
+        cache = ForecastingCache(self.temp_dir.name, max_size=int(2.5 * entry_size))
+        cache.set("b", np.ones(1000))
+        os.utime(os.path.join(self.temp_dir.name, "a.pkl"), ns=(0, 0))
+        os.utime(os.path.join(self.temp_dir.name, "b.pkl"), ns=(1, 1))
+
+        # reading "a" makes it the most recently used entry, so "b" is evicted when adding "c"
+        found, value = cache.get("a")
+        self.assertTrue(found)
+        np.testing.assert_array_equal(value, np.zeros(1000))
+        cache.set("c", np.ones(1000))
+        self.assertTrue(cache.get("a")[0])
+        self.assertFalse(cache.get("b")[0])
+        self.assertTrue(cache.get("c")[0])
+        self.assertLessEqual(cache.size, cache.max_size)
+
+        cache.clear()
+        self.assertEqual(cache.size, 0)
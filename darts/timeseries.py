@@ -119,15 +119,15 @@ class TimeSeries:
         # As of xarray 0.18.2, this sorting discards the freq of the index for some reason
         # https://github.com/pydata/xarray/issues/5466
         # We sort only if the time axis is not already sorted (monotically increasing).
-        self._xa = (
+        xa_ = (
             xa.copy()
             if xa.get_index(self._time_dim).is_monotonic_increasing
             else xa.sortby(self._time_dim)
         )
 
-        self._time_index = self._xa.get_index(self._time_dim)
+        time_index = xa_.get_index(self._time_dim)
 
-        if not isinstance(self._time_index, VALID_INDEX_TYPES):
+        if not isinstance(time_index, VALID_INDEX_TYPES):
             raise_log(
                 ValueError(
                     "The time dimension of the DataArray must be indexed either with a DatetimeIndex,"
@@ -136,7 +136,7 @@ class TimeSeries:
                 logger,
             )
 
-        self._has_datetime_index = isinstance(self._time_index, pd.DatetimeIndex)
+        self._has_datetime_index = isinstance(time_index, pd.DatetimeIndex)
 
         if self._has_datetime_index:
             freq_tmp = xa.get_index(
@@ -145,7 +145,7 @@ class TimeSeries:
             self._freq: pd.DateOffset = (
                 freq_tmp
                 if freq_tmp is not None
-                else to_offset(self._xa.get_index(self._time_dim).inferred_freq)
+                else to_offset(time_index.inferred_freq)
             )
             raise_if(
                 self._freq is None,
@@ -160,7 +160,7 @@ class TimeSeries:
             self._freq_str: str = self._freq.freqstr
 
             # reset freq inside the xarray index (see bug of sortby() above).
-            self._xa.get_index(self._time_dim).freq = self._freq
+            time_index.freq = self._freq
 
             # We have to check manually if the index is complete. Another way could be to rely
             # on `inferred_freq` being present, but this fails for series of length < 3.
@@ -168,8 +168,8 @@ class TimeSeries:
             is_index_complete = (
                 len(
                     pd.date_range(
-                        self._time_index.min(), self._time_index.max(), freq=self._freq
-                    ).difference(self._time_index)
+                        time_index.min(), time_index.max(), freq=self._freq
+                    ).difference(time_index)
                 )
                 == 0
             )
@@ -186,6 +186,167 @@ class TimeSeries:
             self._freq = 1
             self._freq_str = None
 
+        # The values array is the actual storage of the series. The DataArray shares its memory,
+        # and is only kept here because we already built it.
+        self._values = xa_.values
+        self._components = xa_.get_index(DIMS[1])
+        self._time_index_cache = time_index
+        self._index_start = None
+        self._xa_cache = xa_
+
+    @classmethod
+    def _from_trusted_values(
+        cls,
+        values: np.ndarray,
+        components: pd.Index,
+        time_index: Optional[Union[pd.DatetimeIndex, pd.Int64Index]] = None,
+        start: Optional[Union[pd.Timestamp, int]] = None,
+        freq: Optional[Union[pd.DateOffset, str]] = None,
+        time_dim: str = DIMS[0],
+    ) -> "TimeSeries":
+        """
+        Fast path building a TimeSeries from trusted inputs, for internal use only.
+
+        None of the checks done in the constructor are performed, and `values` is neither copied
+        nor cast. It is the responsibility of the caller to provide a 3-D float array of shape
+        (time, component, sample), unique component names and either a sorted and complete `time_index`,
+        or a `start` and `freq` describing a regular time index (which is then only built when needed).
+
+        Parameters
+        ----------
+        values
+            The 3-D array of values, of shape (time, component, sample).
+        components
+            The names of the components.
+        time_index
+            Optionally, the time index of the series. Exactly one of `time_index` and `start` must be provided.
+        start
+            Optionally, the first time of a regular time index of length ``len(values)``.
+        freq
+            The frequency of the series. Only required for DatetimeIndex series built from `start`, or when
+            `time_index` does not carry its freq.
+        time_dim
+            The name of the time dimension.
+
+        Returns
+        -------
+        TimeSeries
+            A new TimeSeries sharing memory with `values`.
+        """
+        series = cls.__new__(cls)
+        series._time_dim = time_dim
+
+        if time_index is not None:
+            series._has_datetime_index = isinstance(time_index, pd.DatetimeIndex)
+            if time_index.name != time_dim:
+                time_index = time_index.rename(time_dim)
+            if series._has_datetime_index:
+                freq = time_index.freq if freq is None else freq
+                if freq is None:
+                    freq = time_index.inferred_freq
+        else:
+            series._has_datetime_index = isinstance(start, pd.Timestamp)
+
+        if series._has_datetime_index:
+            series._freq = to_offset(freq)
+            series._freq_str = series._freq.freqstr
+        else:
+            series._freq = 1
+            series._freq_str = None
+
+        if components.name != DIMS[1]:
+            components = components.rename(DIMS[1])
+
+        series._values = values
+        series._components = components
+        series._time_index_cache = time_index
+        series._index_start = start
+        series._xa_cache = None
+        return series
+
+    @property
+    def _time_index(self) -> Union[pd.DatetimeIndex, pd.Int64Index]:
+        # series built from a regular index descriptor only materialize their time index on demand
+        if self._time_index_cache is None:
+            if self._has_datetime_index:
+                self._time_index_cache = pd.date_range(
+                    start=self._index_start,
+                    periods=len(self._values),
+                    freq=self._freq,
+                    name=self._time_dim,
+                )
+            else:
+                self._time_index_cache = pd.RangeIndex(
+                    start=self._index_start,
+                    stop=self._index_start + len(self._values),
+                    step=1,
+                    name=self._time_dim,
+                )
+        return self._time_index_cache
+
+    @property
+    def _xa(self) -> xr.DataArray:
+        # the DataArray is built lazily, and shares memory with the values array
+        if self._xa_cache is None:
+            xa = xr.DataArray(
+                self._values,
+                dims=(self._time_dim,) + DIMS[-2:],
+                coords={
+                    self._time_dim: self._time_index,
+                    DIMS[1]: self._components,
+                },
+            )
+            if self._has_datetime_index:
+                xa.get_index(self._time_dim).freq = self._freq
+            self._xa_cache = xa
+        return self._xa_cache
+
+    def _time_slice(self, start: int, stop: int) -> "TimeSeries":
+        """
+        Return the (non-empty) positional slice [start:stop] of this series along the time axis, without copy.
+        """
+        values = self._values[start:stop]
+        raise_if_not(
+            len(values) > 0, "The time series array must not be empty.", logger
+        )
+        return self._from_trusted_values(
+            values,
+            components=self._components,
+            time_index=self._time_index[start:stop],
+            freq=self._freq if self._has_datetime_index else None,
+            time_dim=self._time_dim,
+        )
+
+    def _contiguous_positions(self, times: pd.Index) -> Optional[Tuple[int, int]]:
+        """
+        Return the positional (start, stop) bounds of `times` in this series' time index,
+        or None if `times` does not denote a non-empty and contiguous chunk of it.
+        """
+        if len(times) == 0:
+            return None
+        locs = self._time_index.get_indexer(times)
+        if (locs < 0).any() or (len(locs) > 1 and not (np.diff(locs) == 1).all()):
+            return None
+        return int(locs[0]), int(locs[-1]) + 1
+
+    def __getstate__(self):
+        # the DataArray view can always be rebuilt, there is no need to pickle it
+        state = self.__dict__.copy()
+        state["_xa_cache"] = None
+        return state
+
+    def __setstate__(self, state):
+        if "_values" not in state:
+            # series pickled with previous versions of darts only hold the DataArray
+            xa = state.pop("_xa")
+            state.pop("_time_index", None)
+            state["_values"] = xa.values
+            state["_components"] = xa.get_index(DIMS[1])
+            state["_time_index_cache"] = xa.get_index(state["_time_dim"])
+            state["_index_start"] = None
+            state["_xa_cache"] = xa
+        self.__dict__.update(state)
+
     """
     Factory Methods
     ===============
@@ -672,12 +833,12 @@ class TimeSeries:
     @property
     def n_samples(self):
         """Number of samples contained in the series."""
-        return len(self._xa.sample)
+        return self._values.shape[2]
 
     @property
     def n_components(self):
         """Number of components (dimensions) contained in the series."""
-        return len(self._xa.component)
+        return self._values.shape[1]
 
     @property
     def width(self):
@@ -722,12 +883,12 @@ class TimeSeries:
     @property
     def dtype(self):
         """The dtype of the series' values."""
-        return self._xa.values.dtype
+        return self._values.dtype
 
     @property
     def components(self):
         """The names of the components, as a Pandas Index."""
-        return self._xa.get_index(DIMS[1]).copy()
+        return self._components.copy()
 
     @property
     def columns(self):
@@ -817,10 +978,10 @@ class TimeSeries:
         )
 
     def _get_first_timestamp_after(self, ts: pd.Timestamp) -> pd.Timestamp:
-        return next(filter(lambda t: t >= ts, self._time_index))
+        return self._time_index[self._time_index.searchsorted(ts, side="left")]
 
     def _get_last_timestamp_before(self, ts: pd.Timestamp) -> pd.Timestamp:
-        return next(filter(lambda t: t <= ts, self._time_index[::-1]))
+        return self._time_index[self._time_index.searchsorted(ts, side="right") - 1]
 
     """
     Export functions
@@ -863,10 +1024,10 @@ class TimeSeries:
         self._assert_deterministic()
         if copy:
             return pd.Series(
-                self._xa[:, 0, 0].values.copy(), index=self._time_index.copy()
+                self._values[:, 0, 0].copy(), index=self._time_index.copy()
             )
         else:
-            return pd.Series(self._xa[:, 0, 0].values, index=self._time_index)
+            return pd.Series(self._values[:, 0, 0], index=self._time_index)
 
     def pd_dataframe(self, copy=True) -> pd.DataFrame:
         """
@@ -895,15 +1056,15 @@ class TimeSeries:
             )
         if copy:
             return pd.DataFrame(
-                self._xa[:, :, 0].values.copy(),
+                self._values[:, :, 0].copy(),
                 index=self._time_index.copy(),
-                columns=self._xa.get_index(DIMS[1]).copy(),
+                columns=self._components.copy(),
             )
         else:
             return pd.DataFrame(
-                self._xa[:, :, 0].values,
+                self._values[:, :, 0],
                 index=self._time_index,
-                columns=self._xa.get_index(DIMS[1]),
+                columns=self._components,
             )
 
     def quantile_df(self, quantile=0.5) -> pd.DataFrame:
@@ -1010,7 +1171,7 @@ class TimeSeries:
         TimeSeries
             A TimeSeries having the desired dtype.
         """
-        return self.__class__(self._xa.astype(dtype))
+        return self.with_values(self._values.astype(dtype))
 
     def start_time(self) -> Union[pd.Timestamp, int]:
         """
@@ -1022,6 +1183,8 @@ class TimeSeries:
             A timestamp containing the first time of the TimeSeries (if indexed by DatetimeIndex),
             or an integer (if indexed by Int64Index/RangeIndex)
         """
+        if self._time_index_cache is None:
+            return self._index_start
         return self._time_index[0]
 
     def end_time(self) -> Union[pd.Timestamp, int]:
@@ -1034,6 +1197,8 @@ class TimeSeries:
             A timestamp containing the last time of the TimeSeries (if indexed by DatetimeIndex),
             or an integer (if indexed by Int64Index/RangeIndex)
         """
+        if self._time_index_cache is None:
+            return self._index_start + (len(self._values) - 1) * self._freq
         return self._time_index[-1]
 
     def first_value(self) -> float:
@@ -1047,7 +1212,7 @@ class TimeSeries:
         """
         self._assert_univariate()
         self._assert_deterministic()
-        return float(self._xa[0, 0, 0])
+        return float(self._values[0, 0, 0])
 
     def last_value(self) -> float:
         """
@@ -1060,7 +1225,7 @@ class TimeSeries:
         """
         self._assert_univariate()
         self._assert_deterministic()
-        return float(self._xa[-1, 0, 0])
+        return float(self._values[-1, 0, 0])
 
     def first_values(self) -> np.ndarray:
         """
@@ -1072,7 +1237,7 @@ class TimeSeries:
             The first values of every component of this deterministic time series
         """
         self._assert_deterministic()
-        return self._xa.values[0, :, 0].copy()
+        return self._values[0, :, 0].copy()
 
     def last_values(self) -> np.ndarray:
         """
@@ -1084,7 +1249,7 @@ class TimeSeries:
             The last values of every component of this deterministic time series
         """
         self._assert_deterministic()
-        return self._xa.values[-1, :, 0].copy()
+        return self._values[-1, :, 0].copy()
 
     def values(self, copy=True, sample=0) -> np.ndarray:
         """
@@ -1110,9 +1275,9 @@ class TimeSeries:
             logger,
         )
         if copy:
-            return np.copy(self._xa.values[:, :, sample])
+            return np.copy(self._values[:, :, sample])
         else:
-            return self._xa.values[:, :, sample]
+            return self._values[:, :, sample]
 
     def all_values(self, copy=True) -> np.ndarray:
         """
@@ -1131,9 +1296,9 @@ class TimeSeries:
             The values composing the time series.
         """
         if copy:
-            return np.copy(self._xa.values)
+            return np.copy(self._values)
         else:
-            return self._xa.values
+            return self._values
 
     def univariate_values(self, copy=True, sample=0) -> np.ndarray:
         """
@@ -1153,9 +1318,9 @@ class TimeSeries:
 
         self._assert_univariate()
         if copy:
-            return np.copy(self._xa[:, 0, sample].values)
+            return np.copy(self._values[:, 0, sample])
         else:
-            return self._xa[:, 0, sample].values
+            return self._values[:, 0, sample]
 
     def head(
         self, size: Optional[int] = 5, axis: Optional[Union[int, str]] = 0
@@ -1177,6 +1342,8 @@ class TimeSeries:
         """
 
         axis_str = self._get_dim_name(axis)
+        if axis_str == self._time_dim:
+            return self._time_slice(0, min(size, len(self)))
         display_n = range(min(size, self._xa.sizes[axis_str]))
         return self.__class__(self._xa[{axis_str: display_n}])
 
@@ -1200,6 +1367,8 @@ class TimeSeries:
         """
 
         axis_str = self._get_dim_name(axis)
+        if axis_str == self._time_dim:
+            return self._time_slice(len(self) - min(size, len(self)), len(self))
         display_n = range(-min(size, self._xa.sizes[axis_str]), 0)
         return self.__class__(self._xa[{axis_str: display_n}])
 
@@ -1296,8 +1465,7 @@ class TimeSeries:
             A copy of this time series.
         """
 
-        # the xarray will be copied in the TimeSeries constructor.
-        return self.__class__(self._xa)
+        return self.with_values(self._values.copy())
 
     def get_index_at_point(
         self, point: Union[pd.Timestamp, float, int], after=True
@@ -1506,8 +1674,9 @@ class TimeSeries:
                 "indexed using an integer-based Int64Index.",
                 logger,
             )
-            idx = pd.DatetimeIndex(
-                filter(lambda t: start_ts <= t <= end_ts, self._time_index)
+            return self._time_slice(
+                self._time_index.searchsorted(start_ts, side="left"),
+                self._time_index.searchsorted(end_ts, side="right"),
             )
         else:
             raise_if(
@@ -1913,17 +2082,22 @@ class TimeSeries:
         Return
         ------
         TimeSeries
-            A new TimeSeries with the new values and same index
+            A new TimeSeries with the new values and same index. The `values` array is not copied.
         """
         raise_if_not(
-            values.shape == self._xa.values.shape,
+            values.shape == self._values.shape,
             "The new values must have the same shape (time, components, samples) as the present series. "
-            "Received: {}, expected: {}".format(values.shape, self._xa.values.shape),
+            "Received: {}, expected: {}".format(values.shape, self._values.shape),
         )
 
-        new_xa = xr.DataArray(values, dims=self._xa.dims, coords=self._xa.coords)
-
-        return self.__class__(new_xa)
+        return self._from_trusted_values(
+            values,
+            components=self._components,
+            time_index=self._time_index_cache,
+            start=self._index_start,
+            freq=self._freq if self._has_datetime_index else None,
+            time_dim=self._time_dim,
+        )
 
     def stack(self, other: "TimeSeries") -> "TimeSeries":
         """
@@ -1988,11 +2162,16 @@ class TimeSeries:
         TimeSeries
             A new univariate TimeSeries instance.
         """
-        if isinstance(index, int):
-            new_xa = self._xa.isel(component=index).expand_dims(DIMS[1], axis=1)
-        else:
-            new_xa = self._xa.sel(component=index).expand_dims(DIMS[1], axis=1)
-        return self.__class__(new_xa)
+        if not isinstance(index, int):
+            index = self._components.get_loc(index)
+        return self._from_trusted_values(
+            self._values[:, [index], :],
+            components=self._components[[index]],
+            time_index=self._time_index_cache,
+            start=self._index_start,
+            freq=self._freq if self._has_datetime_index else None,
+            time_dim=self._time_dim,
+        )
 
     def add_datetime_attribute(
         self, attribute, one_hot: bool = False, cyclic: bool = False
@@ -2542,20 +2721,18 @@ class TimeSeries:
         """
 
         if isinstance(other, TimeSeries):
-            other_vals = other.data_array(copy=False).values
+            other_vals = other.all_values(copy=False)
         elif isinstance(other, xr.DataArray):
             other_vals = other.values
         else:
             other_vals = other
 
         raise_if_not(
-            self._xa.values.shape == other_vals.shape,
+            self._values.shape == other_vals.shape,
             "Attempted to perform operation on two TimeSeries of unequal shapes.",
             logger,
         )
-        new_xa = self._xa.copy()
-        new_xa.values = combine_fn(new_xa.values, other_vals)
-        return self.__class__(new_xa)
+        return self.with_values(combine_fn(self._values, other_vals))
 
     @classmethod
     def _fill_missing_dates(
@@ -2747,11 +2924,11 @@ class TimeSeries:
         return not self.__eq__(other)
 
     def __len__(self):
-        return len(self._xa)
+        return len(self._values)
 
     def __add__(self, other):
         if isinstance(other, (int, float, np.integer)):
-            return self.__class__(self._xa + other)
+            return self.with_values(self._values + other)
         elif isinstance(other, (TimeSeries, xr.DataArray, np.ndarray)):
             return self._combine_arrays(other, lambda s1, s2: s1 + s2)
         else:
@@ -2769,7 +2946,7 @@ class TimeSeries:
 
     def __sub__(self, other):
         if isinstance(other, (int, float, np.integer)):
-            return self.__class__(self._xa - other)
+            return self.with_values(self._values - other)
         elif isinstance(other, (TimeSeries, xr.DataArray, np.ndarray)):
             return self._combine_arrays(other, lambda s1, s2: s1 - s2)
         else:
@@ -2787,7 +2964,7 @@ class TimeSeries:
 
     def __mul__(self, other):
         if isinstance(other, (int, float, np.integer)):
-            return self.__class__(self._xa * other)
+            return self.with_values(self._values * other)
         elif isinstance(other, (TimeSeries, xr.DataArray, np.ndarray)):
             return self._combine_arrays(other, lambda s1, s2: s1 * s2)
         else:
@@ -2806,7 +2983,7 @@ class TimeSeries:
     def __pow__(self, n):
         if isinstance(n, (int, float, np.integer)):
             raise_if(n < 0, "Attempted to raise a series to a negative power.", logger)
-            return self.__class__(self._xa ** float(n))
+            return self.with_values(self._values ** float(n))
         if isinstance(n, (TimeSeries, xr.DataArray, np.ndarray)):
             return self._combine_arrays(n, lambda s1, s2: s1 ** s2)  # elementwise power
         else:
@@ -2823,7 +3000,7 @@ class TimeSeries:
         if isinstance(other, (int, float, np.integer)):
             if other == 0:
                 raise_log(ZeroDivisionError("Cannot divide by 0."), logger)
-            return self.__class__(self._xa / other)
+            return self.with_values(self._values / other)
         elif isinstance(other, (TimeSeries, xr.DataArray, np.ndarray)):
             if not (other.all_values(copy=False) != 0).all():
                 raise_log(
@@ -2845,16 +3022,16 @@ class TimeSeries:
         return n * (self ** (-1))
 
     def __abs__(self):
-        return self.__class__(abs(self._xa))
+        return self.with_values(np.abs(self._values))
 
     def __neg__(self):
-        return self.__class__(-self._xa)
+        return self.with_values(-self._values)
 
     def __contains__(self, ts: Union[int, pd.Timestamp]) -> bool:
-        return ts in self.time_index
+        return ts in self._time_index
 
     def __round__(self, n=None):
-        return self.__class__(self._xa.round(n))
+        return self.with_values(np.round(self._values, n or 0))
 
     def __lt__(self, other) -> xr.DataArray:
         if isinstance(other, (int, float, np.integer, np.ndarray, xr.DataArray)):
@@ -2996,6 +3173,12 @@ class TimeSeries:
         # handle DatetimeIndex and Int64Index:
         if isinstance(key, pd.DatetimeIndex):
             _check_dt()
+
+            # contiguous chunks of the time index are sliced directly, without copy
+            bounds = self._contiguous_positions(key)
+            if bounds is not None:
+                return self._time_slice(*bounds)
+
             xa_ = self._xa.sel({self._time_dim: key})
 
             # indexing may discard the freq so we restore it...
@@ -3006,6 +3189,10 @@ class TimeSeries:
         elif isinstance(key, (pd.Int64Index, pd.RangeIndex)):
             _check_range()
 
+            bounds = self._contiguous_positions(key)
+            if bounds is not None:
+                return self._time_slice(*bounds)
+
             return self.__class__(self._xa.sel({self._time_dim: key}))
 
         # handle slices:
@@ -3015,6 +3202,10 @@ class TimeSeries:
             elif isinstance(key.start, (int, np.int64)) or isinstance(
                 key.stop, (int, np.int64)
             ):
+                start, stop, step = key.indices(len(self))
+                if step == 1:
+                    return self._time_slice(start, stop)
+
                 xa_ = self._xa.isel({self._time_dim: key})
                 _set_freq_in_xa(
                     xa_
@@ -3025,6 +3216,10 @@ class TimeSeries:
             ):
                 _check_dt()
 
+                if key.step is None:
+                    positions = self._time_index.slice_indexer(key.start, key.stop)
+                    return self._time_slice(positions.start, positions.stop)
+
                 # indexing may discard the freq so we restore it...
                 xa_ = self._xa.sel({self._time_dim: key})
                 _set_freq_in_xa(xa_)
@@ -3036,16 +3231,13 @@ class TimeSeries:
                 self._xa.sel({DIMS[1]: [key]})
             )  # have to put key in a list not to drop the dimension
         elif isinstance(key, (int, np.int64)):
-            xa_ = self._xa.isel({self._time_dim: [key]})
-            _set_freq_in_xa(xa_)  # indexing may discard the freq so we restore it...
-            return self.__class__(xa_)
+            position = range(len(self))[key]
+            return self._time_slice(position, position + 1)
         elif isinstance(key, pd.Timestamp):
             _check_dt()
 
-            # indexing may discard the freq so we restore it...
-            xa_ = self._xa.sel({self._time_dim: [key]})
-            _set_freq_in_xa(xa_)
-            return self.__class__(xa_)
+            position = self._time_index.get_loc(key)
+            return self._time_slice(position, position + 1)
 
         # handle lists:
         if isinstance(key, list):
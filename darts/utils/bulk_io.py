@@ -0,0 +1,826 @@
+"""
+Bulk Input/Output
+-----------------
+
+Utilities to load many time series at once from long-format files, where each row holds the id of a series,
+a time stamp and the values of the components at this time.
+
+The files are read in chunks of rows, and the series are built directly from the NumPy arrays of the chunks,
+without creating an intermediate DataFrame per series. When the rows of each series are contiguous in the file
+(for instance if the file is sorted by series id), each series is emitted as soon as all its rows have been read, so
+that the memory used does not depend on the size of the file.
+
+Many series can also be stored in a compact binary file with :func:`save_series_binary()`, which holds the values
+of all series in one contiguous buffer, along with per-series offsets and time index descriptors. The file is read
+back with :func:`load_series_binary()`, by default through a memory map: the series are only built when they are
+accessed, and their values are views of the mapped buffer.
+
+The sequences of series loaded from binary files can be given to the training datasets of the torch models, which
+then read the windows of the samples on demand: their lengths are read from the index of the file (without building
+the series), and the sequences are pickled as their file path, so that the ``DataLoader`` workers memory-map the
+file themselves instead of receiving a copy of all the series.
+"""
+
+import json
+from collections.abc import Sequence as SequenceABC
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import Tick
+
+from darts.logging import get_logger, raise_if_not, raise_log
+from darts.timeseries import TimeSeries, DIMS
+
+logger = get_logger(__name__)
+
+
+def iter_series_from_csv(
+    filepath_or_buffer,
+    id_col: str,
+    time_col: str,
+    value_cols: Optional[Union[List[str], str]] = None,
+    chunksize: int = 1_000_000,
+    contiguous: bool = True,
+    freq: Optional[str] = None,
+    fill_missing_dates: Optional[bool] = False,
+    dtype: np.dtype = np.float64,
+    **kwargs,
+) -> Iterator[Tuple[Any, TimeSeries]]:
+    """
+    Lazily builds the time series stored in a long-format CSV file, which is read in chunks of `chunksize` rows.
+
+    Parameters
+    ----------
+    filepath_or_buffer
+        The path to the CSV file, or the file object; consistent with the argument of `pandas.read_csv` function.
+    id_col
+        The name of the column holding the id of the series of each row.
+    time_col
+        The name of the time column. It can hold integers, or time stamps which are parsed as dates.
+    value_cols
+        A string or list of strings representing the value column(s) of the series. If set to `None`, all the
+        columns except `id_col` and `time_col` are used.
+    chunksize
+        The number of rows read at once.
+    contiguous
+        Whether the rows of each series are contiguous in the file. If so, each series is emitted as soon as it is
+        complete. Otherwise, all the values are first read, and the series are emitted at the end of the file.
+    freq
+        Optionally, the frequency of the series with a DatetimeIndex. If not provided, it is inferred for each series.
+    fill_missing_dates
+        Optionally, a boolean value indicating whether to fill missing dates with NaN values.
+    dtype
+        The floating point dtype of the series values.
+    **kwargs
+        Optional arguments to be passed to `pandas.read_csv` function.
+
+    Returns
+    -------
+    Iterator[Tuple[Any, TimeSeries]]
+        An iterator over the tuples `(series id, series)`, in the order of the first row of each series.
+    """
+    value_cols = [value_cols] if isinstance(value_cols, str) else value_cols
+    if value_cols is not None:
+        kwargs["usecols"] = [id_col, time_col] + value_cols
+
+    chunks = pd.read_csv(filepath_or_buffer, chunksize=chunksize, **kwargs)
+    return _iter_series_from_chunks(
+        chunks,
+        id_col=id_col,
+        time_col=time_col,
+        value_cols=value_cols,
+        contiguous=contiguous,
+        freq=freq,
+        fill_missing_dates=fill_missing_dates,
+        dtype=dtype,
+    )
+
+
+def iter_series_from_parquet(
+    path,
+    id_col: str,
+    time_col: str,
+    value_cols: Optional[Union[List[str], str]] = None,
+    chunksize: int = 1_000_000,
+    contiguous: bool = True,
+    freq: Optional[str] = None,
+    fill_missing_dates: Optional[bool] = False,
+    dtype: np.dtype = np.float64,
+) -> Iterator[Tuple[Any, TimeSeries]]:
+    """
+    Lazily builds the time series stored in a long-format Parquet file, which is read in batches of `chunksize`
+    rows. Only the `id_col`, `time_col` and `value_cols` columns are read from the file. This requires `pyarrow`.
+
+    Parameters
+    ----------
+    path
+        The path to the Parquet file, or the file object; consistent with the argument of
+        `pyarrow.parquet.ParquetFile`.
+    id_col
+        The name of the column holding the id of the series of each row.
+    time_col
+        The name of the time column. It can hold integers, or time stamps which are parsed as dates.
+    value_cols
+        A string or list of strings representing the value column(s) of the series. If set to `None`, all the
+        columns except `id_col` and `time_col` are used.
+    chunksize
+        The number of rows read at once.
+    contiguous
+        Whether the rows of each series are contiguous in the file. If so, each series is emitted as soon as it is
+        complete. Otherwise, all the values are first read, and the series are emitted at the end of the file.
+    freq
+        Optionally, the frequency of the series with a DatetimeIndex. If not provided, it is inferred for each series.
+    fill_missing_dates
+        Optionally, a boolean value indicating whether to fill missing dates with NaN values.
+    dtype
+        The floating point dtype of the series values.
+
+    Returns
+    -------
+    Iterator[Tuple[Any, TimeSeries]]
+        An iterator over the tuples `(series id, series)`, in the order of the first row of each series.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise_log(
+            ImportError(
+                "Reading Parquet files requires `pyarrow`. To enable it, install it with `pip install pyarrow`."
+            ),
+            logger,
+        )
+
+    parquet_file = pq.ParquetFile(path)
+    value_cols = [value_cols] if isinstance(value_cols, str) else value_cols
+    if value_cols is None:
+        value_cols = [
+            name
+            for name in parquet_file.schema_arrow.names
+            if name not in (id_col, time_col)
+        ]
+
+    chunks = (
+        batch.to_pandas()
+        for batch in parquet_file.iter_batches(
+            batch_size=chunksize, columns=[id_col, time_col] + value_cols
+        )
+    )
+    return _iter_series_from_chunks(
+        chunks,
+        id_col=id_col,
+        time_col=time_col,
+        value_cols=value_cols,
+        contiguous=contiguous,
+        freq=freq,
+        fill_missing_dates=fill_missing_dates,
+        dtype=dtype,
+    )
+
+
+def _iter_series_from_chunks(
+    chunks: Iterable[pd.DataFrame],
+    id_col: str,
+    time_col: str,
+    value_cols: Optional[List[str]],
+    contiguous: bool,
+    freq: Optional[str],
+    fill_missing_dates: Optional[bool],
+    dtype: np.dtype,
+) -> Iterator[Tuple[Any, TimeSeries]]:
+    """Builds the series of long-format chunks of rows, which only need to be iterated over once"""
+    components = None
+
+    # the rows read so far for each series which is not complete yet, as lists of (times, values) arrays
+    pending = {}
+    emitted_ids = set()
+
+    # the frequencies inferred so far, by time step (or None for the irregular time steps of, e.g., months)
+    freq_cache = {}
+
+    for chunk in chunks:
+        if components is None:
+            if value_cols is None:
+                value_cols = [c for c in chunk.columns if c not in (id_col, time_col)]
+            components = pd.Index(value_cols, name=DIMS[1])
+
+        if len(chunk) == 0:
+            continue
+
+        ids = chunk[id_col].to_numpy()
+        times = _time_values(chunk[time_col])
+        values = chunk[value_cols].to_numpy(dtype=dtype)
+
+        if contiguous:
+            # the rows of a series span a single slice of the chunk
+            bounds = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+            starts, ends = np.r_[0, bounds], np.r_[bounds, len(ids)]
+            for start, end in zip(starts, ends):
+                series_id = ids[start]
+                if series_id not in pending:
+                    # a new series starts, so the previous one (if any) is complete
+                    for previous_id in list(pending):
+                        yield previous_id, _build_series(
+                            pending.pop(previous_id),
+                            components,
+                            freq,
+                            fill_missing_dates,
+                            freq_cache,
+                        )
+                        emitted_ids.add(previous_id)
+                    raise_if_not(
+                        series_id not in emitted_ids,
+                        f"The rows of series `{series_id}` are not contiguous; use `contiguous=False`.",
+                        logger,
+                    )
+                    pending[series_id] = []
+                pending[series_id].append((times[start:end], values[start:end]))
+        else:
+            codes, uniques = pd.factorize(ids)
+            order = np.argsort(codes, kind="stable")
+            bounds = np.flatnonzero(np.diff(codes[order])) + 1
+            for code, rows in zip(
+                codes[order[np.r_[0, bounds]]], np.split(order, bounds)
+            ):
+                pending.setdefault(uniques[code], []).append(
+                    (times[rows], values[rows])
+                )
+
+    for series_id, pieces in pending.items():
+        yield series_id, _build_series(
+            pieces, components, freq, fill_missing_dates, freq_cache
+        )
+
+
+def _time_values(times: pd.Series) -> np.ndarray:
+    """Returns the integer or datetime64 values of a time column"""
+    if np.issubdtype(times.dtype, np.integer) or np.issubdtype(
+        times.dtype, np.datetime64
+    ):
+        return times.to_numpy()
+    return pd.to_datetime(times).to_numpy()
+
+
+def _build_series(
+    pieces: List[Tuple[np.ndarray, np.ndarray]],
+    components: pd.Index,
+    freq: Optional[str],
+    fill_missing_dates: Optional[bool],
+    freq_cache: Dict[Optional[int], pd.DateOffset],
+) -> TimeSeries:
+    """Builds a series from the (times, values) arrays of its rows"""
+    times = np.concatenate([piece[0] for piece in pieces])
+    values = np.concatenate([piece[1] for piece in pieces])
+    if np.any(times[1:] < times[:-1]):
+        order = np.argsort(times, kind="stable")
+        times, values = times[order], values[order]
+
+    # build regular series directly, and leave the other ones to the validation of the regular constructor
+    if np.issubdtype(times.dtype, np.integer):
+        if len(times) > 0 and np.all(np.diff(times) == 1):
+            return TimeSeries._from_trusted_values(
+                values[:, :, np.newaxis],
+                components=components,
+                time_index=pd.RangeIndex(times[0], times[-1] + 1, name=DIMS[0]),
+            )
+        time_index = pd.Index(times, name=DIMS[0])
+    else:
+        series_freq = _regular_freq(times, freq, freq_cache)
+        if series_freq is not None:
+            return TimeSeries._from_trusted_values(
+                values[:, :, np.newaxis],
+                components=components,
+                start=pd.Timestamp(times[0]),
+                freq=series_freq,
+            )
+        time_index = pd.DatetimeIndex(times, name=DIMS[0])
+
+    return TimeSeries.from_times_and_values(
+        time_index,
+        values,
+        fill_missing_dates=fill_missing_dates,
+        freq=freq,
+        columns=components,
+    )
+
+
+def _regular_freq(
+    times: np.ndarray,
+    freq: Optional[str],
+    freq_cache: Dict[Optional[int], pd.DateOffset],
+) -> Optional[pd.DateOffset]:
+    """Returns the frequency of the datetime64 `times` if they form a complete and regular time index, or None.
+    As inferring the frequency of each series is expensive, the frequencies found for the previous series are tried
+    first."""
+    if len(times) < 2:
+        return None if freq is None else to_offset(freq)
+
+    steps = np.diff(times.view(np.int64))
+    step = steps[0] if np.all(steps == steps[0]) else None
+
+    candidate = to_offset(freq) if freq is not None else freq_cache.get(step)
+    if candidate is not None:
+        if isinstance(candidate, Tick):
+            if step is not None and step == candidate.nanos:
+                return candidate
+        elif np.array_equal(
+            pd.date_range(times[0], periods=len(times), freq=candidate).asi8,
+            times.view(np.int64),
+        ):
+            return candidate
+    if freq is not None:
+        return None
+
+    inferred_freq = pd.infer_freq(pd.DatetimeIndex(times))
+    if inferred_freq is None:
+        return None
+    freq_cache[step] = to_offset(inferred_freq)
+    return freq_cache[step]
+
+
+# binary format: the magic bytes, the length of the JSON header as a little-endian uint64, the header itself, and
+# the arrays described in the header, each aligned on _ALIGNMENT bytes
+_MAGIC = b"DARTSBIN"
+_FORMAT_VERSION = 1
+_ALIGNMENT = 64
+
+# the kinds of time index
+_RANGE_INDEX, _DATETIME_INDEX, _EXPLICIT_INDEX = 0, 1, 2
+
+
+class _StringTable:
+    """Assigns consecutive codes to hashable values"""
+
+    def __init__(self):
+        self.codes = {}
+
+    def code(self, value) -> int:
+        return self.codes.setdefault(value, len(self.codes))
+
+    def values(self) -> list:
+        return list(self.codes)
+
+
+def save_series_binary(
+    path: str, series: Union[TimeSeries, Sequence[TimeSeries]]
+) -> None:
+    """
+    Saves one or several series in a single compact binary file, to be read with :func:`load_series_binary()`.
+
+    The values of all the series are stored in one contiguous buffer, of the common dtype of the series. Each series
+    is described by its offset in this buffer, its shape, and its time index: regular time indices are only stored
+    as their start and frequency, and the names of the frequencies, time dimensions and components are shared
+    between the series.
+
+    Parameters
+    ----------
+    path
+        The path of the file to write.
+    series
+        The series to save.
+    """
+    series = [series] if isinstance(series, TimeSeries) else series
+    n_series = len(series)
+
+    value_offsets = np.zeros(n_series + 1, dtype=np.int64)
+    time_offsets = np.zeros(n_series + 1, dtype=np.int64)
+    shapes = np.empty((n_series, 3), dtype=np.int64)
+    index_kinds = np.empty(n_series, dtype=np.int8)
+    index_starts = np.zeros(n_series, dtype=np.int64)
+    freq_codes = np.full(n_series, -1, dtype=np.int32)
+    tz_codes = np.full(n_series, -1, dtype=np.int32)
+    time_dim_codes = np.empty(n_series, dtype=np.int32)
+    component_codes = np.empty(n_series, dtype=np.int32)
+    freqs, timezones, time_dims, components = (_StringTable() for _ in range(4))
+    explicit_times = []
+    dtypes = set()
+
+    for i, ts in enumerate(series):
+        values = ts._values
+        shapes[i] = values.shape
+        value_offsets[i + 1] = value_offsets[i] + values.size
+        dtypes.add(values.dtype)
+        time_dim_codes[i] = time_dims.code(ts._time_dim)
+        component_codes[i] = components.code(tuple(ts._components))
+
+        if ts._has_datetime_index:
+            index_kinds[i] = _DATETIME_INDEX
+            start = ts.start_time()
+            index_starts[i] = start.value
+            freq_codes[i] = freqs.code(ts.freq_str)
+            if start.tz is not None:
+                tz_codes[i] = timezones.code(str(start.tz))
+        else:
+            index = ts._time_index
+            if isinstance(index, pd.RangeIndex) and index.step == 1:
+                index_kinds[i] = _RANGE_INDEX
+                index_starts[i] = index.start
+            else:
+                index_kinds[i] = _EXPLICIT_INDEX
+                explicit_times.append(index.to_numpy(dtype=np.int64))
+        time_offsets[i + 1] = time_offsets[i] + (
+            len(values) if index_kinds[i] == _EXPLICIT_INDEX else 0
+        )
+
+    dtype = np.result_type(*dtypes) if dtypes else np.dtype(np.float64)
+    arrays = {
+        "value_offsets": value_offsets,
+        "shapes": shapes,
+        "index_kinds": index_kinds,
+        "index_starts": index_starts,
+        "freq_codes": freq_codes,
+        "tz_codes": tz_codes,
+        "time_dim_codes": time_dim_codes,
+        "component_codes": component_codes,
+        "time_offsets": time_offsets,
+        "times": (
+            np.concatenate(explicit_times)
+            if explicit_times
+            else np.empty(0, dtype=np.int64)
+        ),
+    }
+
+    # lay out the arrays after the header, the values buffer being written last, series by series
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        layout[name] = {
+            "dtype": array.dtype.str,
+            "shape": array.shape,
+            "offset": offset,
+        }
+        offset = _aligned(offset + array.nbytes)
+    layout["values"] = {
+        "dtype": dtype.str,
+        "shape": (int(value_offsets[-1]),),
+        "offset": offset,
+    }
+
+    header = {
+        "version": _FORMAT_VERSION,
+        "n_series": n_series,
+        "freqs": freqs.values(),
+        "timezones": timezones.values(),
+        "time_dims": time_dims.values(),
+        "components": [list(names) for names in components.values()],
+        "arrays": layout,
+    }
+    header_bytes = json.dumps(header).encode()
+    data_start = _aligned(len(_MAGIC) + 8 + len(header_bytes))
+
+    with open(path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(np.uint64(len(header_bytes)).tobytes())
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]["offset"])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.seek(data_start + layout["values"]["offset"])
+        for ts in series:
+            f.write(np.ascontiguousarray(ts._values, dtype=dtype).tobytes())
+        f.truncate()
+
+
+def load_series_binary(path: str, mmap: bool = True) -> "BinarySeriesSequence":
+    """
+    Loads the series of a binary file written by :func:`save_series_binary()`.
+
+    Parameters
+    ----------
+    path
+        The path of the file to read.
+    mmap
+        Whether to memory-map the file instead of reading it. In this case, the values of the series are read-only
+        views of the file, which are only loaded when accessed.
+
+    Returns
+    -------
+    BinarySeriesSequence
+        A sequence of the series of the file, which are built when they are accessed.
+    """
+    with open(path, "rb") as f:
+        raise_if_not(
+            f.read(len(_MAGIC)) == _MAGIC,
+            f"The file `{path}` is not a binary series file.",
+            logger,
+        )
+        header_length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+        header = json.loads(f.read(header_length))
+    raise_if_not(
+        header["version"] == _FORMAT_VERSION,
+        f"Unsupported binary series file version: {header['version']}.",
+        logger,
+    )
+
+    data_start = _aligned(len(_MAGIC) + 8 + header_length)
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        dtype, shape = np.dtype(spec["dtype"]), tuple(spec["shape"])
+        offset = data_start + spec["offset"]
+        if int(np.prod(shape)) == 0:
+            arrays[name] = np.empty(shape, dtype=dtype)
+        elif mmap:
+            # the plain ndarray view keeps the memory map alive
+            arrays[name] = np.asarray(
+                np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+            )
+        else:
+            arrays[name] = np.fromfile(
+                path, dtype=dtype, count=int(np.prod(shape)), offset=offset
+            ).reshape(shape)
+
+    return BinarySeriesSequence(
+        header, arrays, range(header["n_series"]), path=path, mmap=mmap
+    )
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _reload_series_binary(
+    path: str, mmap: bool, indices: range
+) -> "BinarySeriesSequence":
+    sequence = load_series_binary(path, mmap=mmap)
+    return BinarySeriesSequence(
+        sequence._header, sequence._arrays, indices, path=path, mmap=mmap
+    )
+
+
+class BinarySeriesSequence(SequenceABC):
+    def __init__(
+        self,
+        header: dict,
+        arrays: Dict[str, np.ndarray],
+        indices: range,
+        path: str,
+        mmap: bool,
+    ):
+        """A sequence of the series stored in a binary file, as returned by :func:`load_series_binary()`.
+
+        The series are built when they are accessed (and are not kept), from views of the values buffer. Slicing the
+        sequence returns another sequence, without building any series. The lengths and values of the series are
+        also available without building them, with :func:`lengths()` and :func:`values_at()`.
+
+        The sequence is pickled as the path of its file (and the positions of its series in the file), which is
+        loaded again when unpickling; the file must therefore still exist at the same path.
+        """
+        self._header = header
+        self._arrays = arrays
+        self._indices = indices
+        self._path = path
+        self._mmap = mmap
+        self._freqs = [to_offset(freq) for freq in header["freqs"]]
+        self._components = [
+            pd.Index(names, name=DIMS[1]) for names in header["components"]
+        ]
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return BinarySeriesSequence(
+                self._header,
+                self._arrays,
+                self._indices[item],
+                path=self._path,
+                mmap=self._mmap,
+            )
+        return self._build(self._indices[item])
+
+    def __reduce__(self):
+        return _reload_series_binary, (self._path, self._mmap, self._indices)
+
+    def lengths(self) -> np.ndarray:
+        """
+        Returns the lengths of the series of the sequence, read from the index of the file.
+
+        Returns
+        -------
+        np.ndarray
+            The number of time steps of each series.
+        """
+        return self._arrays["shapes"][self._indices, 0]
+
+    def values_at(self, item: int) -> np.ndarray:
+        """
+        Returns the values of the series at position `item` (of its first sample, for stochastic series), without
+        building the series. This is equivalent to ``sequence[item].values(copy=False)``.
+
+        Parameters
+        ----------
+        item
+            The position of the series in the sequence.
+
+        Returns
+        -------
+        np.ndarray
+            A read-only view of the values of the series, of shape (time, component).
+        """
+        return self._values(self._indices[item])[:, :, 0]
+
+    def _values(self, i: int) -> np.ndarray:
+        arrays = self._arrays
+        return arrays["values"][
+            arrays["value_offsets"][i] : arrays["value_offsets"][i + 1]
+        ].reshape(arrays["shapes"][i])
+
+    def _build(self, i: int) -> TimeSeries:
+        arrays = self._arrays
+        values = self._values(i)
+        components = self._components[arrays["component_codes"][i]]
+        time_dim = self._header["time_dims"][arrays["time_dim_codes"][i]]
+
+        kind = arrays["index_kinds"][i]
+        if kind == _DATETIME_INDEX:
+            tz_code = arrays["tz_codes"][i]
+            start = pd.Timestamp(
+                int(arrays["index_starts"][i]),
+                tz=None if tz_code < 0 else self._header["timezones"][tz_code],
+            )
+            return TimeSeries._from_trusted_values(
+                values,
+                components,
+                start=start,
+                freq=self._freqs[arrays["freq_codes"][i]],
+                time_dim=time_dim,
+            )
+        if kind == _RANGE_INDEX:
+            return TimeSeries._from_trusted_values(
+                values,
+                components,
+                start=int(arrays["index_starts"][i]),
+                time_dim=time_dim,
+            )
+        times = arrays["times"][
+            arrays["time_offsets"][i] : arrays["time_offsets"][i + 1]
+        ]
+        return TimeSeries._from_trusted_values(
+            values,
+            components,
+            time_index=pd.Int64Index(times, name=time_dim),
+            time_dim=time_dim,
+        )
+
+
+class ForecastArray(SequenceABC):
+    def __init__(
+        self,
+        values: np.ndarray,
+        start_times: Sequence[Union[pd.Timestamp, int]],
+        freqs: Sequence[Optional[pd.DateOffset]],
+        components: Sequence[pd.Index],
+    ):
+        """The forecasts of many series, held in a single array, as returned by the `predict()` method of the torch
+        models with ``return_array=True``.
+
+        The forecasts of all series have the same length and number of samples; their values are stored in one array
+        of shape (series, time, component, sample), along with the time index of each forecast (its first time stamp
+        and frequency) and its component names. The forecasts are built as ``TimeSeries`` when they are accessed
+        (and are not kept), as views of the values array.
+
+        Parameters
+        ----------
+        values
+            The values of the forecasts, of shape (series, time, component, sample).
+        start_times
+            The first time stamp (or integer index) of each forecast.
+        freqs
+            The frequency of each forecast, or None for forecasts indexed by integers.
+        components
+            The component names of each forecast.
+        """
+        self.values = values
+        self.start_times = start_times
+        self.freqs = freqs
+        self.components = components
+
+    @classmethod
+    def from_input_series(
+        cls, values: np.ndarray, input_series: Sequence[TimeSeries]
+    ) -> "ForecastArray":
+        """
+        Returns the forecasts starting right after the end of each input series, with their frequency and
+        component names. The first time stamps of all forecasts are computed with one vectorized operation per
+        frequency.
+
+        Parameters
+        ----------
+        values
+            The values of the forecasts, of shape (series, time, component, sample).
+        input_series
+            The series whose future is forecast, one per forecast.
+
+        Returns
+        -------
+        ForecastArray
+            The forecasts of the input series.
+        """
+        raise_if_not(
+            len(values) == len(input_series),
+            "There must be one input series for each forecast.",
+            logger,
+        )
+        if values.dtype not in (np.float32, np.float64):
+            values = values.astype(np.float64)
+        return cls(
+            np.ascontiguousarray(values),
+            _following_times(input_series),
+            [ts._freq if ts._has_datetime_index else None for ts in input_series],
+            [ts._components for ts in input_series],
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return ForecastArray(
+                self.values[item],
+                self.start_times[item],
+                self.freqs[item],
+                self.components[item],
+            )
+        return TimeSeries._from_trusted_values(
+            self.values[item],
+            self.components[item],
+            start=self.start_times[item],
+            freq=self.freqs[item],
+        )
+
+    def time_index(self, item: int) -> Union[pd.DatetimeIndex, pd.RangeIndex]:
+        """
+        Returns the time index of a forecast, without building the forecast series.
+
+        Parameters
+        ----------
+        item
+            The position of the forecast.
+
+        Returns
+        -------
+        Union[pd.DatetimeIndex, pd.RangeIndex]
+            The time index of the forecast.
+        """
+        start, length = self.start_times[item], self.values.shape[1]
+        if self.freqs[item] is None:
+            return pd.RangeIndex(start, start + length, name=DIMS[0])
+        return pd.date_range(start, periods=length, freq=self.freqs[item], name=DIMS[0])
+
+    def to_series(self) -> List[TimeSeries]:
+        """
+        Builds all the forecasts.
+
+        Returns
+        -------
+        List[TimeSeries]
+            The forecast of each series.
+        """
+        return list(self)
+
+
+def _following_times(series: Sequence[TimeSeries]) -> List[Union[pd.Timestamp, int]]:
+    """Returns the time step following the end of each series. The series are grouped by frequency and time zone,
+    and the time steps of each group are computed at once from the (UTC) nanoseconds of the end times."""
+    # the groups are keyed by frequency strings, which are hashed much faster than the offsets
+    groups, freqs = {}, {}
+    for position, ts in enumerate(series):
+        if not ts._has_datetime_index:
+            key = None
+            end = (
+                ts._index_start + len(ts._values) - 1
+                if ts._time_index_cache is None
+                else ts._time_index_cache[-1]
+            )
+        elif ts._time_index_cache is None:
+            key = (ts._freq_str, ts._index_start.tz)
+            end = (
+                ts._index_start.value + (len(ts._values) - 1) * ts._freq.nanos
+                if isinstance(ts._freq, Tick) and key[1] is None
+                else ts.end_time().value
+            )
+        else:
+            key = (ts._freq_str, ts._time_index_cache.tz)
+            end = ts._time_index_cache.asi8[-1]
+        if key not in groups:
+            groups[key] = ([], [])
+            freqs[key] = ts._freq
+        positions, ends = groups[key]
+        positions.append(position)
+        ends.append(end)
+
+    times = [None] * len(series)
+    for key, (positions, ends) in groups.items():
+        if key is None:
+            following = (np.asarray(ends, dtype=np.int64) + 1).tolist()
+        else:
+            freq, tz = freqs[key], key[1]
+            index = pd.DatetimeIndex(np.asarray(ends, dtype="datetime64[ns]"))
+            if tz is not None:
+                index = index.tz_localize("UTC").tz_convert(tz)
+            following = list(index + freq)
+        for position, time in zip(positions, following):
+            times[position] = time
+    return times
@@ -0,0 +1,312 @@
+"""
+Forecasting Cache
+-----------------
+
+An opt-in, persistent on-disk cache of the fitted models and of the forecasts they produce.
+
+While a :class:`ForecastingCache` is active, the calls to the `fit()`, `update()`, `predict()` and
+`historical_forecasts()` methods of the forecasting models are memoized in the cache directory. A call is identified
+by a content hash of the model class and creation parameters, of the state of the model before the call (the
+sequence of cached calls which produced it), and of the call arguments; where the time series are hashed by values,
+time index and components. Repeated calls, including across processes and sessions, are then served from the cache
+instead of being recomputed. The other methods changing a model (such as `fit_from_dataset()` of the torch models)
+are not memoized, and the subsequent calls of the model are not served from the cache until it is fitted again.
+
+>>> from darts.utils.cache import ForecastingCache
+>>> with ForecastingCache("~/.darts/cache", max_size=2**30):
+...     model.fit(series)  # fitted once, then loaded from the cache
+...     forecast = model.predict(12)
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from darts.logging import get_logger, raise_if_not
+from darts.timeseries import TimeSeries
+
+logger = get_logger(__name__)
+
+# the cache used by the forecasting models, if any
+_active_cache: Optional["ForecastingCache"] = None
+
+
+class ForecastingCache:
+    def __init__(self, directory: str, max_size: Optional[int] = None):
+        """A persistent cache of the forecasting models' calls, stored in a local directory.
+
+        The cache can be used as a context manager, or be activated for the whole process with
+        :func:`set_forecasting_cache()`. Each cached call is stored in its own file. When the total size of these
+        files exceeds `max_size`, the least recently used entries are evicted.
+
+        Note that the calls of the models are only memoized if their state is known to the cache, i.e. if they were
+        not fitted outside of it. Calls made in other processes (for instance with ``n_jobs != 1``) are not cached.
+
+        Parameters
+        ----------
+        directory
+            The directory storing the cache entries. It is created if it does not exist.
+        max_size
+            Optionally, the maximum size of the cache in bytes.
+        """
+        raise_if_not(
+            max_size is None or max_size > 0,
+            "The maximum size of the cache must be positive.",
+            logger,
+        )
+        self.directory = os.path.expanduser(directory)
+        self.max_size = max_size
+        self._previous_cache = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    def __enter__(self) -> "ForecastingCache":
+        global _active_cache
+        self._previous_cache = _active_cache
+        _active_cache = self
+        return self
+
+    def __exit__(self, *exc_info):
+        global _active_cache
+        _active_cache = self._previous_cache
+        self._previous_cache = None
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pkl")
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Returns a tuple `(found, value)` with the value stored under `key` in the cache, if `found` is True."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+
+        # mark the entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True, value
+
+    def set(self, key: str, value: Any) -> None:
+        """Stores `value` under `key` in the cache, and evicts the least recently used entries if needed."""
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Could not cache the result of a call: {e}")
+            return
+
+        if self.max_size is not None and len(data) > self.max_size:
+            return
+
+        # write to a temporary file first, so that concurrent readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._evict()
+
+    def _entries(self):
+        """Returns the `(last access time, size, path)` of the cache entries"""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".pkl"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self) -> None:
+        if self.max_size is None:
+            return
+
+        entries = self._entries()
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= entry_size
+
+    @property
+    def size(self) -> int:
+        """The total size of the cache entries, in bytes."""
+        return sum(entry_size for _, entry_size, _ in self._entries())
+
+    def clear(self) -> None:
+        """Removes all the entries of the cache."""
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def set_forecasting_cache(cache: Optional[ForecastingCache]) -> None:
+    """Sets the cache used by all the forecasting models of the process (or disables caching if `cache` is None)."""
+    global _active_cache
+    _active_cache = cache
+
+
+def get_forecasting_cache() -> Optional[ForecastingCache]:
+    """Returns the cache currently used by the forecasting models, if any."""
+    return _active_cache
+
+
+def _hash_update(hasher, obj: Any) -> None:
+    """Updates `hasher` with the content of `obj`"""
+    if isinstance(obj, TimeSeries):
+        hasher.update(b"TimeSeries")
+        _hash_update(hasher, obj.time_index)
+        _hash_update(hasher, list(obj.components))
+        _hash_update(hasher, obj.all_values(copy=False))
+    elif isinstance(obj, np.ndarray) and obj.dtype != object:
+        hasher.update(f"ndarray{obj.dtype.str}{obj.shape}".encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, pd.RangeIndex):
+        hasher.update(f"RangeIndex{obj.start},{obj.stop},{obj.step}".encode())
+    elif isinstance(obj, pd.Index):
+        hasher.update(f"{type(obj).__name__}{getattr(obj, 'freqstr', None)}".encode())
+        _hash_update(hasher, np.asarray(obj))
+    elif isinstance(obj, (list, tuple, np.ndarray)):
+        hasher.update(f"{type(obj).__name__}{len(obj)}".encode())
+        for item in obj:
+            _hash_update(hasher, item)
+    elif isinstance(obj, dict):
+        hasher.update(f"dict{len(obj)}".encode())
+        for key in sorted(obj, key=repr):
+            _hash_update(hasher, key)
+            _hash_update(hasher, obj[key])
+    elif obj is None or isinstance(
+        obj, (bool, int, float, complex, str, bytes, np.generic, pd.Timestamp)
+    ):
+        hasher.update(f"{type(obj).__name__}{obj!r}".encode())
+    elif inspect.isfunction(obj) or inspect.isbuiltin(obj) or inspect.isclass(obj):
+        hasher.update(f"{obj.__module__}.{obj.__qualname__}".encode())
+    else:
+        try:
+            hasher.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            hasher.update(repr(obj).encode())
+
+
+def _hash_key(*parts: Any) -> str:
+    """Returns the hexadecimal content hash of `parts`"""
+    hasher = hashlib.sha256()
+    for part in parts:
+        _hash_update(hasher, part)
+    return hasher.hexdigest()
+
+
+def _cached_model_method(method: Callable) -> Callable:
+    """Decorates a method of the forecasting models so that its calls are memoized in the active cache.
+
+    Besides their result, the calls of `fit()`, `update()` and `historical_forecasts()` store the state of the model,
+    which is restored when they are served from the cache. Each cached call then identifies the new state of the model
+    (`_cache_state_key`), so that the subsequent calls depend on it.
+    """
+    signature = inspect.signature(method)
+    modifies_state = method.__name__ != "predict"
+
+    @functools.wraps(method)
+    def cached_method(model, *args, **kwargs):
+        cache = _active_cache
+        if cache is None or model.__dict__.get("_cache_call_in_progress", False):
+            result = method(model, *args, **kwargs)
+            if modifies_state:
+                # the new state of the model is unknown to the cache
+                model.__dict__.pop("_cache_state_key", None)
+            return result
+
+        state_key = model.__dict__.get("_cache_state_key")
+        if state_key is None and model._fit_called:
+            # the model was fitted outside of the cache, its state is unknown
+            return method(model, *args, **kwargs)
+
+        arguments = signature.bind(model, *args, **kwargs)
+        arguments.apply_defaults()
+        del arguments.arguments[next(iter(signature.parameters))]
+        key = _hash_key(
+            type(model).__module__,
+            type(model).__qualname__,
+            model._model_params,
+            state_key,
+            method.__name__,
+            dict(arguments.arguments),
+        )
+
+        found, entry = cache.get(key)
+        if found:
+            returns_model, result, state = entry
+            if state is not None:
+                model.__dict__.update(state)
+        else:
+            model._cache_call_in_progress = True
+            try:
+                result = method(model, *args, **kwargs)
+            except BaseException:
+                if modifies_state:
+                    model._cache_state_key = None
+                raise
+            finally:
+                model._cache_call_in_progress = False
+
+            returns_model = result is model
+            state = (
+                {
+                    name: value
+                    for name, value in _model_state(model).items()
+                    if not name.startswith("_cache")
+                }
+                if modifies_state
+                else None
+            )
+            cache.set(key, (returns_model, None if returns_model else result, state))
+
+        if modifies_state:
+            model._cache_state_key = key
+        return model if returns_model else result
+
+    return cached_method
+
+
+def _uncached_model_method(method: Callable) -> Callable:
+    """Decorates a method changing the state of the forecasting models outside of the cache, so that the cache no
+    longer identifies the state of the model after its calls.
+    """
+
+    @functools.wraps(method)
+    def uncached_method(model, *args, **kwargs):
+        try:
+            return method(model, *args, **kwargs)
+        finally:
+            model.__dict__.pop("_cache_state_key", None)
+
+    return uncached_method
+
+
+def _model_state(model) -> dict:
+    """Returns the attributes of `model` which are pickled, honouring its `__getstate__()` if any"""
+    get_state = getattr(model, "__getstate__", None)
+    state = get_state() if get_state is not None else None
+    return state if isinstance(state, dict) else model.__dict__
@@ -45,6 +45,9 @@ try:
     # Implementation (horizon-based)
     from .horizon_based_dataset import HorizonBasedDataset
 
+    # Training window sampler
+    from .samplers import WindowSampler
+
     # Sequence Encoder
     from .encoders import SequentialEncoder
 
@@ -9,7 +9,7 @@ import numpy as np
 from darts.logging import raise_if_not, get_logger
 from darts import TimeSeries
 from .training_dataset import PastCovariatesTrainingDataset
-from .utils import CovariateType
+from .utils import CovariateType, _series_lengths, _series_values
 
 logger = get_logger(__name__)
 
@@ -106,8 +106,7 @@ class HorizonBasedDataset(PastCovariatesTrainingDataset):
     ) -> Tuple[np.ndarray, Optional[np.ndarray], np.ndarray]:
         # determine the index of the time series.
         ts_idx = idx // self.nr_samples_per_ts
-        ts_target = self.target_series[ts_idx]
-        target_vals = ts_target.values(copy=False)
+        target_vals = _series_values(self.target_series, ts_idx)
 
         raise_if_not(
             len(target_vals)
@@ -121,12 +120,16 @@ class HorizonBasedDataset(PastCovariatesTrainingDataset):
         lh_idx = idx - (ts_idx * self.nr_samples_per_ts)
 
         # determine the index at the end of the output chunk
-        end_of_output_idx = len(ts_target) - (
+        end_of_output_idx = len(target_vals) - (
             (self.min_lh - 1) * self.output_chunk_length + lh_idx
         )
 
-        # optionally, load covariates
-        ts_covariate = self.covariates[ts_idx] if self.covariates is not None else None
+        # the series themselves are only needed to index the first sample of each series
+        ts_target, ts_covariate = None, None
+        if ts_idx not in self._index_memory:
+            ts_target = self.target_series[ts_idx]
+            if self.covariates is not None:
+                ts_covariate = self.covariates[ts_idx]
         main_cov_type = (
             CovariateType.NONE if self.covariates is None else CovariateType.PAST
         )
@@ -160,13 +163,14 @@ class HorizonBasedDataset(PastCovariatesTrainingDataset):
         # optionally, extract sample covariates
         covariate = None
         if self.covariates is not None:
+            cov_vals = _series_values(self.covariates, ts_idx)
             raise_if_not(
-                cov_end <= len(ts_covariate),
+                cov_end <= len(cov_vals),
                 f"The dataset contains 'past' covariates that don't extend far enough into the future. "
                 f"({idx}-th sample)",
             )
 
-            covariate = ts_covariate.values(copy=False)[cov_start:cov_end]
+            covariate = cov_vals[cov_start:cov_end]
 
             raise_if_not(
                 len(covariate) == len(past_target),
@@ -175,3 +179,47 @@ class HorizonBasedDataset(PastCovariatesTrainingDataset):
             )
 
         return past_target, covariate, future_target
+
+    def _window_spec(self):
+        lengths = _series_lengths(self.target_series)
+        raise_if_not(
+            (lengths >= (self.lookback + self.max_lh) * self.output_chunk_length).all(),
+            "The dataset contains some input/target series that are shorter than "
+            "`(lookback + max_lh) * H` ({}-th series)".format(
+                np.argmax(
+                    lengths < (self.lookback + self.max_lh) * self.output_chunk_length
+                )
+            ),
+        )
+
+        # same positions as in `__getitem__()`, for all the samples at once
+        ts_idx = np.repeat(np.arange(len(lengths)), self.nr_samples_per_ts)
+        lh_idx = np.tile(np.arange(self.nr_samples_per_ts), len(lengths))
+        end_of_output_idx = lengths[ts_idx] - (
+            (self.min_lh - 1) * self.output_chunk_length + lh_idx
+        )
+        future_start = end_of_output_idx - self.output_chunk_length
+        input_chunk_length = self.lookback * self.output_chunk_length
+        past_start = future_start - input_chunk_length
+
+        covariate = None
+        if self.covariates is not None:
+            cov_start = self._covariate_window_starts(
+                self.target_series,
+                self.covariates,
+                ts_idx,
+                past_start,
+                input_chunk_length,
+                CovariateType.PAST,
+            )
+            covariate = (self.covariates, ts_idx, cov_start, input_chunk_length)
+
+        return (
+            (self.target_series, ts_idx, past_start, input_chunk_length),
+            covariate,
+            (self.target_series, ts_idx, future_start, self.output_chunk_length),
+        )
+
+    def _series_windows(self) -> Tuple[np.ndarray, np.ndarray]:
+        first_indices = np.arange(len(self.target_series)) * self.nr_samples_per_ts
+        return first_indices, np.full(len(self.target_series), self.nr_samples_per_ts)
@@ -0,0 +1,153 @@
+"""
+Training Window Samplers
+------------------------
+"""
+
+from typing import Iterator, Optional, Sequence, Union
+
+import numpy as np
+import torch
+from torch.utils.data import Sampler
+
+from darts.logging import get_logger, raise_if, raise_if_not
+from .training_dataset import TrainingDataset
+
+logger = get_logger(__name__)
+
+
+class WindowSampler(Sampler):
+    def __init__(
+        self,
+        dataset: TrainingDataset,
+        series_weights: Union[str, Sequence[float]] = "length",
+        half_life: Optional[float] = None,
+        num_samples: Optional[int] = None,
+        replacement: bool = True,
+        generator: Optional[torch.Generator] = None,
+    ):
+        """
+        A sampler of the training samples (windows) of a :class:`TrainingDataset`, to be given to
+        `fit_from_dataset()` of the torch models.
+
+        By default, the training datasets emit `max_samples_per_ts` samples for each series, so the samples of the
+        short series are repeated, and an epoch iterates over `n_series * max_samples_per_ts` samples. This sampler
+        instead only draws the distinct windows of each series, with a probability which is the product of:
+
+        * the probability of their series; proportional to its number of windows (`series_weights="length"`, the
+          default, which gives the same probability to all windows), the same for all series
+          (`series_weights="uniform"`), or proportional to some user-given weights,
+        * and, within each series, a probability decaying exponentially with the age of the window (the number of
+          time steps between its end and the end of the series) if `half_life` is set, or uniform otherwise.
+
+        The windows are drawn from the cumulative distribution of their probabilities, which is computed once at
+        creation. Each epoch draws `num_samples` windows, with or without replacement.
+
+        Parameters
+        ----------
+        dataset
+            The training dataset. It must describe the windows of its series, which is the case of the shifted,
+            sequential and horizon-based datasets.
+        series_weights
+            The probability of each series; either "length" (proportional to the number of windows of the series),
+            "uniform", or a sequence of non-negative weights, one per series.
+        half_life
+            Optionally, the age (in time steps) at which the probability of the windows of a series is halved
+            compared to its most recent window.
+        num_samples
+            The number of windows drawn at each epoch. By default, the number of distinct windows of the dataset.
+        replacement
+            Whether the windows are drawn with replacement. Without replacement, `num_samples` must not exceed the
+            number of windows with a non-zero probability.
+        generator
+            Optionally, the torch ``Generator`` used to draw the windows. By default, the global torch random state
+            is used, which is seeded by the `random_state` of the models.
+        """
+        windows = dataset._series_windows()
+        raise_if(
+            windows is None,
+            f"{dataset.__class__.__name__} does not support window samplers.",
+            logger,
+        )
+        first_indices, window_counts = windows
+        n_series = len(window_counts)
+
+        if isinstance(series_weights, str):
+            raise_if_not(
+                series_weights in ["length", "uniform"],
+                f"Unknown series weights `{series_weights}`; use 'length', 'uniform' or a sequence of weights.",
+                logger,
+            )
+            series_probs = (
+                window_counts.astype(float)
+                if series_weights == "length"
+                else (window_counts > 0).astype(float)
+            )
+        else:
+            series_probs = np.asarray(series_weights, dtype=float)
+            raise_if_not(
+                series_probs.shape == (n_series,) and (series_probs >= 0).all(),
+                f"`series_weights` must contain one non-negative weight for each of the {n_series} series.",
+                logger,
+            )
+            series_probs = np.where(window_counts > 0, series_probs, 0.0)
+        raise_if_not(
+            series_probs.sum() > 0, "All the windows have a zero probability.", logger
+        )
+
+        # the series of each window, and its age (number of time steps from the end of the series)
+        total_windows = int(window_counts.sum())
+        window_series = np.repeat(np.arange(n_series), window_counts)
+        window_ages = np.arange(total_windows) - np.repeat(
+            np.cumsum(window_counts) - window_counts, window_counts
+        )
+
+        if half_life is not None:
+            raise_if_not(half_life > 0, "`half_life` must be positive.", logger)
+            window_probs = 0.5 ** (window_ages / half_life)
+        else:
+            window_probs = np.ones(total_windows)
+        series_totals = np.bincount(
+            window_series, weights=window_probs, minlength=n_series
+        )
+        window_probs *= (series_probs / np.where(series_totals > 0, series_totals, 1))[
+            window_series
+        ]
+
+        n_positive = int((window_probs > 0).sum())
+        self.num_samples = n_positive if num_samples is None else num_samples
+        raise_if_not(self.num_samples > 0, "`num_samples` must be positive.", logger)
+        raise_if(
+            not replacement and self.num_samples > n_positive,
+            f"Cannot draw {self.num_samples} windows without replacement out of {n_positive} windows with a "
+            f"non-zero probability.",
+            logger,
+        )
+        self.replacement = replacement
+        self.generator = generator
+
+        self._window_probs = torch.from_numpy(window_probs)
+        self._cumulative_probs = torch.from_numpy(np.cumsum(window_probs))
+        self._dataset_indices = torch.from_numpy(
+            first_indices[window_series] + window_ages
+        )
+
+    def __len__(self) -> int:
+        return self.num_samples
+
+    def __iter__(self) -> Iterator[int]:
+        if self.replacement:
+            # inverse transform sampling from the cumulative probabilities
+            draws = torch.rand(
+                self.num_samples, dtype=torch.float64, generator=self.generator
+            )
+            windows = torch.searchsorted(
+                self._cumulative_probs, draws * self._cumulative_probs[-1], right=True
+            ).clamp_(max=len(self._cumulative_probs) - 1)
+        else:
+            # weighted sampling without replacement: the windows with the smallest exponential keys
+            keys = torch.empty_like(self._window_probs).exponential_(
+                generator=self.generator
+            )
+            keys /= self._window_probs
+            windows = torch.topk(keys, self.num_samples, largest=False).indices
+        return iter(self._dataset_indices[windows].tolist())
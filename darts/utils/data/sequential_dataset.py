@@ -84,6 +84,12 @@ class PastCovariatesSequentialDataset(PastCovariatesTrainingDataset):
     def __getitem__(self, idx) -> Tuple[np.ndarray, Optional[np.ndarray], np.ndarray]:
         return self.ds[idx]
 
+    def _window_spec(self):
+        return self.ds._window_spec()
+
+    def _series_windows(self):
+        return self.ds._series_windows()
+
 
 class FutureCovariatesSequentialDataset(FutureCovariatesTrainingDataset):
     def __init__(
@@ -151,6 +157,12 @@ class FutureCovariatesSequentialDataset(FutureCovariatesTrainingDataset):
     def __getitem__(self, idx) -> Tuple[np.ndarray, Optional[np.ndarray], np.ndarray]:
         return self.ds[idx]
 
+    def _window_spec(self):
+        return self.ds._window_spec()
+
+    def _series_windows(self):
+        return self.ds._series_windows()
+
 
 class DualCovariatesSequentialDataset(DualCovariatesTrainingDataset):
     def __init__(
@@ -236,6 +248,14 @@ class DualCovariatesSequentialDataset(DualCovariatesTrainingDataset):
         _, future_covariate, _ = self.ds_future[idx]
         return past_target, past_covariate, future_covariate, future_target
 
+    def _series_windows(self):
+        return self.ds_past._series_windows()
+
+    def _window_spec(self):
+        past_target, past_covariate, future_target = self.ds_past._window_spec()
+        _, future_covariate, _ = self.ds_future._window_spec()
+        return past_target, past_covariate, future_covariate, future_target
+
 
 class MixedCovariatesSequentialDataset(MixedCovariatesTrainingDataset):
     def __init__(
@@ -332,6 +352,25 @@ class MixedCovariatesSequentialDataset(MixedCovariatesTrainingDataset):
             future_target,
         )
 
+    def _series_windows(self):
+        return self.ds_past._series_windows()
+
+    def _window_spec(self):
+        past_target, past_covariate, future_target = self.ds_past._window_spec()
+        (
+            _,
+            historic_future_covariate,
+            future_covariate,
+            _,
+        ) = self.ds_dual._window_spec()
+        return (
+            past_target,
+            past_covariate,
+            historic_future_covariate,
+            future_covariate,
+            future_target,
+        )
+
 
 class SplitCovariatesSequentialDataset(SplitCovariatesTrainingDataset):
     def __init__(
@@ -418,3 +457,11 @@ class SplitCovariatesSequentialDataset(SplitCovariatesTrainingDataset):
         past_target, past_covariate, future_target = self.ds_past[idx]
         _, future_covariate, _ = self.ds_future[idx]
         return past_target, past_covariate, future_covariate, future_target
+
+    def _series_windows(self):
+        return self.ds_past._series_windows()
+
+    def _window_spec(self):
+        past_target, past_covariate, future_target = self.ds_past._window_spec()
+        _, future_covariate, _ = self.ds_future._window_spec()
+        return past_target, past_covariate, future_covariate, future_target
@@ -7,9 +7,10 @@ from typing import Union, Sequence, Optional, Tuple
 import numpy as np
 
 from darts import TimeSeries
-from .utils import CovariateType
+from .utils import CovariateType, _series_lengths, _series_values
 from .training_dataset import (
     TrainingDataset,
+    WindowSpecType,
     PastCovariatesTrainingDataset,
     FutureCovariatesTrainingDataset,
     DualCovariatesTrainingDataset,
@@ -84,6 +85,12 @@ class PastCovariatesShiftedDataset(PastCovariatesTrainingDataset):
     def __getitem__(self, idx) -> Tuple[np.ndarray, Optional[np.ndarray], np.ndarray]:
         return self.ds[idx]
 
+    def _window_spec(self):
+        return self.ds._window_spec()
+
+    def _series_windows(self):
+        return self.ds._series_windows()
+
 
 class FutureCovariatesShiftedDataset(FutureCovariatesTrainingDataset):
     def __init__(
@@ -153,6 +160,12 @@ class FutureCovariatesShiftedDataset(FutureCovariatesTrainingDataset):
     def __getitem__(self, idx) -> Tuple[np.ndarray, Optional[np.ndarray], np.ndarray]:
         return self.ds[idx]
 
+    def _window_spec(self):
+        return self.ds._window_spec()
+
+    def _series_windows(self):
+        return self.ds._series_windows()
+
 
 class DualCovariatesShiftedDataset(DualCovariatesTrainingDataset):
     def __init__(
@@ -241,6 +254,14 @@ class DualCovariatesShiftedDataset(DualCovariatesTrainingDataset):
         _, future_covariate, _ = self.ds_future[idx]
         return past_target, past_covariate, future_covariate, future_target
 
+    def _series_windows(self):
+        return self.ds_past._series_windows()
+
+    def _window_spec(self):
+        past_target, past_covariate, future_target = self.ds_past._window_spec()
+        _, future_covariate, _ = self.ds_future._window_spec()
+        return past_target, past_covariate, future_covariate, future_target
+
 
 class MixedCovariatesShiftedDataset(MixedCovariatesTrainingDataset):
     def __init__(
@@ -341,6 +362,25 @@ class MixedCovariatesShiftedDataset(MixedCovariatesTrainingDataset):
             future_target,
         )
 
+    def _series_windows(self):
+        return self.ds_past._series_windows()
+
+    def _window_spec(self):
+        past_target, past_covariate, future_target = self.ds_past._window_spec()
+        (
+            _,
+            historic_future_covariate,
+            future_covariate,
+            _,
+        ) = self.ds_dual._window_spec()
+        return (
+            past_target,
+            past_covariate,
+            historic_future_covariate,
+            future_covariate,
+            future_target,
+        )
+
 
 class SplitCovariatesShiftedDataset(SplitCovariatesTrainingDataset):
     def __init__(
@@ -431,6 +471,14 @@ class SplitCovariatesShiftedDataset(SplitCovariatesTrainingDataset):
         _, future_covariate, _ = self.ds_future[idx]
         return past_target, past_covariate, future_covariate, future_target
 
+    def _series_windows(self):
+        return self.ds_past._series_windows()
+
+    def _window_spec(self):
+        past_target, past_covariate, future_target = self.ds_past._window_spec()
+        _, future_covariate, _ = self.ds_future._window_spec()
+        return past_target, past_covariate, future_covariate, future_target
+
 
 class GenericShiftedDataset(TrainingDataset):
     def __init__(
@@ -506,9 +554,11 @@ class GenericShiftedDataset(TrainingDataset):
         )
 
         if self.max_samples_per_ts is None:
-            # read all time series to get the maximum size
+            # read the lengths of all time series to get the maximum size
             self.max_samples_per_ts = (
-                max(len(ts) for ts in self.target_series) - self.size_of_both_chunks + 1
+                int(_series_lengths(self.target_series).max())
+                - self.size_of_both_chunks
+                + 1
             )
 
         self.ideal_nr_samples = len(self.target_series) * self.max_samples_per_ts
@@ -519,8 +569,7 @@ class GenericShiftedDataset(TrainingDataset):
     def __getitem__(self, idx) -> Tuple[np.ndarray, Optional[np.ndarray], np.ndarray]:
         # determine the index of the time series.
         ts_idx = idx // self.max_samples_per_ts
-        ts_target = self.target_series[ts_idx]
-        target_vals = ts_target.values(copy=False)
+        target_vals = _series_values(self.target_series, ts_idx)
 
         # determine the actual number of possible samples in this time series
         n_samples_in_ts = len(target_vals) - self.size_of_both_chunks + 1
@@ -535,12 +584,16 @@ class GenericShiftedDataset(TrainingDataset):
         # determine the index at the end of the output chunk
         # it is originally in [0, self.max_samples_per_ts), so we use a modulo to have it in [0, n_samples_in_ts)
         end_of_output_idx = (
-            len(ts_target)
+            len(target_vals)
             - (idx - (ts_idx * self.max_samples_per_ts)) % n_samples_in_ts
         )
 
-        # optionally, load covariates
-        ts_covariate = self.covariates[ts_idx] if self.covariates is not None else None
+        # the series themselves are only needed to index the first sample of each series
+        ts_target, ts_covariate = None, None
+        if ts_idx not in self._index_memory:
+            ts_target = self.target_series[ts_idx]
+            if self.covariates is not None:
+                ts_covariate = self.covariates[ts_idx]
 
         main_cov_type = CovariateType.NONE
         if self.covariates is not None:
@@ -574,13 +627,14 @@ class GenericShiftedDataset(TrainingDataset):
         # optionally, extract sample covariates
         covariate = None
         if self.covariates is not None:
+            cov_vals = _series_values(self.covariates, ts_idx)
             raise_if_not(
-                cov_end <= len(ts_covariate),
+                cov_end <= len(cov_vals),
                 f"The dataset contains {main_cov_type.value} covariates "
                 f"that don't extend far enough into the future. ({idx}-th sample)",
             )
 
-            covariate = ts_covariate.values(copy=False)[cov_start:cov_end]
+            covariate = cov_vals[cov_start:cov_end]
 
             raise_if_not(
                 len(covariate)
@@ -595,3 +649,57 @@ class GenericShiftedDataset(TrainingDataset):
             )
 
         return past_target, covariate, future_target
+
+    def _window_spec(
+        self,
+    ) -> Tuple[WindowSpecType, Optional[WindowSpecType], WindowSpecType]:
+        lengths = _series_lengths(self.target_series)
+        n_samples_in_ts = lengths - self.size_of_both_chunks + 1
+        raise_if_not(
+            (n_samples_in_ts >= 1).all(),
+            "The dataset contains some time series that are too short to contain "
+            "`max(self.input_chunk_length, self.shift + self.output_chunk_length)` "
+            "({}-th series)".format(np.argmax(n_samples_in_ts < 1)),
+        )
+
+        # same positions as in `__getitem__()`, for all the samples at once
+        ts_idx = np.repeat(np.arange(len(lengths)), self.max_samples_per_ts)
+        sample_idx = np.tile(np.arange(self.max_samples_per_ts), len(lengths))
+        end_of_output_idx = lengths[ts_idx] - sample_idx % n_samples_in_ts[ts_idx]
+        future_start = end_of_output_idx - self.output_chunk_length
+        past_start = future_start - self.shift
+
+        covariate = None
+        if self.covariates is not None:
+            main_cov_type = (
+                CovariateType.FUTURE if self.shift_covariates else CovariateType.PAST
+            )
+            cov_length = (
+                self.output_chunk_length
+                if self.shift_covariates
+                else self.input_chunk_length
+            )
+            target_start = future_start if self.shift_covariates else past_start
+            cov_start = self._covariate_window_starts(
+                self.target_series,
+                self.covariates,
+                ts_idx,
+                target_start,
+                cov_length,
+                main_cov_type,
+            )
+            covariate = (self.covariates, ts_idx, cov_start, cov_length)
+
+        return (
+            (self.target_series, ts_idx, past_start, self.input_chunk_length),
+            covariate,
+            (self.target_series, ts_idx, future_start, self.output_chunk_length),
+        )
+
+    def _series_windows(self) -> Tuple[np.ndarray, np.ndarray]:
+        n_samples_in_ts = (
+            _series_lengths(self.target_series) - self.size_of_both_chunks + 1
+        )
+        first_indices = np.arange(len(self.target_series)) * self.max_samples_per_ts
+        # the samples beyond the number of windows of a series repeat its windows
+        return first_indices, np.clip(n_samples_in_ts, 0, self.max_samples_per_ts)
@@ -6,14 +6,17 @@ Training Datasets Base Classes
 from abc import ABC, abstractmethod
 from torch.utils.data import Dataset
 import numpy as np
+import torch
 
-from typing import Tuple, Optional, Dict
-from .utils import CovariateType
+from typing import Tuple, Optional, Dict, List, Sequence, Union
+from .utils import CovariateType, _series_lengths, _series_values
 from darts.logging import get_logger, raise_if_not
 from darts import TimeSeries
 
 logger = get_logger(__name__)
 SampleIndexType = Tuple[int, int, int, int, int, int]
+# (series, series index of each sample, start of each sample window, window length)
+WindowSpecType = Tuple[Sequence[TimeSeries], np.ndarray, np.ndarray, int]
 
 
 class TrainingDataset(ABC, Dataset):
@@ -55,9 +58,19 @@ class TrainingDataset(ABC, Dataset):
         It contains `np.ndarray` (and not `TimeSeries`), because training requires the values only,
         and so we can get big performance gains when slicing by returning only numpy views of the data
         underlying the `TimeSeries`.
+
+        The series can be given as any sequence of `TimeSeries`; in particular, training on sequences loaded lazily
+        from a memory-mapped file with :func:`darts.utils.bulk_io.load_series_binary()` reads the windows of the
+        samples on demand from the file, so that the series don't need to fit in memory, and the ``DataLoader``
+        workers open the file themselves instead of receiving a copy of the series.
+
+        Datasets slicing windows at fixed offsets of their series (such as the shifted, sequential and horizon-based
+        datasets) can also be "tensorized" with :func:`tensorize()`; whole batches are then gathered at once with
+        :func:`get_batch()`, instead of slicing the samples one by one.
         """
 
         self._index_memory: Dict = {}
+        self._tensors: Optional[List] = None
 
     @abstractmethod
     def __len__(self) -> int:
@@ -67,6 +80,159 @@ class TrainingDataset(ABC, Dataset):
     def __getitem__(self, idx: int):
         pass
 
+    @property
+    def is_tensorized(self) -> bool:
+        """Whether :func:`tensorize()` has been called on this dataset."""
+        return self._tensors is not None
+
+    def tensorize(self) -> "TrainingDataset":
+        """
+        Concatenates the values of all the series of the dataset in contiguous tensors, and precomputes the start
+        of the windows of all the samples in these tensors. Batches can then be obtained with :func:`get_batch()`,
+        which gathers all the windows of a batch with a single indexing operation per tuple element, instead of
+        slicing and stacking the samples one by one. `fit_from_dataset()` of the torch models samples whole batches
+        from tensorized datasets.
+
+        This holds a copy of the values of all the series in memory, and the samples of the dataset must all be
+        valid; an error is raised at this point (and not when accessing a sample) if some windows are out of the
+        bounds of their series.
+
+        Returns
+        -------
+        TrainingDataset
+            The dataset itself.
+        """
+        spec = self._window_spec()
+        raise_if_not(
+            spec is not None,
+            f"{self.__class__.__name__} does not support tensorization.",
+            logger,
+        )
+
+        buffers = {}
+        self._tensors = []
+        for elem in spec:
+            if elem is None:
+                self._tensors.append(None)
+                continue
+
+            series, ts_idx, starts, length = elem
+            # the tuple elements sliced from the same sequence of series share its buffer
+            key = id(series)
+            if key not in buffers:
+                lengths = _series_lengths(series)
+                values = np.concatenate(
+                    [_series_values(series, i) for i in range(len(series))]
+                )
+                offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+                buffers[key] = torch.from_numpy(values), lengths, offsets
+            values, lengths, offsets = buffers[key]
+
+            raise_if_not(
+                (starts >= 0).all() and (starts + length <= lengths[ts_idx]).all(),
+                "The dataset contains some samples whose windows are not contained in their series.",
+                logger,
+            )
+            self._tensors.append(
+                (values, torch.from_numpy(offsets[ts_idx] + starts), length)
+            )
+        return self
+
+    def get_batch(self, indices: Union[Sequence[int], torch.Tensor]) -> Tuple:
+        """
+        Returns the batch made of the samples at positions `indices`, as a tuple of tensors of shape
+        `(len(indices), window length, width)` (or `None` for missing covariates). The dataset must have
+        been tensorized with :func:`tensorize()`.
+
+        Parameters
+        ----------
+        indices
+            The positions of the samples in the dataset.
+
+        Returns
+        -------
+        Tuple
+            The batch, with the same tuple elements as the samples of the dataset.
+        """
+        raise_if_not(
+            self.is_tensorized,
+            "The dataset must be tensorized with `tensorize()` before getting batches.",
+            logger,
+        )
+        indices = torch.as_tensor(indices, dtype=torch.long)
+        batch = []
+        for elem in self._tensors:
+            if elem is None:
+                batch.append(None)
+                continue
+            values, starts, length = elem
+            rows = starts[indices].unsqueeze(1) + torch.arange(length)
+            batch.append(values[rows])
+        return tuple(batch)
+
+    def _window_spec(self) -> Optional[Tuple[Optional[WindowSpecType], ...]]:
+        """
+        Returns, for each element of the sample tuples, the series it is sliced from and the series index and start
+        position of its window in all the samples of the dataset (or `None` for missing covariates).
+        Datasets that cannot describe their samples this way return `None`, and do not support tensorization.
+        """
+        return None
+
+    @staticmethod
+    def _covariate_window_starts(
+        target_series: Sequence[TimeSeries],
+        covariates: Sequence[TimeSeries],
+        ts_idx: np.ndarray,
+        target_start: np.ndarray,
+        cov_length: int,
+        cov_type: CovariateType,
+    ) -> np.ndarray:
+        """
+        Returns the start positions in the covariates of the covariate windows matching the target windows starting
+        at `target_start` in the series `ts_idx`. The windows of the covariates are at a constant offset of the
+        target windows in each series, which is obtained from the time index of the first window of each series.
+        """
+        cov_offsets = np.zeros(len(target_series), dtype=int)
+        for i, first in zip(*np.unique(ts_idx, return_index=True)):
+            ts_target, ts_covariate = target_series[i], covariates[i]
+            raise_if_not(
+                ts_target.freq == ts_covariate.freq,
+                f"The dataset contains {cov_type.value} covariates whose time axis doesn't allow to "
+                f"obtain the input (or output) chunk relative to the target series.",
+            )
+            start_time = ts_target.time_index[target_start[first]]
+            raise_if_not(
+                start_time in ts_covariate.time_index,
+                f"Missing covariates; could not find {cov_type.value} covariates at index value "
+                f"{start_time}.",
+            )
+            cov_offsets[i] = (
+                ts_covariate.time_index.get_loc(start_time) - target_start[first]
+            )
+
+        cov_start = target_start + cov_offsets[ts_idx]
+        cov_lengths = _series_lengths(covariates)
+        raise_if_not(
+            (cov_start >= 0).all(),
+            f"Missing covariates; the dataset contains {cov_type.value} covariates "
+            f"that don't extend far enough into the past.",
+        )
+        raise_if_not(
+            (cov_start + cov_length <= cov_lengths[ts_idx]).all(),
+            f"The dataset contains {cov_type.value} covariates "
+            f"that don't extend far enough into the future.",
+        )
+        return cov_start
+
+    def _series_windows(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Returns, for each series, the position in the dataset of its first sample and its number of distinct
+        samples, which are at consecutive positions from the most recent to the oldest window of the series.
+        Datasets that cannot describe their samples this way return `None`, and do not support window samplers
+        (see :class:`darts.utils.data.WindowSampler`).
+        """
+        return None
+
     def _memory_indexer(
         self,
         ts_idx: int,
@@ -261,3 +427,18 @@ class SplitCovariatesTrainingDataset(TrainingDataset, ABC):
         self, idx: int
     ) -> Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray], np.ndarray]:
         pass
+
+
+class _TensorizedBatches(Dataset):
+    def __init__(self, dataset: TrainingDataset):
+        """
+        Exposes the batches of a tensorized `TrainingDataset` to a ``DataLoader`` with a batch sampler; each
+        item is a whole batch, gathered from the list of sample positions yielded by the sampler.
+        """
+        self.dataset = dataset
+
+    def __len__(self) -> int:
+        return len(self.dataset)
+
+    def __getitem__(self, indices: List[int]) -> Tuple:
+        return self.dataset.get_batch(indices)
@@ -1,6 +1,7 @@
+import numpy as np
 import pandas as pd
 from enum import Enum
-from typing import Union
+from typing import Sequence, Union
 
 from darts import TimeSeries
 from darts.logging import raise_if_not
@@ -17,6 +18,26 @@ class CovariateType(Enum):
     NONE = None
 
 
+def _series_lengths(series: Sequence[TimeSeries]) -> np.ndarray:
+    """
+    Returns the lengths of a sequence of series. Lazy sequences exposing a `lengths()` method (such as the sequences
+    loaded with :func:`darts.utils.bulk_io.load_series_binary()`) give them without building the series.
+    """
+    if hasattr(series, "lengths"):
+        return np.asarray(series.lengths())
+    return np.array([len(ts) for ts in series], dtype=int)
+
+
+def _series_values(series: Sequence[TimeSeries], idx: int) -> np.ndarray:
+    """
+    Returns a view of the values of the `idx`-th series of a sequence. Lazy sequences exposing a `values_at()` method
+    give them without building the series.
+    """
+    if hasattr(series, "values_at"):
+        return series.values_at(idx)
+    return series[idx].values(copy=False)
+
+
 def _get_matching_index(ts_target: TimeSeries, ts_covariate: TimeSeries, idx: int):
     """
     Given two overlapping series `ts_target` and `ts_covariate` and an index point `idx` of `ts_target`, returns the